@@ -43,7 +43,7 @@ def log_qbo_error(context, response, extra=None):
 
 
 #pwd
-import math
+from bisect import bisect_right
 
 
 # In[7]:
@@ -75,14 +75,10 @@ BASE_URL = (
 
 ##### Init Results function
 
-def send_to_results(d):
-    global results_box, results_items
-
-    if " x " in d["size"]:
-        size_formatted = f"{d['size'].split(' x ')[0]}\" x {d['size'].split(' x ')[1]}\""
-    else:
-        size_formatted = ""
-
+def format_result_block(d):
+    """
+    Text of one results block (title line, itemized costs, totals).
+    """
     block_text = f"{d['print_type']}\n"
     if d["canvas_cost"] is not None:
         block_text += f"    Regular Print Price:{'.' * (21 - len('    Print:'))} $ {d['canvas_cost']:.2f}\n"
@@ -95,7 +91,8 @@ def send_to_results(d):
     if d["bracer_cost"] > 0:
         block_text += f"    Bracer Wood:{'.' * (35 - len('    Bracer Wood:'))} $ {d['bracer_cost']:.2f}\n"
     if d["upcharge"] > 0:
-        block_text += f"    ≥ 72\" Upcharge:{'.' * (35 - len('    ≥ 72\" Upcharge:'))} $ {d['upcharge']:.2f}\n"
+        upcharge_label = '    ≥ 72" Upcharge:'
+        block_text += f"{upcharge_label}{'.' * (35 - len(upcharge_label))} $ {d['upcharge']:.2f}\n"
     
     block_text += "     " + ("⋯⋯⋯⋯⋯" * 3) + "\n"
     
@@ -108,69 +105,177 @@ def send_to_results(d):
         pro_total = d["pro_canvas_cost"] + d["frame_cost"] + d["stretching_fee"] + d["bracer_cost"] + d["upcharge"]
         block_text += f"    Professional Total:{'.' * (35 - len('    Professional Total:'))} $ {pro_total:.2f}\n"
 
+    return block_text
 
-    divider = "=" * 45
-    block_lines = block_text.strip().splitlines()
 
-    results_box.configure(state="normal")
-    
-    # Start line index
-    start_index = results_box.index("end-1c").split(".")[0]
-    start_line = int(start_index)
-    
-    # Define color BEFORE using it
-    colors = ["#ccff00", "#00ccff", "#ff00cc", "#ffcc00", "#cc00ff", "#00ffcc", "#ff0000"]
-    tag_color = colors[len(results_items) % len(colors)]
-    
-    # Insert main text block
-    results_box.insert("end", block_text + "\n")
-    
-    # Center tag for the button
-    results_box.tag_configure("center", justify="center")
+RESULT_COLORS = ["#ccff00", "#00ccff", "#ff00cc", "#ffcc00", "#cc00ff", "#00ffcc", "#ff0000"]
+RESULT_DIVIDER = "=" * 45
 
-    try:
-        current_scroll = results_box.yview()
-        top_line = int(results_box.index("@0,0").split('.')[0])
-        bottom_line = int(results_box.index(f"@0,{results_box.winfo_height()}").split('.')[0])
-    except Exception:
-        current_scroll = (0.0, 1.0)
-        top_line, bottom_line = 0, 9999
+# Line ranges of each results block, in display order: (title line, first
+# totals line, divider line). ✔️ clicks, patching, colorizing and focus all
+# look blocks up here instead of reading the text back.
+results_block_ranges = []
+results_focus_block = None  # block kept highlighted and in view across refreshes
 
-    
-    # Create centered frame for button
-    send_button = tk.Button(
-        results_box,
-        text="✔️",
-        font=("Avenir Next", 10),
-        command=lambda d=d: send_to_draft({**d, "from_results": True}),
-        bg="#222222", fg="white", activebackground="#333333",
-        bd=0, highlightthickness=0, padx=2, pady=0
-    )
-    results_box.insert(tk.END, "  ")
-    results_box.window_create("end", window=send_button)
-    results_box.insert("end", "\n")
 
+def configure_results_tags():
+    """
+    The results pane's shared tags, configured once: one title/divider tag per
+    cycle color and one clickable ✔️ tag, no matter how many blocks are shown.
+    """
+    for k, color in enumerate(RESULT_COLORS):
+        results_box.tag_configure(f"result_color{k}", font=("Monaco", 15, "bold"), foreground=color)
+    results_box.tag_configure("result_totals", font=("Monaco", 12, "bold"), foreground="#ffffff")
+    results_box.tag_configure("result_focus", background="#333333")
+    results_box.tag_lower("result_focus")
+    results_box.tag_configure("result_send", font=("Avenir Next", 10))
+    results_box.tag_bind("result_send", "<Button-1>", send_result_at)
+    results_box.tag_bind("result_send", "<Enter>", lambda e: results_box.config(cursor="hand2"))
+    results_box.tag_bind("result_send", "<Leave>", lambda e: results_box.config(cursor=""))
+
+
+def result_block_chunks(n, block_text):
+    """
+    The text/tag pairs for block n, for Text.insert(index, *chunks):
+    title, itemized lines, blank line, ✔️, divider, blank line.
+    """
+    color_tag = f"result_color{n % len(RESULT_COLORS)}"
+    title, rest = block_text.split("\n", 1)
+    return [
+        title, color_tag,
+        "\n" + rest + "\n  ", (),
+        "✔️", "result_send",
+        "\n", (),
+        RESULT_DIVIDER, color_tag,
+        "\n\n", (),
+    ]
+
+
+def result_block_range(start, block_text):
+    """(title line, first totals line, divider line) for a block starting at line start."""
+    lines = block_text.split("\n")
+    rule = next((i for i, text in enumerate(lines) if text.lstrip().startswith("⋯")), 0)
+    line_count = len(lines) - 1
+    return start, start + rule + 1, start + line_count + 2
+
+
+def colorize_results(first=0, last=None):
+    """
+    Tags blocks first..last (default: through the end) from their stored line
+    ranges. Only those blocks are touched, so appending or patching a block
+    costs the same however much the pane already holds.
+    """
+    for n, (start, totals, divider) in enumerate(results_block_ranges[first:last], first):
+        # Totals run from below the ⋯ rule to the blank line before ✔️
+        results_box.tag_remove("result_totals", f"{start}.0", f"{divider}.0")
+        results_box.tag_add("result_totals", f"{totals}.0", f"{divider - 2}.0")
+        if n == results_focus_block:
+            results_box.tag_add("result_focus", f"{start}.0", f"{divider + 1}.0")
+
+
+def focus_result_block(n):
+    """Highlights block n and scrolls to it, straight from its stored range."""
+    global results_focus_block
+    results_box.tag_remove("result_focus", "1.0", tk.END)
+    results_focus_block = n if 0 <= n < len(results_block_ranges) else None
+    if results_focus_block is not None:
+        start, _, divider = results_block_ranges[n]
+        results_box.tag_add("result_focus", f"{start}.0", f"{divider + 1}.0")
+        results_box.see(f"{divider}.0")
+        results_box.see(f"{start}.0")
+
+
+def append_results(blocks):
+    """
+    Adds blocks after the ones already shown, as one tagged text run in a
+    single insert, and tags only the new blocks.
+    """
+    first = len(results_items)
+    chunks = []
+    line = results_block_ranges[-1][2] + 2 if results_block_ranges else 1
+    for n, d in enumerate(blocks, first):
+        block_text = format_result_block(d)
+        results_block_ranges.append(result_block_range(line, block_text))
+        chunks.extend(result_block_chunks(n, block_text))
+        line += block_text.count("\n") + 4  # blank, ✔️, divider, blank
 
-    # Check if selected results block is still in view — if not, scroll to it
-    if hasattr(results_box, "focused_result_line"):  # optional marker
-        focus_line = results_box.focused_result_line
-        if not (top_line <= focus_line <= bottom_line):
-            results_box.see(f"{focus_line}.0")
+    results_box.configure(state="normal")
+    if chunks:
+        results_box.insert(tk.END, *chunks)
+    results_items.extend(blocks)
+    colorize_results(first)
+    results_box.configure(state="disabled")
+
+
+def render_results(blocks):
+    """
+    Replaces the results pane with blocks (result dicts in display order).
+    """
+    global results_focus_block
+
+    current_scroll = results_box.yview()
+    results_box.configure(state="normal")
+    results_box.delete("1.0", tk.END)
+    results_items.clear()
+    results_block_ranges.clear()
+    if results_focus_block is not None and results_focus_block >= len(blocks):
+        results_focus_block = None
+    append_results(blocks)
+
+    # Keep the focused block in view if there is one, else keep the scroll position
+    if results_focus_block is not None:
+        results_box.see(f"{results_block_ranges[results_focus_block][0]}.0")
     else:
         results_box.yview_moveto(current_scroll[0])
-    
-    # Insert divider and tag it
-    results_box.insert("end", divider + "\n\n")
-    divider_index = results_box.index("end-3l").split(".")[0]
-    results_box.tag_configure(f"divider{len(results_items)}", font=("Monaco", 15, "bold"), foreground=tag_color)
-    results_box.tag_add(f"divider{len(results_items)}", f"{divider_index}.0", f"{divider_index}.end")
-    
-    # Tag the title line
-    results_box.tag_configure(f"title{len(results_items)}", font=("Monaco", 15, "bold"), foreground=tag_color)
-    results_box.tag_add(f"title{len(results_items)}", f"{start_line}.0", f"{start_line}.end")
 
+
+def send_result_at(event):
+    """✔️ click: sends the block under the pointer to the draft."""
+    line = int(results_box.index(f"@{event.x},{event.y}").split(".")[0])
+    n = bisect_right(results_block_ranges, line, key=lambda r: r[0]) - 1
+    if 0 <= n < len(results_items):
+        focus_result_block(n)
+        send_to_draft({**results_items[n], "from_results": True})
+    return "break"
+
+
+def patch_results(blocks):
+    """
+    Brings the results pane up to date with blocks while touching as little
+    of it as possible: unchanged blocks are left alone, changed ones are
+    rewritten in place and new trailing ones are appended. Dropped or
+    reordered print types, or a block gaining or losing a line, fall back
+    to render_results().
+    Returns the number of blocks that were redrawn.
+    """
+    shown = len(results_items)
+    new_texts = [format_result_block(d) for d in blocks[:shown]]
+    old_texts = [format_result_block(d) for d in results_items]
+    if (
+        [d["print_type"] for d in blocks[:shown]] != [d["print_type"] for d in results_items] or
+        [t.count("\n") for t in new_texts] != [t.count("\n") for t in old_texts]
+    ):
+        render_results(blocks)
+        return len(blocks)
+
+    redrawn = 0
+    results_box.configure(state="normal")
+    for n, (new_text, old_text) in enumerate(zip(new_texts, old_texts)):
+        if new_text != old_text:
+            start = results_block_ranges[n][0]
+            end = start + new_text.count("\n")
+            title, rest = new_text.split("\n", 1)
+            results_box.delete(f"{start}.0", f"{end}.0")
+            results_box.insert(f"{start}.0", title, f"result_color{n % len(RESULT_COLORS)}", "\n" + rest, ())
+            results_block_ranges[n] = result_block_range(start, new_text)
+            colorize_results(n, n + 1)
+            redrawn += 1
     results_box.configure(state="disabled")
-    results_items.append(d)
+
+    # ✔️ clicks read results_items, so this is all they need
+    results_items[:shown] = blocks[:shown]
+    append_results(blocks[shown:])
+    return redrawn + len(blocks) - shown
 
 
 # In[9]:
@@ -181,12 +286,12 @@ def send_to_results(d):
 def remove_custom_item(index):
     if current_title in custom_items_by_title:
         del custom_items_by_title[current_title][index]
-        update_draft_display()
+        request_redraw("draft")
 
 def clear_custom_items():
     if current_title in custom_items_by_title:
         custom_items_by_title[current_title].clear()
-        update_draft_display()
+        request_redraw("draft")
 
 import uuid 
 
@@ -194,7 +299,7 @@ def add_custom_item():
     name = custom_item_name_entry.get().strip()
     desc = custom_item_desc_entry.get().strip()
     qty = custom_item_qty_var.get()
-    unit_price = custom_item_price_var.get()
+    unit_price = Money.from_dollars(custom_item_price_var.get())
 
     if not name or qty <= 0 or unit_price <= 0:
         messagebox.showwarning("Missing Info", "Please enter a name, quantity > 0, and unit price > 0.")
@@ -220,7 +325,7 @@ def add_custom_item():
     custom_item_qty_var.set(0)
     custom_item_price_var.set(0.0)
 
-    update_draft_display()
+    request_redraw("draft")
 
 def add_custom_item_to_draft():
     add_custom_item()
@@ -231,57 +336,19 @@ def add_custom_item_to_draft():
         artist_first = artist_first_entry.get().strip()
         artist_last  = artist_last_entry.get().strip()
 
-        draft_items.append({
-            "linked_title": current_title,
-            "print_type": item["name"],
-            "size": item["description"],
-            "num_prints": item["quantity"],
-            "regular_price": item["unit_price"],
-            "pro_price": item["unit_price"],
-            "color": "#E9967A",
-            "source": "custom",
-            "custom_id": item["id"],       # ✅ add this
-            "artist_first": artist_first,
-            "artist_last": artist_last,
-        })
-
-    update_draft_display()
-
-
-# In[10]:
+        draft_items.append(CustomLine(
+            item["name"],
+            item["quantity"],
+            item["unit_price"],
+            size=item["description"],
+            linked_title=current_title,
+            item_id=item["id"],            # same stable ID as the custom item
+            custom_id=item["id"],
+            artist_first=artist_first,
+            artist_last=artist_last,
+        ))
 
-
-def colorize_results():
-    global color_index, colors
-    color_index = 0  # reset for consistency
-
-    line_count = int(results_box.index("end-1c").split('.')[0])
-    current_color = colors[color_index % len(colors)]
-
-    for i in range(1, line_count + 1):
-        line_text = results_box.get(f"{i}.0", f"{i}.end")
-
-        # Detect print type title line
-        if line_text.startswith("Canvas with") or \
-           line_text.startswith("Photorag") or \
-           line_text.startswith("Enhanced Matte") or \
-           line_text.startswith("Watercolor") or \
-           line_text.startswith("Unstretched Canvas"):
-
-            current_color = colors[color_index % len(colors)]
-            results_box.tag_configure(f"title_{color_index}", font=("Monaco", 15, "bold"), foreground=current_color)
-            results_box.tag_add(f"title_{color_index}", f"{i}.0", f"{i}.end")
-
-        # Detect separator and highlight totals above
-        elif line_text.strip() == "=" * 45:
-            results_box.tag_configure(f"separator_{color_index}", font=("Monaco", 15, "bold"), foreground=current_color)
-            results_box.tag_add(f"separator_{color_index}", f"{i}.0", f"{i}.end")
-
-            # Highlight the two lines above the separator
-            results_box.tag_configure(f"highlight_{color_index}", font=("Monaco", 12, "bold"), foreground="#ffffff")
-            results_box.tag_add(f"highlight_{color_index}", f"{i-2}.0", f"{i}.0")
-
-            color_index += 1  # advance for next block
+    request_redraw("draft")
 
 
 # In[11]:
@@ -310,198 +377,46 @@ def send_to_draft(d):
         size_formatted = ""
 
     
-    item = {
-        "print_type": d["print_type"],
-        "size": size_formatted,
-        "canvas_cost": d["canvas_cost"] or 0.00,
-        "pro_canvas_cost": d["pro_canvas_cost"] or 0.00,
-        "volume_discount_amt": d.get("volume_discount_amt", 0.00),
-        "pro_discount_amt": d.get("pro_discount_amt", 0.00),
-        "num_prints": d["num_prints"],
-        "regular_price": d["total_cost"] or 0.00,
-        "pro_price": d["pro_total_cost"] or 0.00,
-        "frame_cost": d["frame_cost"] or 0.00,
-        "stretching_fee": d["stretching_fee"] or 0.00,
-        "bracer_cost": d["bracer_cost"] or 0.00,
-        "upcharge": d["upcharge"] or 0.00,
-        "color": d["color"],
-        "artist_first": d.get("artist_first", "").strip(),
-        "artist_last": d.get("artist_last", "").strip(),
-        "title": d.get("title", "").strip(),
-        "linked_title": d.get("linked_title", current_title),
-        "custom_items": d.get("custom_items", []),
-    }
-
-
-    if d["capture_price"]:
-        if d.get("original_height") is None or d.get("original_width") is None:
-            messagebox.showerror("Missing Dimensions", "Original height and width are required for Capture.")
-            return
-        max_dim = max(d["original_height"], d["original_width"])
-        draft_items.append({
-            "print_type": f"📸 {d['capture_size']}" + (f" ({size_formatted})" if size_formatted else ""),
-            "size": "",
-            "num_prints": 1,
-            "regular_price": d["capture_price"],
-            "pro_price": d["capture_price"],
-            "canvas_cost": 0.00,
-            "pro_canvas_cost": 0.00,
-            "frame_cost": 0.00,
-            "stretching_fee": 0.00,
-            "bracer_cost": 0.00,
-            "upcharge": 0.00,
-            "color": "#FFD700",
-            "linked_title": d.get("linked_title", current_title)
-        })
-        ###print(f"🧩 Add-on added: {d['print_type']}, linked_title: {d.get('linked_title')}")
-
-
-    if d["specialty_capture"]:
-        if d.get("original_height") is None or d.get("original_width") is None:
-            messagebox.showerror("Missing Dimensions", "Original height and width are required for Specialty Capture.")
-            return
-        draft_items.append({
-            "print_type": "✨ Specialty Capture",
-            "size": "",
-            "num_prints": 1,
-            "regular_price": 0.00, #pricing info intentinoally removed
-            "pro_price": 0.00, #pricing info intentinoally removed
-            "canvas_cost": 0.00,
-            "pro_canvas_cost": 0.00,
-            "frame_cost": 0.00,
-            "stretching_fee": 0.00,
-            "bracer_cost": 0.00,
-            "upcharge": 0.00,
-            "color": "#FFD700",
-            "linked_title": d.get("linked_title", current_title)
-        })
-        ##print(f"🧩 Add-on added: {d['print_type']}, linked_title: {d.get('linked_title')}")
+    item = PrintLine(
+        d["print_type"],
+        d["num_prints"],
+        d["total_cost"] or ZERO,
+        d["pro_total_cost"] or ZERO,
+        size=size_formatted,
+        color=d["color"],
+        linked_title=d.get("linked_title", current_title),
+        canvas_cost=d["canvas_cost"],
+        pro_canvas_cost=d["pro_canvas_cost"],
+        frame_cost=d["frame_cost"],
+        stretching_fee=d["stretching_fee"],
+        bracer_cost=d["bracer_cost"],
+        upcharge=d["upcharge"],
+        volume_discount_amt=d.get("volume_discount_amt"),
+        pro_discount_amt=d.get("pro_discount_amt"),
+        title=d.get("title", "").strip(),
+        artist_first=d.get("artist_first", "").strip(),
+        artist_last=d.get("artist_last", "").strip(),
+    )
 
 
-    if d["color_match_var"] and d["color_match_var"].get():
-        if d.get("original_height") is None or d.get("original_width") is None:
-            messagebox.showerror("Missing Dimensions", "Original height and width are required for Color Match.")
-            return
-        max_dim = max(d["original_height"], d["original_width"])
-        if max_dim < 48:
-            label, price = "🎨 Basic Color Match", 0.00 #pricing info intentinoally removed
-        elif max_dim < 72:
-            label, price = "🎨 Basic Color Match – 48\"+", 0.00 #pricing info intentinoally removed
-        else:
-            label, price = "🎨 Basic Color Match – 72\"+", 0.00 #pricing info intentinoally removed
-
-        draft_items.append({
-            "print_type": label,
-            "size": "",
-            "num_prints": 1,
-            "regular_price": price,
-            "pro_price": price,
-            "canvas_cost": 0.00,
-            "pro_canvas_cost": 0.00,
-            "frame_cost": 0.00,
-            "stretching_fee": 0.00,
-            "bracer_cost": 0.00,
-            "upcharge": 0.00,
-            "color": "#FF69B4",
-            "linked_title": d.get("linked_title", current_title)
-        })
-        ##print(f"🧩 Add-on added: {d['print_type']}, linked_title: {d.get('linked_title')}")
-
-
-    if d["monitor_match_var"] and d["monitor_match_var"].get():
-        draft_items.append({
-            "print_type": "🖥️ Monitor Match",
-            "size": "",
-            "num_prints": 1,
-            "regular_price": 0.00, #pricing info intentinoally removed
-            "pro_price": 0.00, #pricing info intentinoally removed
-            "canvas_cost": 0.00,
-            "pro_canvas_cost": 0.00,
-            "frame_cost": 0.00,
-            "stretching_fee": 0.00,
-            "bracer_cost": 0.00,
-            "upcharge": 0.00,
-            "color": "#ADD8E6",
-            "linked_title": d.get("linked_title", current_title)
-        })
-        ##print(f"🧩 Add-on added: {d['print_type']}, linked_title: {d.get('linked_title')}")
-
-
-    if d["complex_wrap_var"] and d["complex_wrap_var"].get():
-        draft_items.append({
-            "print_type": "🐩 Complex Image Wrap",
-            "size": "",
-            "num_prints": 1,
-            "regular_price": 0.00, #pricing info intentinoally removed
-            "pro_price": 0.00, #pricing info intentinoally removed
-            "canvas_cost": 0.00,
-            "pro_canvas_cost": 0.00,
-            "frame_cost": 0.00,
-            "stretching_fee": 0.00,
-            "bracer_cost": 0.00,
-            "upcharge": 0.00,
-            "color": "#FFB6C1",  # light pink
-            "linked_title": d.get("linked_title", current_title)
-        })
-        ##print(f"🧩 Add-on added: {d['print_type']}, linked_title: {d.get('linked_title')}")
-
-
-    
-    if d["additional_rounds_var"] and d["additional_rounds_var"].get() > 0:
-        rounds = d["additional_rounds_var"].get()
-        draft_items.append({
-            "print_type": "💻 Additional Color Match Rounds",
-            "size": "",
-            "num_prints": rounds,
-            "regular_price": 0.00, #pricing info intentinoally removed
-            "pro_price": 0.00, #pricing info intentinoally removed
-            "canvas_cost": 0.00,
-            "pro_canvas_cost": 0.00,
-            "frame_cost": 0.00,
-            "stretching_fee": 0.00,
-            "bracer_cost": 0.00,
-            "upcharge": 0.00,
-            "color": "#FF69B4",
-            "linked_title": d.get("linked_title", current_title)
-        })
-        ##print(f"🧩 Add-on added: {d['print_type']}, linked_title: {d.get('linked_title')}")
-
-    if d["flashdrive_var"] and d["flashdrive_var"].get() > 0:
-        count = d["flashdrive_var"].get()
-        draft_items.append({
-            "print_type": "💿 Flashdrive",
-            "size": "",
-            "num_prints": count,
-            "regular_price": 0.00, #pricing info intentinoally removed
-            "pro_price": 0.00, #pricing info intentinoally removed
-            "canvas_cost": 0.00,
-            "pro_canvas_cost": 0.00,
-            "frame_cost": 0.00,
-            "stretching_fee": 0.00,
-            "bracer_cost": 0.00,
-            "upcharge": 0.00,
-            "color": "#D3D3D3",  # light gray
-            "linked_title": d.get("linked_title", current_title)
-        })
-
-    if d["computer_time_var"] and d["computer_time_var"].get() > 0:
-        hours = d["computer_time_var"].get()
-        rounded_hours = math.ceil(hours * 4) / 4.0
-        draft_items.append({
-            "print_type": "🕖 Computer Time",
-            "size": "",
-            "num_prints": rounded_hours,
-            "regular_price": 0.00, #pricing info intentinoally removed
-            "pro_price": 0.00, #pricing info intentinoally removed
-            "canvas_cost": 0.00,
-            "pro_canvas_cost": 0.00,
-            "frame_cost": 0.00,
-            "stretching_fee": 0.00,
-            "bracer_cost": 0.00,
-            "upcharge": 0.00,
-            "color": "#B0C4DE",  # light steel blue
-            "linked_title": d.get("linked_title", current_title)
-        })
+    try:
+        draft_items.extend(addons.addon_items(
+            linked_title=d.get("linked_title", current_title),
+            original_height=d.get("original_height"),
+            original_width=d.get("original_width"),
+            size_formatted=size_formatted,
+            capture=d["capture_price"] is not None,
+            specialty_capture=bool(d["specialty_capture"]),
+            color_match=bool(d["color_match_var"] and d["color_match_var"].get()),
+            monitor_match=bool(d["monitor_match_var"] and d["monitor_match_var"].get()),
+            complex_wrap=bool(d["complex_wrap_var"] and d["complex_wrap_var"].get()),
+            additional_rounds=d["additional_rounds_var"].get() if d["additional_rounds_var"] else 0,
+            flashdrive=d["flashdrive_var"].get() if d["flashdrive_var"] else 0,
+            computer_time=d["computer_time_var"].get() if d["computer_time_var"] else 0.0,
+        ))
+    except addons.MissingDimensionsError as e:
+        messagebox.showerror("Missing Dimensions", str(e))
+        return
 
 
 
@@ -519,10 +434,10 @@ def send_to_draft(d):
 
     if d["print_type"] != "Add-On Only Order" and (d["canvas_cost"] or d["pro_canvas_cost"]):
         draft_items.append(item)
-    update_draft_display()
+    request_redraw("draft")
 
     if d.get("from_results") and d.get("calculate_results"):
-        d["calculate_results"]()
+        request_redraw("results")
 
     # 🔁 Restore scroll position (if it existed)
     if previous_scroll:
@@ -534,219 +449,307 @@ def send_to_draft(d):
 # In[12]:
 
 
-def update_draft_display():
+# The draft pane is a run of blocks (the artist line, then one per title),
+# each starting at a left-gravity mark. A block is only redrawn when its
+# fingerprint (everything it displays) changes.
+DRAFT_ARTIST = ("artist",)
+DRAFT_INSERT = "draft_insert"  # where a block being drawn is inserted
+DRAFT_ITEM_FIELDS = (
+    "kind", "print_type", "size", "num_prints", "color", "regular_price", "canvas_cost",
+    "pro_canvas_cost", "frame_cost", "stretching_fee", "bracer_cost", "upcharge",
+)
+
+draft_blocks = {}       # block key -> {"mark", "fingerprint", "widgets", "lines"}
+draft_block_order = []  # block keys, top to bottom
+draft_mark_count = 0
+
+# Title blocks by first line, ascending, rebuilt from block line counts after
+# every redraw: clicks, scroll-into-view and the rename flash all bisect here
+draft_title_lines = []
+draft_title_names = []
+draft_title_positions = {}  # title -> position in the two lists above
+draft_last_line = 1         # first line after the last block
+
+
+def draft_item_fingerprint(item):
+    # The item itself is part of it: its ✖️ button is bound to it
+    return (item.item_id,) + tuple(getattr(item, field) for field in DRAFT_ITEM_FIELDS)
+
+
+def destroy_widgets(widgets):
+    """
+    Destroys a pane's embedded widgets before their text is deleted. Tk
+    drops embedded windows with the text, but tkinter's wrappers and their
+    callbacks would stay registered for the rest of the session.
+    """
+    for widget in widgets:
+        widget.destroy()
+    widgets.clear()
+
+
+def draft_block_end(order, n):
+    """Where block n of order ends: the next block's mark, or the end of the text."""
+    return draft_blocks[order[n + 1]]["mark"] if n + 1 < len(order) else "end-1c"
+
+
+def index_draft_titles(order):
+    """Recomputes every title block's first line from the stored line counts."""
+    global draft_title_lines, draft_title_names, draft_title_positions, draft_last_line
+    line = 1
+    draft_title_lines, draft_title_names = [], []
+    for key in order:
+        if key != DRAFT_ARTIST:
+            draft_title_lines.append(line)
+            draft_title_names.append(key[1])
+        line += draft_blocks[key]["lines"]
+    draft_title_positions = {title: n for n, title in enumerate(draft_title_names)}
+    draft_last_line = line
+
+
+def draft_title_at(line):
+    """The title whose block holds text line `line`, or None (e.g. the artist line)."""
+    n = bisect_right(draft_title_lines, line) - 1
+    return draft_title_names[n] if n >= 0 else None
+
+
+def draft_title_range(title):
+    """(start, end) text indices of title's whole block, or None."""
+    n = draft_title_positions.get(title)
+    if n is None:
+        return None
+    end = draft_title_lines[n + 1] if n + 1 < len(draft_title_lines) else draft_last_line
+    return f"{draft_title_lines[n]}.0", f"{end}.0"
+
+
+def title_start_index(title):
+    """(start, end) of title's divider line, the first line of its block, or None."""
+    n = draft_title_positions.get(title)
+    if n is None:
+        return None
+    start = f"{draft_title_lines[n]}.0"
+    return start, f"{start} lineend"
+
+
+def clear_draft_blocks():
+    global draft_block_order
+    for block in draft_blocks.values():
+        destroy_widgets(block["widgets"])
+    draft_box.delete("1.0", tk.END)
+    for block in draft_blocks.values():
+        draft_box.mark_unset(block["mark"])
+    draft_blocks.clear()
+    draft_block_order = []
+    index_draft_titles([])
+
+
+def remove_draft_item(item_id):
+    """✖️ on a draft line: drops it (and its custom item, if any); only its block is redrawn."""
+    item = draft_items.discard(item_id)
+    if item is None:
+        return
+
+    # If it's a custom draft line, remove from custom_items_by_title too
+    if item.kind == CUSTOM:
+        t = item.linked_title
+        cid = item.custom_id
+
+        if t in custom_items_by_title and cid:
+            custom_items_by_title[t] = [
+                ci for ci in custom_items_by_title[t]
+                if ci.get("id") != cid
+            ]
+
+    request_redraw("draft")
+
+
+def render_draft_title(title, items):
+    """
+    Inserts one title block at DRAFT_INSERT: divider, toggle + editable title,
+    ✖️/✔️ row, then each item unless the title is collapsed.
+    Returns the widgets it embedded.
+    """
+    toggle_text = "▼" if title not in collapsed_titles else "▶"
+    toggle_btn = make_toggle_button(
+        draft_box, toggle_text, title, lambda: toggle_title_visibility(title), tag="toggle"
+    )
+    
+    remove_button = make_toggle_button(
+        draft_box, "✖️", title, lambda: remove_title_block(title), tag="remove"
+    )
+    
+    send_button = make_toggle_button(
+        draft_box, "✔️", title, lambda: send_title_block_to_invoice(title), tag="send"
+    )
+    
+    # Divider first: title_start_index() points at this line
+    draft_box.insert(DRAFT_INSERT, "     " + ("=" * 40) + "\n", "header")
+
+    draft_box.insert(DRAFT_INSERT, "  ")
+    draft_box.window_create(DRAFT_INSERT, window=toggle_btn)
+    draft_box.insert(DRAFT_INSERT, "  ")
+    
+    title_entry_widget = create_editable_title_entry(draft_box, title)
+    draft_box.window_create(DRAFT_INSERT, window=title_entry_widget)
+    widgets = [toggle_btn, remove_button, send_button, title_entry_widget]
+
+    draft_box.insert(DRAFT_INSERT, "\n")
+
+    draft_box.insert(DRAFT_INSERT, "  ")
+    draft_box.window_create(DRAFT_INSERT, window=remove_button)
+    
+    draft_box.insert(DRAFT_INSERT, "  ")
+    draft_box.window_create(DRAFT_INSERT, window=send_button)
+
+    draft_box.insert(DRAFT_INSERT, "\n")
+
+    if not draft_items:
+        draft_box.insert(DRAFT_INSERT, "Draft is empty.\n")
+
+    if title in collapsed_titles:
+        return widgets
+
+    for item in items:
+        # One tag per color, shared by every block
+        tag_name = f"color_{item.color}"
+        draft_box.tag_configure(tag_name, foreground=item.color)
+
+        title_line = f"(Quantity: {item.num_prints}) {item.print_type}"
+        if item.size:
+            title_line += f" - {item.size}"
+        title_line += "\n"
+        draft_box.insert(DRAFT_INSERT, title_line, tag_name)
+
+        if item.kind != PRINT:
+            draft_box.insert(DRAFT_INSERT, f"  Price: ${item.regular_price:.2f}\n")
+        else:        
+            if item.canvas_cost > 0:
+                draft_box.insert(DRAFT_INSERT, f"  Print Price: ${item.canvas_cost:.2f}\n")
+            if item.pro_canvas_cost:
+                draft_box.insert(DRAFT_INSERT, f"  Professional Print Price: ${item.pro_canvas_cost:.2f}\n")
+            if item.frame_cost:
+                draft_box.insert(DRAFT_INSERT, f"  Frame Wood: ${item.frame_cost:.2f}\n")
+            if item.stretching_fee:
+                draft_box.insert(DRAFT_INSERT, f"  Stretch: ${item.stretching_fee:.2f}\n")
+            if item.bracer_cost:
+                draft_box.insert(DRAFT_INSERT, f"  Bracer Wood: ${item.bracer_cost:.2f}\n")
+            if item.upcharge:
+                draft_box.insert(DRAFT_INSERT, f"  ≥ 72\" Upcharge: ${item.upcharge:.2f}\n")
+
+        # 🟩 Button row BEFORE divider; bound to the line's ID, so it never goes stale
+        remove_button = tk.Button(
+            draft_box,
+            text="✖️",
+            font=("Avenir Next", 10),
+            command=lambda item_id=item.item_id: remove_draft_item(item_id),
+            bg="#222222", fg="white", activebackground="#333333",
+            bd=0, highlightthickness=0, padx=2, pady=0
+        )
+        widgets.append(remove_button)
+        draft_box.insert(DRAFT_INSERT, "  ")  
+        draft_box.window_create(DRAFT_INSERT, window=remove_button)
+    
+        draft_box.insert(DRAFT_INSERT, "\n")
+
+        # Divider comes *after* the button row
+        draft_box.insert(DRAFT_INSERT, "=" * 40 + "\n", tag_name)
+
+    return widgets
+
+
+def update_draft_display(full=False):
     """
     Refreshes the draft invoice display with an itemized breakdown.
+    Only title blocks whose items, collapse state or title changed are
+    redrawn; the rest stay in place. full=True redraws everything.
     """
 
-    global title_start_indices
     global draft_box, draft_frame
     global current_artist, current_title
     global editable_title_ranges
     editable_title_ranges = {}
-    global title_click_regions
-    title_click_regions = {}
     global custom_items_by_title
-
-
+    global draft_block_order, draft_mark_count
 
     draft_box.tag_remove("current_focus", "1.0", "end")
-    title_start_indices = {}
     draft_box.config(state="normal")
     # Save scroll position and anchor
     try:
         current_scroll = draft_box.yview()
     except Exception:
         current_scroll = (0.0, 1.0)
-    draft_box.delete("1.0", tk.END)  # Clear previous entries
 
     # Define visual styles
     draft_box.tag_configure("artist", font=("Monaco", 18, "bold"), foreground="#00ffcc", justify="center")
     draft_box.tag_configure("title", font=("Monaco", 15, "italic"), foreground="#00ffcc", justify="left")
     draft_box.tag_configure("header", font=("Monaco", 15, "bold"), foreground="#00ffcc", justify="left")
-    
-    if current_artist:
-        draft_box.insert(tk.END, f"{current_artist}\n", "artist")
-
-    for widget in draft_frame.winfo_children():
-        if isinstance(widget, tk.Button) and "✖️" in widget.cget("text"):
-            widget.destroy()
-
-    #print(f"🖼️ Updating draft display with draft_titles: {draft_titles}")
-    unique_index = 0
 
-
-    prev_title = None
-    prev_block_start = None
-    
+    # 🧾 What each block should show, in display order
+    wanted = {}
+    if current_artist:
+        wanted[DRAFT_ARTIST] = current_artist
     for title in draft_titles:
-        block_start = draft_box.index(tk.END)
-
-        # If we just finished a previous block, store its region now
-        if prev_title is not None:
-            block_end = block_start
-            title_click_regions[prev_title] = {
-                "click": (prev_block_start, block_end)
-            }
-        
-        # Update previous title tracker
-        prev_title = title
-        prev_block_start = block_start
-
-        #print(f"🧾 Drawing section for title: {title}")
-        toggle_text = "▼" if title not in collapsed_titles else "▶"
-        toggle_btn = make_toggle_button(
-            draft_box,
-            toggle_text,
-            title,
-            lambda t=title: toggle_title_visibility(t),
-            tag="toggle"
-        )
-        
-        remove_button = make_toggle_button(
-            draft_box,
-            "✖️",
-            title,
-            lambda t=title: remove_title_block(t),
-            tag="remove"
+        wanted[("title", title)] = (
+            title in collapsed_titles,
+            not draft_items,
+            tuple(draft_item_fingerprint(item) for item in draft_items.items_for(title)),
         )
-        
-        send_button = make_toggle_button(
-            draft_box,
-            "✔️",
-            title,
-            lambda t=title: send_title_block_to_invoice(t),
-            tag="send"
-        )
-        
-        # Insert clickable divider and store index for focus range
-        divider_start = draft_box.index(tk.END)
-        draft_box.insert(tk.END, "     " + ("=" * 40) + "\n", "header")
-        divider_line = draft_box.index(f"{divider_start} linestart")
-        title_start_indices[title] = (divider_line, f"{divider_line} lineend")
-        block_end = draft_box.index(tk.END)
-
-
-        draft_box.insert(tk.END, "  ")
-        draft_box.window_create(tk.END, window=toggle_btn)
-        draft_box.insert(tk.END, "  ")
-        
-        title_entry_widget = create_editable_title_entry(draft_box, title)
-        draft_box.window_create(tk.END, window=title_entry_widget)
-
-        draft_box.insert("end", "\n")
-
-        draft_box.insert(tk.END, "  ")
-        draft_box.window_create(tk.END, window=remove_button)
-        
-        draft_box.insert(tk.END, "  ")
-        draft_box.window_create(tk.END, window=send_button)
-
-        draft_box.insert("end", "\n")
-        
-        # Debug: Show that the function is being called
-        ##print(f"DEBUG: Updating draft display. Current items: {len(draft_items)}")
-    
-        if not draft_items:
-            draft_box.insert(tk.END, "Draft is empty.\n")
-    
-        draft_box.update_idletasks()
-        
-                # Set end of block after all content for this title
-        block_end = draft_box.index(tk.END)
-        
-        # Always store click region for the title block
-        if title not in collapsed_titles:
-            
-            for global_index, item in enumerate(draft_items):
-                if item.get("linked_title") != title:
-                    continue
-                color = item["color"]
-                tag_name = f"color_{unique_index}"
-                draft_box.tag_configure(tag_name, foreground=color)
-    
-                title_line = f"(Quantity: {item['num_prints']}) {item['print_type']}"
-                if item['size']:
-                    title_line += f" - {item['size']}"
-                title_line += "\n"
-                draft_box.insert(tk.END, title_line, tag_name)
-
-                if item.get("source") == "custom":
-                    draft_box.insert(tk.END, f"  Price: ${item['regular_price']:.2f}\n")
-                elif any(key in item["print_type"] for key in ["📸", "✨", "🎨", "💻", "🖥️", "🐩", "💿", "🕖"]):
-                    draft_box.insert(tk.END, f"  Price: ${item['regular_price']:.2f}\n")
-                else:        
-                    if item.get("canvas_cost", 0) > 0:
-                        draft_box.insert(tk.END, f"  Print Price: ${item['canvas_cost']:.2f}\n")
-                    if item.get("pro_canvas_cost", 0):
-                        draft_box.insert(tk.END, f"  Professional Print Price: ${item['pro_canvas_cost']:.2f}\n")
-                    if item.get("frame_cost", 0):
-                        draft_box.insert(tk.END, f"  Frame Wood: ${item['frame_cost']:.2f}\n")
-                    if item.get("stretching_fee", 0):
-                        draft_box.insert(tk.END, f"  Stretch: ${item['stretching_fee']:.2f}\n")
-                    if item.get("bracer_cost", 0):
-                        draft_box.insert(tk.END, f"  Bracer Wood: ${item['bracer_cost']:.2f}\n")
-                    if item.get("upcharge", 0):
-                        draft_box.insert(tk.END, f"  ≥ 72\" Upcharge: ${item['upcharge']:.2f}\n")
-                    #if item["regular_price"] > 0:
-                        #draft_box.insert(tk.END, f"  Regular Total: ${item['regular_price']:.2f}\n")
-                    #if item["pro_price"] > 0:
-                        #draft_box.insert(tk.END, f"  Professional Total: ${item['pro_price']:.2f}\n")
-        
-            # 🟩 Create button row BEFORE divider
-                draft_box.config(state="normal")
-                draft_box.update_idletasks()
 
-                def handle_remove(idx=global_index):
-                    item = draft_items[idx]
-                
-                    # If it's a custom draft line, remove from custom_items_by_title too
-                    if item.get("source") == "custom":
-                        t = item.get("linked_title")
-                        cid = item.get("custom_id")
-                
-                        if t in custom_items_by_title and cid:
-                            custom_items_by_title[t] = [
-                                ci for ci in custom_items_by_title[t]
-                                if ci.get("id") != cid
-                            ]
-                
-                    draft_items.pop(idx)
-                    update_draft_display()
-
-                    
-                remove_button = tk.Button(
-                    draft_box,
-                    text="✖️",
-                    font=("Avenir Next", 10),
-                    command=handle_remove,
-                    bg="#222222", fg="white", activebackground="#333333",
-                    bd=0, highlightthickness=0, padx=2, pady=0
-                )
-                draft_box.insert(tk.END, "  ")  
-                draft_box.window_create(tk.END, window=remove_button)
-            
-                draft_box.insert("end", "\n")
-        
-                # Divider comes *after* the button row
-                draft_box.insert(tk.END, "=" * 40 + "\n", tag_name)
-                unique_index += 1
-    
-        # Capture the final title block
-        if prev_title is not None:
-            block_end = draft_box.index(tk.END)
-            title_click_regions[prev_title] = {
-                "click": (prev_block_start, block_end)
-            }
+    # Drop blocks that are gone
+    old_order = draft_block_order
+    for n, key in enumerate(old_order):
+        if key not in wanted:
+            block = draft_blocks.pop(key)
+            destroy_widgets(block["widgets"])
+            draft_box.delete(block["mark"], draft_block_end(old_order, n))
+            draft_box.mark_unset(block["mark"])
+    draft_block_order = [key for key in old_order if key in wanted]
+
+    # Blocks only move when titles are reordered; start over then
+    if full or draft_block_order != [key for key in wanted if key in draft_blocks]:
+        clear_draft_blocks()
+
+    order = list(wanted)
+    for n, key in enumerate(order):
+        block = draft_blocks.get(key)
+        if block is not None and block["fingerprint"] == wanted[key]:
+            continue  # Left in place, widgets and all
+
+        # Redraw in place, or insert before the next block already shown
+        next_mark = next((draft_blocks[k]["mark"] for k in order[n + 1:] if k in draft_blocks), None)
+        if block is not None:
+            mark = block["mark"]
+            start = draft_box.index(mark)
+            destroy_widgets(block["widgets"])
+            draft_box.delete(start, next_mark or "end-1c")
+        else:
+            draft_mark_count += 1
+            mark = f"draft_block{draft_mark_count}"
+            start = draft_box.index(next_mark or "end-1c")
+
+        draft_box.mark_set(DRAFT_INSERT, start)
+        if key == DRAFT_ARTIST:
+            draft_box.insert(DRAFT_INSERT, f"{current_artist}\n", "artist")
+            widgets = []
+        else:
+            widgets = render_draft_title(key[1], draft_items.items_for(key[1]))
+
+        draft_box.mark_set(mark, start)
+        draft_box.mark_gravity(mark, "left")
+        if next_mark:
+            # Left gravity kept the next block's mark in front of what was just inserted
+            draft_box.mark_set(next_mark, DRAFT_INSERT)
+        # Blocks start at a line start and end with a newline
+        lines = int(draft_box.index(DRAFT_INSERT).split(".")[0]) - int(start.split(".")[0])
+        draft_blocks[key] = {"mark": mark, "fingerprint": wanted[key], "widgets": widgets, "lines": lines}
+    draft_block_order = order
+    index_draft_titles(order)
 
-    
-            
     draft_box.config(state="disabled")
     draft_box.update_idletasks()
 
     # Restore scroll unless we've changed to a new title block
-    if current_title in title_start_indices:
-        start, end = title_start_indices[current_title]
+    if current_title in draft_title_positions:
+        start, end = title_start_index(current_title)
         start_line = int(start.split('.')[0])
     
         # Only reset view if current title would scroll out of range
@@ -783,6 +786,8 @@ def create_editable_title_entry(parent, title):
     def update_title(event, original_title=title):
         global draft_titles, draft_items, current_title, title_entry
 
+        if not entry.winfo_exists():  # destroyed by the redraw its rename set off
+            return
         new_title = entry.get().strip()
         #print(f"🔁 Attempting to rename title: '{original_title}' → '{new_title}'")
 
@@ -809,18 +814,16 @@ def create_editable_title_entry(parent, title):
 
         draft_titles = list(dict.fromkeys(draft_titles))
 
-        for item in draft_items:
-            if item.get("linked_title") == original_title:
-                item["linked_title"] = new_title
+        draft_items.rename_title(original_title, new_title)
 
         current_title = new_title
         title_entry.delete(0, tk.END)
         title_entry.insert(0, new_title)
-        update_draft_display()
+        request_redraw("draft")
 
         def animate_success_flash():
-            if new_title in title_start_indices:
-                start, end = title_start_indices[new_title]
+            if new_title in draft_title_positions:
+                start, end = title_start_index(new_title)
                 #print(f"🌿 Success flash for: {new_title} from {start} to {end}")
                 draft_box.tag_add("success_flash", start, end)
                 draft_box.tag_configure("success_flash", background="#32CD32")
@@ -846,22 +849,22 @@ def remove_artist():
     current_artist = ""
     artist_first_entry.delete(0, tk.END)
     artist_last_entry.delete(0, tk.END)
-    update_draft_display()
+    request_redraw("draft")
 
 def edit_title():
     title_entry.focus_set()
 
 def remove_title_block(title):
     global draft_items, draft_titles
-    draft_items = [item for item in draft_items if item.get("linked_title") != title]
+    draft_items.pop_title(title)
     if title in draft_titles:
         draft_titles.remove(title)
-    update_draft_display()
+    request_redraw("draft")
 
 def remove_title_from_invoice(title):
     global invoice_items
-    invoice_items = [item for item in invoice_items if item.get("linked_title") != title]
-    update_invoice_display(apply_tax_var.get())
+    invoice_items.pop_title(title)
+    request_redraw("invoice")
 
 def send_current_title_to_invoice():
     global draft_items, invoice_items, current_title
@@ -870,27 +873,20 @@ def send_current_title_to_invoice():
         return  # No title to match against
 
     # Move all draft items with matching linked_title
-    matched_items = [item for item in draft_items if item.get("linked_title") == current_title]
-    draft_items[:] = [item for item in draft_items if item.get("linked_title") != current_title]
+    invoice_items.extend(draft_items.pop_title(current_title))
     
-    invoice_items.extend(matched_items)
-    
-    update_invoice_display(apply_tax=apply_tax_var.get())
-    update_draft_display()
+    request_redraw("invoice", "draft")
     #print(f"🛫 Sending all items linked to title: {current_title}")
 
 def send_title_block_to_invoice(title):
     global draft_items, invoice_items, draft_titles
     #print(f"📤 Sending all items for title: '{title}' to invoice")
     #print(f"  Before send — draft_items count: {len(draft_items)}")
-    matched = [item for item in draft_items if item.get("linked_title") == title]
-    draft_items = [item for item in draft_items if item.get("linked_title") != title]
-    invoice_items.extend(matched)
+    invoice_items.extend(draft_items.pop_title(title))
     #print(f"  After send — invoice_items count: {len(invoice_items)}")
     if title in draft_titles:
         draft_titles.remove(title)
-    update_invoice_display(apply_tax=apply_tax_var.get())
-    update_draft_display()
+    request_redraw("invoice", "draft")
 
 def toggle_title_visibility(title):
     if title in collapsed_titles:
@@ -898,32 +894,31 @@ def toggle_title_visibility(title):
     else:
         collapsed_titles.add(title)
 
-    update_draft_display()
-    update_invoice_display(apply_tax_var.get())
+    request_redraw("draft", "invoice")
 
 
 def handle_click_in_draft_box(event, calculate_results_fn):
     global current_title
-    clicked_index = draft_box.index(f"@{event.x},{event.y}")
-    #print(f"🖱️ Clicked at {clicked_index}")
+    clicked_line = int(draft_box.index(f"@{event.x},{event.y}").split(".")[0])
+    #print(f"🖱️ Clicked at line {clicked_line}")
 
-    for title, region in title_click_regions.items():
-        start, end = region["click"]
-        if draft_box.compare(clicked_index, ">=", start) and draft_box.compare(clicked_index, "<", end):
-            if current_title != title:
-                current_title = title
-                title_entry.delete(0, tk.END)
-                title_entry.insert(0, title)
-                #print(f"📍 Focus switched to title: {title}")
+    title = draft_title_at(clicked_line)
+    if title is not None and current_title != title:
+        current_title = title
+        title_entry.delete(0, tk.END)
+        title_entry.insert(0, title)
+        #print(f"📍 Focus switched to title: {title}")
 
-                def highlight_after_redraw():
-                    draft_box.tag_remove("current_focus", "1.0", "end")
-                    draft_box.tag_configure("current_focus", background="#333355")
-                    draft_box.tag_add("current_focus", start, end)
+        def highlight_after_redraw():
+            # Looked up again: the redraw may have moved the block
+            region = draft_title_range(title)
+            draft_box.tag_remove("current_focus", "1.0", "end")
+            if region:
+                draft_box.tag_configure("current_focus", background="#333355")
+                draft_box.tag_add("current_focus", *region)
 
-                calculate_results_fn()
-                draft_box.after(100, highlight_after_redraw)
-            break
+        calculate_results_fn()
+        draft_box.after(100, highlight_after_redraw)
 
 
 button_states = {}
@@ -964,42 +959,81 @@ def clear_draft():
     draft_titles.clear()
     #current_artist = ""
     current_title = ""
-    update_draft_display()
+    request_redraw("draft")
 
 
 # In[16]:
 
 
+ARTIST_HEADER_DELAY_MS = 250  # quiet time after the last keystroke
+
+invoice_header_job = None
+invoice_header_shown = None  # artist name on the invoice pane's first line, if any
+invoice_drawn = False  # the invoice pane has had a full redraw (and its tags configured)
+
+
+def sync_current_artist():
+    """current_artist from the artist entries; clearing them keeps the last name."""
+    global current_artist
+    try:
+        full_name = (artist_first_entry.get().strip() + " " + artist_last_entry.get().strip()).strip()
+        if full_name:
+            current_artist = full_name
+    except NameError:
+        # Entries may not be created yet during initial setup
+        pass
+
+
 def on_artist_or_title_change(event=None):
-    if invoice_items:
-        update_invoice_display(apply_tax=apply_tax_var.get())
+    """
+    Artist/title keystrokes. The only thing on the invoice that follows them
+    is the artist header line, so once typing pauses just that line is
+    rewritten; lines and totals are left alone.
+    """
+    global invoice_header_job
+    if invoice_header_job is not None:
+        invoice_box.after_cancel(invoice_header_job)
+    invoice_header_job = invoice_box.after(ARTIST_HEADER_DELAY_MS, update_invoice_header)
+
+
+def update_invoice_header():
+    global invoice_header_job, invoice_header_shown
+    invoice_header_job = None
+    sync_current_artist()
+    wanted = current_artist or None
+    if not invoice_drawn or wanted == invoice_header_shown or redraws.pending("invoice"):
+        return  # Pane not drawn yet, unchanged, or a full redraw will draw it anyway
+
+    invoice_box.config(state="normal")
+    if invoice_header_shown is not None:
+        invoice_box.delete("1.0", "2.0")
+    if wanted:
+        invoice_box.insert("1.0", f"{wanted}\n", "artist")
+    invoice_box.config(state="disabled")
+    invoice_header_shown = wanted
+    if invoice_prices:
+        invoice_prices["artist"] = current_artist
 
 
 # In[17]:
 
 
-def send_to_invoice(index=None):
+def send_to_invoice(item_id=None):
     """
     Moves draft items to the invoice box.
-    - If index is None: move all items.
-    - If index is a number: move only that one item.
+    - If item_id is None: move all items.
+    - Otherwise: move only the line with that item_id.
     """
     global draft_items, invoice_items, current_artist, current_title
-    
-    apply_tax = apply_tax_var.get()
 
-    if index is None:
+    if item_id is None:
         invoice_items.extend(draft_items)
-        update_invoice_display(apply_tax=apply_tax)
         draft_items.clear()
-        update_draft_display()
         #current_artist = ""
         current_title = ""
-    else:
-        if 0 <= index < len(draft_items):
-            invoice_items.append(draft_items.pop(index))
-        update_invoice_display(apply_tax=apply_tax)
-        update_draft_display()
+    elif draft_items.move(item_id, invoice_items) is None:
+        return
+    request_redraw("invoice", "draft")
         
 
 
@@ -1009,15 +1043,10 @@ def send_to_invoice(index=None):
 def update_invoice_display(apply_tax=None):
     global invoice_box, invoice_frame, apply_tax_var, apply_card
     global current_artist, current_title
+    global invoice_header_shown, invoice_drawn
 
     # 🔥 ALWAYS sync current_artist from the GUI textboxes:
-    try:
-        full_name = (artist_first_entry.get().strip() + " " + artist_last_entry.get().strip()).strip()
-        if full_name:
-            current_artist = full_name
-    except NameError:
-        # Entries may not be created yet during initial setup
-        pass
+    sync_current_artist()
 
     if apply_tax is None:
         apply_tax = apply_tax_var.get()
@@ -1027,11 +1056,8 @@ def update_invoice_display(apply_tax=None):
         current_scroll = invoice_box.yview()
     except Exception:
         current_scroll = (0.0, 1.0)
+    destroy_widgets(invoice_widgets)
     invoice_box.delete("1.0", tk.END)
-        
-    tax_rate = 0.07 if apply_tax else 0.00
-    final_subtotal = 0.0
-    final_tax = 0.0
 
     invoice_box.tag_configure("artist", font=("Monaco", 18, "bold"), foreground="#00ffcc", justify="center")
     invoice_box.tag_configure("title", font=("Monaco", 15, "italic"), foreground="#00ffcc", justify="left")
@@ -1039,6 +1065,8 @@ def update_invoice_display(apply_tax=None):
 
     if current_artist:
         invoice_box.insert(tk.END, f"{current_artist}\n", "artist")
+    invoice_header_shown = current_artist or None
+    invoice_drawn = True
 
     if not invoice_items:
         invoice_box.insert(tk.END, "Invoice is empty.\n")
@@ -1048,10 +1076,7 @@ def update_invoice_display(apply_tax=None):
     show_regular = price_var_regular.get()
     show_pro = price_var_pro.get()
 
-    items_by_title = {}
-    for item in invoice_items:
-        title = item.get("linked_title") or "Untitled"
-        items_by_title.setdefault(title, []).append(item)
+    items_by_title = invoice_items.by_title()
 
     unique_index = 0
     for title_index, (title, items) in enumerate(items_by_title.items()):
@@ -1069,53 +1094,50 @@ def update_invoice_display(apply_tax=None):
                                      command=lambda t=title: remove_title_from_invoice(t),
                                      bg="#222222", fg="white", activebackground="#333333",
                                      bd=0, highlightthickness=0, padx=2, pady=0)
+        invoice_widgets.extend((toggle_btn, remove_title_btn))
         invoice_box.insert(tk.END, "  ")
         invoice_box.window_create(tk.END, window=remove_title_btn)
         invoice_box.insert(tk.END, "\n")
     
+        if collapsed:
+            continue  # Totals are kept by invoice_totals; nothing else to draw
+
         for item_index, item in enumerate(items):
-            # Always compute totals
-            unit_price = round(item["regular_price"], 2)
-            quantity = item["num_prints"]
-            subtotal = round(unit_price * quantity, 2)
-            final_subtotal = round(final_subtotal + subtotal, 2)
+            unit_price = item.regular_price
+            quantity = item.num_prints
+            subtotal = line_subtotal(item)
 
-    
-            if collapsed:
-                continue  # Skip rendering item details
-    
-            # Rendering (only if not collapsed)
             index = title_index * 100 + item_index
             tag_name = f"color_{index}"
-            invoice_box.tag_configure(tag_name, foreground=item["color"])
+            invoice_box.tag_configure(tag_name, foreground=item.color)
     
-            is_print = item.get("canvas_cost", 0) > 0 or item.get("pro_canvas_cost", 0) > 0
+            is_print = item.kind == PRINT
 
     
-            line = f"(Quantity: {quantity}) {item['print_type']}"
-            if item["size"]:
-                line += f" - {item['size']}"
+            line = f"(Quantity: {quantity}) {item.print_type}"
+            if item.size:
+                line += f" - {item.size}"
             line += "\n"
             invoice_box.insert(tk.END, line, tag_name)
     
             if is_print:
-                if show_regular and item.get("canvas_cost", 0) > 0:
-                    invoice_box.insert(tk.END, f"  Regular Print Price: ${item['canvas_cost']:.2f}\n")
-                if show_pro and item.get("pro_canvas_cost", 0) > 0:
-                    invoice_box.insert(tk.END, f"  Professional Print Price: ${item['pro_canvas_cost']:.2f}\n")
-                if item.get("frame_cost", 0) > 0:
-                    invoice_box.insert(tk.END, f"  Frame Wood: ${item['frame_cost']:.2f}\n")
-                if item.get("stretching_fee", 0) > 0:
-                    invoice_box.insert(tk.END, f"  Stretch: ${item['stretching_fee']:.2f}\n")
-                if item.get("bracer_cost", 0) > 0:
-                    invoice_box.insert(tk.END, f"  Bracer Wood: ${item['bracer_cost']:.2f}\n")
-                if item.get("upcharge", 0) > 0:
-                    invoice_box.insert(tk.END, f"  ≥ 72\" Upcharge: ${item['upcharge']:.2f}\n")
+                if show_regular and item.canvas_cost > 0:
+                    invoice_box.insert(tk.END, f"  Regular Print Price: ${item.canvas_cost:.2f}\n")
+                if show_pro and item.pro_canvas_cost > 0:
+                    invoice_box.insert(tk.END, f"  Professional Print Price: ${item.pro_canvas_cost:.2f}\n")
+                if item.frame_cost > 0:
+                    invoice_box.insert(tk.END, f"  Frame Wood: ${item.frame_cost:.2f}\n")
+                if item.stretching_fee > 0:
+                    invoice_box.insert(tk.END, f"  Stretch: ${item.stretching_fee:.2f}\n")
+                if item.bracer_cost > 0:
+                    invoice_box.insert(tk.END, f"  Bracer Wood: ${item.bracer_cost:.2f}\n")
+                if item.upcharge > 0:
+                    invoice_box.insert(tk.END, f"  ≥ 72\" Upcharge: ${item.upcharge:.2f}\n")
                 invoice_box.insert(tk.END, "     " + ("⋯⋯⋯⋯⋯" * 3) + "\n")
-                if show_regular and item.get("regular_price", 0) > 0:
-                    invoice_box.insert(tk.END, f"  Regular Total: ${item['regular_price']:.2f}\n")
-                if show_pro and item.get("pro_price", 0) > 0:
-                    invoice_box.insert(tk.END, f"  Professional Total: ${item['pro_price']:.2f}\n")
+                if show_regular and item.regular_price > 0:
+                    invoice_box.insert(tk.END, f"  Regular Total: ${item.regular_price:.2f}\n")
+                if show_pro and item.pro_price > 0:
+                    invoice_box.insert(tk.END, f"  Professional Total: ${item.pro_price:.2f}\n")
             elif quantity == 1:
                 invoice_box.insert(tk.END, f"  Price: ${unit_price:.2f}\n")
             else:
@@ -1126,54 +1148,26 @@ def update_invoice_display(apply_tax=None):
             unique_index += 1
 
 
-    # --- Step 2: Built-in volume / pro discounts + custom discounts ---
-
-    # Savings from built-in discounts (already stored per item)
-    total_volume_discount = sum(item.get("volume_discount_amt", 0.00) for item in invoice_items)
-    total_pro_discount = sum(item.get("pro_discount_amt") or 0.00 for item in invoice_items)
-
-    volume_savings = abs(total_volume_discount)
-    pro_savings = abs(total_pro_discount)
-
-    # Custom discounts
-    dollar_discount = custom_discount_dollar_var.get()
-    percent_discount = custom_discount_var.get()
-
-    # Percent discount is applied on the FULL Subtotal
-    percent_base = final_subtotal
-    percent_discount_amt = percent_base * (percent_discount / 100)
-
-    # Discounted Subtotal subtracts ALL discount lines:
-    # volume, professional, flat, and custom percent.
-    discounted_subtotal = (
-        final_subtotal
-        - volume_savings
-        - pro_savings
-        - dollar_discount
-        - percent_discount_amt
+    # --- Step 2: Totals (running sums + discount → card fee → tax chain) ---
+    invoice_totals.set_adjustments(
+        dollar_discount=custom_discount_dollar_var.get(),
+        percent_discount=custom_discount_var.get(),
+        apply_tax=apply_tax,
+        apply_card=apply_card.get(),
     )
-    if discounted_subtotal < 0:
-        discounted_subtotal = 0.0
-
-    # --- Step 3: Apply card fee + tax (tax includes card fee) ---
-    
-    # Normalize / protect
-    discounted_subtotal = round(discounted_subtotal, 2)
-    
-    # 1) Card fee is computed BEFORE tax
-    card_fee = 0.0
-    if apply_card.get():
-        card_fee = round(discounted_subtotal * 0.03, 2)
-    
-    # 2) Tax base includes card fee (so you tax the fee)
-    taxable_base = round(discounted_subtotal + card_fee, 2)
-    
-    final_tax = 0.0
-    if tax_rate > 0:
-        final_tax = round(taxable_base * tax_rate, 2)
-    
-    # 3) Final total
-    final_total = round(discounted_subtotal + card_fee + final_tax, 2)
+    invoice_summary = invoice_totals.summary()
+
+    final_subtotal = invoice_summary["final_subtotal"]
+    volume_savings = invoice_summary["volume_savings"]
+    pro_savings = invoice_summary["pro_savings"]
+    dollar_discount = invoice_summary["dollar_discount"]
+    percent_discount = invoice_summary["percent_discount"]
+    percent_discount_amt = invoice_summary["percent_discount_amt"]
+    discounted_subtotal = invoice_summary["discounted_subtotal"]
+    card_fee = invoice_summary["final_card_fee"]
+    tax_rate = invoice_summary["tax_rate"]
+    final_tax = invoice_summary["final_tax"]
+    final_total = invoice_summary["final_total"]
 
     # --- DISPLAY SUMMARY (in this order) ---
     
@@ -1207,39 +1201,6 @@ def update_invoice_display(apply_tax=None):
 
     invoice_box.insert(tk.END, f"Total Due: ${final_total:.2f}\n", "header")
     
-    invoice_summary = {
-        "final_subtotal": final_subtotal,
-        "dollar_discount": dollar_discount,
-        "percent_discount": percent_discount,
-        "percent_discount_amt": percent_discount_amt,
-        "discounted_subtotal": discounted_subtotal,
-        "final_tax": final_tax,
-        "final_card_fee": card_fee,
-        "final_total": final_total,
-        "volume_savings": volume_savings,
-        "pro_savings": pro_savings,
-    }
-
-    # This is the order it'll show up in in the PDF and QBO
-
-    invoice_summary["summary_lines"] = [
-        ("Subtotal", final_subtotal),
-        ("Volume Discount", -volume_savings),
-        ("Professional Discount", -pro_savings),
-        ("Flat Discount", -dollar_discount),
-        (f"Custom Discount ({percent_discount:.2f}%)", -percent_discount_amt),
-        ("Discounted Subtotal", discounted_subtotal),
-        ("Card Fee (3%)", card_fee),
-        (f"Sales Tax ({int(tax_rate * 100)}%)", final_tax),
-        ("Total Due", final_total),
-    ]
-
-    # Group items by title before generating invoice_data
-    items_by_title = {}
-    for item in invoice_items:
-        title = item.get("linked_title") or "Untitled"
-        items_by_title.setdefault(title, []).append(item)
-    
     global invoice_prices
     invoice_prices = {
         "artist": current_artist,
@@ -1250,7 +1211,6 @@ def update_invoice_display(apply_tax=None):
     
     invoice_box.yview_moveto(current_scroll[0])
     invoice_box.config(state="disabled")
-    invoice_box.update_idletasks()
 
     return invoice_prices
 
@@ -1265,8 +1225,8 @@ from docx.shared import Pt, RGBColor
 import os
 from datetime import datetime
 
-def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", apply_tax=True, apply_card_fee=True):
-    template_path =  # Change this on new system ⚠️⚠️⚠️
+def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", apply_tax=True, apply_card_fee=True, to_pdf=True):
+    template_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SMS Invoice Draft.docx")  # Change this on new system ⚠️⚠️⚠️
     doc = Document(template_path)
 
     from docx.shared import RGBColor, Pt
@@ -1278,19 +1238,7 @@ def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", ap
     #print(invoice_prices["summary"]["final_total"])
 
     # --- Helpers ---
-    from docx.enum.text import WD_TAB_ALIGNMENT, WD_TAB_LEADER
-    
-    def add_aligned_line(paragraph, left_text, right_text, tab_pos=Inches(6.25), add_dots=True):
-        paragraph.paragraph_format.tab_stops.clear_all()
-        paragraph.paragraph_format.tab_stops.add_tab_stop(
-            tab_pos,
-            alignment=WD_TAB_ALIGNMENT.RIGHT,
-            leader=WD_TAB_LEADER.DOTS if add_dots else WD_TAB_LEADER.SPACES
-        )
-        r_left = paragraph.add_run(left_text)
-        paragraph.add_run("\t")
-        r_right = paragraph.add_run(right_text)
-        return r_left, r_right
+    from docx_styles import add_aligned_line, add_header
     
     def add_indented_price_line(label, amount):
         p = doc.add_paragraph()
@@ -1305,21 +1253,8 @@ def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", ap
     doc.add_paragraph("")
     doc.add_paragraph("")
     
-    # 🎨 Artist name (left) + Date (right)
-    p_header = doc.add_paragraph()
-    r_artist, r_date = add_aligned_line(
-        p_header,
-        invoice_data.get("artist", "Unknown Artist"),
-        datetime.now().strftime("%Y %B, %d"),
-        add_dots=False
-    )
-
-    
-    # Apply styles
-    for run, size in [(r_artist, 28), (r_date, 18)]:
-        run.font.name = "Avenir Next"
-        run.font.size = Pt(size)
-        run.font.color.rgb = RGBColor(0x1C, 0x52, 0x3F)
+    # 🎨 Artist name (left) + Date (right), in the brand font/color
+    add_header(doc, invoice_data.get("artist", "Unknown Artist"), datetime.now().strftime("%Y %B, %d"))
 
     
     doc.add_paragraph("")
@@ -1340,39 +1275,21 @@ def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", ap
         doc.add_paragraph(title, style="Heading 2")
 
         for item in items:
-            unit_price = round(item["pro_price"] if use_pro else item["regular_price"], 2)
-            quantity = item["num_prints"]
+            unit_price = item.pro_price if use_pro else item.regular_price
+            quantity = item.num_prints
             
-            is_service = (
-                any(tag in item["print_type"] for tag in ["📸", "✨", "🎨", "💻", "🖥️", "🐩", "🕖", "💿"])
-                or item.get("source") == "custom"
-            )
-
-            size_text = f" - {item['size']}" if item["size"] else ""
-            item_line = f"{quantity} x {item['print_type']}{size_text}"
+            size_text = f" - {item.size}" if item.size else ""
+            item_line = f"{quantity} x {item.label}{size_text}"
 
-            print_type_raw = item.get("print_type", "")
-            pt = print_type_raw.lower()
-            
-            # Determine material label once
-            material_label = "Canvas" if "canvas" in pt else "Paper"
+            # Material label and collapse rules (paper stocks + unstretched canvas
+            # => single line only) come from the catalog entry
+            material_label = item.entry.material
             
-            # Collapse rules: paper stocks + unstretched canvas => single line only
-            is_paper_collapse = ("enhanced matte" in pt) or ("photorag" in pt) or ("watercolor" in pt)
-            is_unstretched_collapse = "unstretched canvas" in pt
-            collapse_line = is_paper_collapse or is_unstretched_collapse
-            
-            if is_service:
+            if item.kind != PRINT:
                 p = doc.add_paragraph()
-                add_aligned_line(
-                    p,
-                    item_line.replace("🎨","").replace("📸","").replace("✨","")
-                             .replace("💻","").replace("🖥️","").replace("🐩","")
-                             .replace("🕖","").replace("💿","").strip(),
-                    f"${unit_price * quantity:.2f}"
-                )
+                add_aligned_line(p, item_line, f"${unit_price * quantity:.2f}")
             else:
-                if collapse_line:
+                if item.entry.collapse:
                     # One clean line: "<qty> x <type> - <size> ........................ $price"
                     p = doc.add_paragraph()
                     add_aligned_line(p, item_line, f"${unit_price * quantity:.2f}")
@@ -1381,21 +1298,21 @@ def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", ap
                     # Keep existing breakdown for stretched canvas etc.
                     doc.add_paragraph(item_line)
             
-                    if use_pro and item.get("pro_canvas_cost", 0.0) > 0:
-                        add_indented_price_line(f"Pro {material_label}", item["pro_canvas_cost"])
-                    elif item.get("canvas_cost", 0.0) > 0:
-                        add_indented_price_line(material_label, item["canvas_cost"])
+                    if use_pro and item.pro_canvas_cost > 0:
+                        add_indented_price_line(f"Pro {material_label}", item.pro_canvas_cost)
+                    elif item.canvas_cost > 0:
+                        add_indented_price_line(material_label, item.canvas_cost)
             
-                    if item.get("frame_cost", 0) > 0:
-                        add_indented_price_line("Frame Wood", item["frame_cost"])
-                    if item.get("stretching_fee", 0) > 0:
-                        add_indented_price_line("Stretch", item["stretching_fee"])
-                    if item.get("bracer_cost", 0) > 0:
-                        add_indented_price_line("Bracer Wood", item["bracer_cost"])
-                    if item.get("upcharge", 0) > 0:
-                        add_indented_price_line("≥ 72\" Upcharge", item["upcharge"])
+                    if item.frame_cost > 0:
+                        add_indented_price_line("Frame Wood", item.frame_cost)
+                    if item.stretching_fee > 0:
+                        add_indented_price_line("Stretch", item.stretching_fee)
+                    if item.bracer_cost > 0:
+                        add_indented_price_line("Bracer Wood", item.bracer_cost)
+                    if item.upcharge > 0:
+                        add_indented_price_line("≥ 72\" Upcharge", item.upcharge)
             
-                    add_price_line("Print Total", round((unit_price * quantity), 2))
+                    add_price_line("Print Total", unit_price * quantity)
                     doc.add_paragraph("")
 
 
@@ -1422,12 +1339,12 @@ def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", ap
     
         # Capture subtotals for later comparison
         if "subtotal" in lower_label and "discounted" not in lower_label:
-            subtotal = round(amount, 2)
+            subtotal = amount
         elif "discounted subtotal" in lower_label:
-            discounted_subtotal = round(amount, 2)
+            discounted_subtotal = amount
     
         # Skip 0-value discount/savings lines
-        if is_discount_line and abs(amount) < 0.005:
+        if is_discount_line and amount == 0:
             continue
     
         # Skip discounted subtotal if it matches the original subtotal
@@ -1435,7 +1352,7 @@ def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", ap
             continue
 
         # 🧠 Skip both subtotal and discounted subtotal if subtotal == final total
-        final_total = round(summary.get("final_total", 0.0), 2)
+        final_total = summary.get("final_total", ZERO)
         if ("subtotal" in lower_label) and (subtotal == final_total):
             continue
         if ("total" in lower_label) and (subtotal == final_total):
@@ -1448,13 +1365,15 @@ def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", ap
     # Total (bold and larger)
     p_total = doc.add_paragraph()
     p_total.paragraph_format.alignment = 2  # Right align
-    total_run = p_total.add_run(f"Total Due: ${summary.get('final_total', 0):.2f}")
+    total_run = p_total.add_run(f"Total Due: ${summary.get('final_total', ZERO):.2f}")
     total_run.font.size = Pt(20)
     total_run.bold = True
     total_run.font.color.rgb = RGBColor(0x25, 0x52, 0x90)
 
 
     doc.save(output_path)
+    if not to_pdf:
+        return
     
     # Convert to PDF and open it
     pdf_path = output_path.replace(".docx", ".pdf")
@@ -1470,14 +1389,13 @@ def generate_invoice_docx(invoice_data, output_path="Generated_Invoice.docx", ap
 # In[20]:
 
 
-def remove_invoice_item(index):
+def remove_invoice_item(item_id):
     """
-    Removes an individual item from the invoice list and updates the display.
+    Removes an individual item (by item_id) from the invoice list and updates the display.
     """
     global invoice_items
-    if 0 <= index < len(invoice_items):
-        del invoice_items[index] 
-        update_invoice_display()
+    if invoice_items.discard(item_id) is not None:
+        request_redraw("invoice")
 
 
 # In[21]:
@@ -1491,7 +1409,7 @@ def clear_invoice():
     invoice_items.clear()
     #current_artist = ""
     current_title = ""
-    update_invoice_display()
+    request_redraw("invoice")
 
 
 
@@ -1768,26 +1686,26 @@ def get_or_create_item(item_name, access_token):
         return None
 
 
-import re
-
-def strip_emoji(text):
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # Emoticons
-        "\U0001F300-\U0001F5FF"  # Symbols & Pictographs
-        "\U0001F680-\U0001F6FF"  # Transport & Map
-        "\U0001F1E0-\U0001F1FF"  # Flags
-        "\U00002500-\U00002BEF"  # Box Drawing + More
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "]+", flags=re.UNICODE
-    )
-    return emoji_pattern.sub(r'', text)
 
 
 # In[23]:
 
 
+def qbo_sales_line(item, item_ref, description, tax_code_ref):
+    """One QuickBooks SalesItemLineDetail line for an invoice line (regular price x quantity)."""
+    return {
+        "DetailType": "SalesItemLineDetail",
+        "Amount": line_subtotal(item).dollars,
+        "Description": description,
+        "SalesItemLineDetail": {
+            "ItemRef": item_ref,
+            "Qty": item.num_prints,
+            "UnitPrice": item.regular_price.dollars,
+            "TaxCodeRef": tax_code_ref,
+        },
+    }
+
+
 def send_to_quickbooks():
 
     # --- 1. Refresh token and update global ---
@@ -1807,8 +1725,8 @@ def send_to_quickbooks():
 
     # --- 2. Customer info from last invoice item ---
 
-    first = invoice_items[-1].get("artist_first", "")
-    last = invoice_items[-1].get("artist_last", "")
+    first = invoice_items.last().artist_first
+    last = invoice_items.last().artist_last
     
     if not first and not last:
         messagebox.showerror(
@@ -1830,28 +1748,23 @@ def send_to_quickbooks():
 
     # --- 3. Refresh invoice summary (used by PDF + QB) ---
 
-    update_invoice_display()  # sets global invoice_prices
+    redraws.now("invoice")  # sets global invoice_prices
     
     tax_code_ref = {"value": "TAX"} if apply_tax_var.get() else {"value": "NON"}
 
     summary = invoice_prices.get("summary", {}) or {}
 
-    volume_savings       = summary.get("volume_savings", 0.0) or 0.0
-    pro_savings          = summary.get("pro_savings", 0.0) or 0.0
-    flat_discount        = summary.get("dollar_discount", 0.0) or 0.0
-    percent_discount_amt = summary.get("percent_discount_amt", 0.0) or 0.0
-    discounted_subtotal  = summary.get("discounted_subtotal", 0.0) or 0.0
-    tax_amount           = summary.get("final_tax", 0.0) or 0.0
-    card_fee             = summary.get("final_card_fee", 0.0) or 0.0
-    final_total          = summary.get("final_total", 0.0) or 0.0
+    volume_savings       = summary.get("volume_savings") or ZERO
+    pro_savings          = summary.get("pro_savings") or ZERO
+    flat_discount        = summary.get("dollar_discount") or ZERO
+    percent_discount_amt = summary.get("percent_discount_amt") or ZERO
+    discounted_subtotal  = summary.get("discounted_subtotal") or ZERO
+    tax_amount           = summary.get("final_tax") or ZERO
+    card_fee             = summary.get("final_card_fee") or ZERO
+    final_total          = summary.get("final_total") or ZERO
 
     # --- 4. Generate the PDF as before ---
 
-    items_by_title = {}
-    for item in invoice_items:
-        title = item.get("linked_title") or "Untitled"
-        items_by_title.setdefault(title, []).append(item)
-
     invoice_docx_path = "Generated_Invoice.docx"
     generate_invoice_docx(
         invoice_prices,
@@ -1886,140 +1799,41 @@ def send_to_quickbooks():
     lines = []
 
     for item in invoice_items:
-        unit_price = round(item["regular_price"], 2)
-        qty = item["num_prints"]
-        amount = round(unit_price * qty, 2)
-    
-        print_type = strip_emoji(item["print_type"]).strip()
-        size = item.get("size", "").strip()
-        title = item.get("title", item.get("linked_title", "Untitled")).strip()
+        size = item.size.strip()
+        title = (item.title if item.kind == PRINT else item.linked_title or "Untitled").strip()
     
-        if print_type in bulk_pricing:
+        if item.entry.sized:
             description = f"{size} inches\n   {title}"
         else:
             description = f"{title}"
     
-        item_ref = require_item_ref(print_type)
+        item_ref = require_item_ref(item.qbo_name)
         if not item_ref:
             return
     
-        lines.append({
-            "DetailType": "SalesItemLineDetail",
-            "Amount": amount,
-            "Description": description,
-            "SalesItemLineDetail": {
-                "ItemRef": item_ref,
-                "Qty": qty,
-                "UnitPrice": unit_price,
-                "TaxCodeRef": tax_code_ref,
-            },
-        })
+        lines.append(qbo_sales_line(item, item_ref, description, tax_code_ref))
 
         
-    # --- 6. Separate discount lines ---
-    
-    # 6A. Volume Discount
-    if volume_savings > 0:
-        vol_item_ref = require_item_ref("Volume Discount")
-        if not vol_item_ref:
-            return
-    
-        vol_amount = round(volume_savings, 2)
-        lines.append({
-            "DetailType": "SalesItemLineDetail",
-            "Amount": -vol_amount,
-            "Description": "Volume Discount",
-            "SalesItemLineDetail": {
-                "ItemRef": vol_item_ref,
-                "Qty": 1,
-                "UnitPrice": -vol_amount,
-                "TaxCodeRef": tax_code_ref,
-            },
-        })
-
-    
-    # 6B. Professional Discount
-    if pro_savings > 0:
-        pro_item_ref = require_item_ref("Professional Discount")
-        if not pro_item_ref:
-            return
-            
-        pro_amount = round(pro_savings, 2)
-        lines.append({
-            "DetailType": "SalesItemLineDetail",
-            "Amount": -pro_amount,
-            "Description": "Professional Discount",
-            "SalesItemLineDetail": {
-                "ItemRef": pro_item_ref,
-                "Qty": 1,
-                "UnitPrice": -pro_amount,
-                "TaxCodeRef": tax_code_ref, 
-                
-            }
-        })
-    
-    # 6C. Flat Discount ($)
-    if flat_discount > 0:
-        flat_item_ref = require_item_ref("Flat Discount")
-        if not flat_item_ref:
-            return
-            
-        flat_amount = round(flat_discount, 2)
-        lines.append({
-            "DetailType": "SalesItemLineDetail",
-            "Amount": -flat_amount,
-            "Description": "Flat Discount",
-            "SalesItemLineDetail": {
-                "ItemRef": flat_item_ref,
-                "Qty": 1,
-                "UnitPrice": -flat_amount,
-                "TaxCodeRef": tax_code_ref,
-
-            }
-        })
-    
-    # 6D. Custom Percentage Discount
-    if percent_discount_amt > 0:
-        pct_item_ref = require_item_ref("Custom % Discount")
-        if not pct_item_ref:
-            return
-            
-        pct_amount = round(percent_discount_amt, 2)
-        lines.append({
-            "DetailType": "SalesItemLineDetail",
-            "Amount": -pct_amount,
-            "Description": f"Custom Discount ({summary.get('percent_discount', 0)}%)",
-            "SalesItemLineDetail": {
-                "ItemRef": pct_item_ref,
-                "Qty": 1,
-                "UnitPrice": -pct_amount,
-                "TaxCodeRef": tax_code_ref,
-
-            }
-        })
-
-
-    # --- 7. Card fee line ---
+    # --- 6. Separate discount lines, then 7. the card fee line ---
+
+    adjustments = []
+    for entry, amount, detail in [
+        (item_catalog.VOLUME_DISCOUNT, volume_savings, ""),
+        (item_catalog.PROFESSIONAL_DISCOUNT, pro_savings, ""),
+        (item_catalog.FLAT_DISCOUNT, flat_discount, ""),
+        (item_catalog.PERCENT_DISCOUNT, percent_discount_amt, f" ({summary.get('percent_discount', 0)}%)"),
+    ]:
+        if amount > 0:
+            adjustments.append(DiscountLine(entry, amount, detail=detail))
 
     if card_fee > 0:
-        fee_item_ref = require_item_ref("Card Fee")
-        if not fee_item_ref:
-            return
-            
-        fee_amount = round(card_fee, 2)
-
-        lines.append({
-            "DetailType": "SalesItemLineDetail",
-            "Amount": fee_amount,
-            "Description": "Card Fee (3%)",
-            "SalesItemLineDetail": {
-                "ItemRef": fee_item_ref,
-                "Qty": 1,
-                "UnitPrice": fee_amount,
-                "TaxCodeRef": tax_code_ref,
+        adjustments.append(ServiceLine(item_catalog.CARD_FEE, 1, card_fee))
 
-            },
-        })
+    for item in adjustments:
+        item_ref = require_item_ref(item.qbo_name)
+        if not item_ref:
+            return
+        lines.append(qbo_sales_line(item, item_ref, item.label, tax_code_ref))
 
     # --- 8. Final invoice payload (including tax) ---
 
@@ -2031,7 +1845,7 @@ def send_to_quickbooks():
     if apply_tax_var.get():
         invoice_data["TxnTaxDetail"] = {
             "TxnTaxCodeRef": {"value": "TAX"},
-            "TotalTax": round(tax_amount, 2)
+            "TotalTax": tax_amount.dollars
         }
 
 
@@ -2083,11 +1897,18 @@ from tkinter import ttk, messagebox
 import sys
 import os
 from collections import defaultdict
+from item_store import ItemStore
+from line_item import PRINT, CUSTOM, PrintLine, ServiceLine, CustomLine, DiscountLine
+import item_catalog
+from item_catalog import strip_emoji
+from invoice_totals import InvoiceTotals, line_subtotal
 
 current_artist = ""
 current_title = ""
-draft_items = []
-invoice_items = []
+draft_items = ItemStore()
+invoice_prices = {}  # set by update_invoice_display
+invoice_totals = InvoiceTotals()
+invoice_items = ItemStore(default_title="Untitled", on_add=invoice_totals.add, on_remove=invoice_totals.remove)
 results_items = []
 draft_titles = []
 collapsed_titles = set()
@@ -2097,9 +1918,31 @@ custom_items_by_title = defaultdict(list)
 
 
 # Bulk pricing data
-bulk_pricing = {} # pricing data removed intentionally
+import pricing_config  # built-in pricing tables live in pricing.py, overridden by pricing.json
+import price_grid
+import addons
+import reverse_quote
+from money import Money, ZERO
+from redraw_scheduler import RedrawScheduler
+
+invoice_widgets = []  # buttons embedded in the invoice pane; draft blocks keep their own
+
+# Panes are redrawn at most once per event-loop turn; main_app adds "results"
+redraws = RedrawScheduler(order=("results", "draft", "invoice"))
+redraws.register("draft", update_draft_display)
+redraws.register("invoice", update_invoice_display)
+
 
-def main_app():
+def request_redraw(*panes):
+    """Marks panes ("results", "draft", "invoice") to be redrawn once Tk is idle."""
+    redraws.request(*panes)
+
+
+def main_app(run=True):
+    """
+    Builds the app window and runs the Tk loop. With run=False the window is
+    built and left for the caller to drive (benchmark.py does this).
+    """
     global root, draft_frame, invoice_frame, draft_box, invoice_box
     global height_entry, width_entry, num_prints_entry, original_height_entry, original_width_entry
     global results_inner_frame, results_canvas, results_box, apply_tax_var, apply_card
@@ -2116,6 +1959,181 @@ def main_app():
     """
     Integrated app with user inputs at the top, dynamic results in a scrollable grid layout, and a close button.
     """
+    def result_blocks(height, width, num_prints, original_height, original_width, capture_size, capture_price):
+        """
+        One results-pane dict per print type that has a price, in display order.
+        """
+        # Define a list of colors to cycle through
+        colors = ["#ccff00", "#00ccff", "#ff00cc", "#ffcc00", "#cc00ff", "#00ffcc", "#ff0000"]
+        color_index = 0
+        blocks = []
+
+        for q in price_grid.quote_all(height, width, num_prints):
+            # Skip rendering if all prices are 0 and no prints
+            if q.is_empty:
+                continue  # Skip to the next print_type
+
+            # Cycle through the colors
+            current_color = colors[color_index % len(colors)]
+
+            # 💲 Round to cents once, here; everything downstream adds whole cents
+            c = q.in_cents()
+
+            blocks.append({
+                "canvas_cost": c["canvas_cost"] if price_var_regular.get() else None,
+                "pro_canvas_cost": c["pro_canvas_cost"] if price_var_pro.get() else None,
+                "volume_discount_amt": c["volume_discount_amt"],
+                "pro_discount_amt": c["pro_discount_amt"] if price_var_pro.get() else None,
+                "print_type": q.print_type,
+                "size": f"{height} x {width}",
+                "total_cost": c["total_cost"] if price_var_regular.get() else None,
+                "pro_total_cost": c["pro_total_cost"] if price_var_pro.get() else None,
+                "num_prints": num_prints,
+                "frame_cost": c["frame_cost"],
+                "stretching_fee": c["stretching_fee"],
+                "bracer_cost": c["bracer_cost"],
+                "upcharge": c["upcharge"],
+                "color": current_color,
+                "capture_price": capture_price if capture_var.get() else None,
+                "capture_size": f"{capture_size} Capture" if capture_var.get() else None,
+                "specialty_capture": "✨ Specialty Capture" if specialty_capture_var.get() else None,
+                "flashdrive_var": flashdrive_var,
+                "computer_time_var": computer_time_var,
+                "capture_var": capture_var,
+                "specialty_capture_var": specialty_capture_var,
+                "color_match_var": color_match_var,
+                "complex_wrap_var": complex_wrap_var,
+                "additional_rounds_var": additional_rounds_var,
+                "monitor_match_var": monitor_match_var,
+                "artist_first": artist_first_entry.get(),
+                "artist_last": artist_last_entry.get(),
+                "title": title_entry.get(),
+                "linked_title": current_title,
+                "original_height": original_height,
+                "original_width": original_width,
+                "custom_items": custom_items_by_title.get(current_title, []),
+                "calculate_results": calculate_results
+            })
+
+            color_index += 1
+
+        return blocks
+
+    # ⚡ Live quoting: re-price a beat after the operator stops typing a size/quantity
+    LIVE_QUOTE_DELAY_MS = 150
+    live_quote_job = None
+
+    def live_quote():
+        """
+        Re-quotes from the size and quantity fields and patches only the results
+        blocks whose numbers changed. Unlike calculate_results this never touches
+        the draft or pops up errors; half-typed input is simply ignored.
+        """
+        nonlocal live_quote_job
+        live_quote_job = None
+        global current_title
+        if not live_quote_var.get() or not (price_var_regular.get() or price_var_pro.get()):
+            return
+
+        try:
+            height = float(height_entry.get())
+            width = float(width_entry.get())
+            num_prints = int(num_prints_entry.get())
+            original_height_text = original_height_entry.get().strip()
+            original_width_text = original_width_entry.get().strip()
+            original_height = float(original_height_text) if original_height_text else None
+            original_width = float(original_width_text) if original_width_text else None
+        except ValueError:
+            return  # still typing ("", "24.", "-")
+        if height <= 0 or width <= 0 or num_prints <= 0:
+            return
+
+        capture_size = ""
+        capture_price = ZERO
+        if capture_var.get() and original_height is not None and original_width is not None:
+            capture_size = addons.capture_size_for(original_height, original_width)
+            capture_price = addons.capture_price_for(original_height, original_width)
+
+        current_title = title_entry.get().strip()
+        patch_results(result_blocks(height, width, num_prints, original_height, original_width, capture_size, capture_price))
+
+    def schedule_live_quote(event=None):
+        """
+        Debounces keystrokes: each one pushes the recompute back, so a burst of
+        typing costs a single quote + redraw once it settles.
+        """
+        nonlocal live_quote_job
+        if not live_quote_var.get():
+            return
+        if live_quote_job is not None:
+            app.after_cancel(live_quote_job)
+        live_quote_job = app.after(LIVE_QUOTE_DELAY_MS, live_quote)
+
+    def open_budget_panel():
+        """
+        💵 "What's the biggest print I can get for $X?" — largest size per medium
+        within a budget, at the original artwork's aspect ratio and the current
+        number of prints. "Use" copies a size into the print height/width fields.
+        """
+        panel = tk.Toplevel(app)
+        panel.title("💵 Budget Fit")
+
+        budget_var = tk.DoubleVar(value=0.0)
+        pro_var = tk.BooleanVar(value=price_var_pro.get() and not price_var_regular.get())
+
+        tk.Label(panel, text="Budget ($):", font=("Avenir Next", 12)).grid(row=0, column=0, padx=5, pady=5, sticky="e")
+        budget_entry = tk.Entry(panel, font=("Avenir Next", 12), width=10, textvariable=budget_var)
+        budget_entry.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        tk.Checkbutton(panel, text="Professional Price", font=("Avenir Next", 12), variable=pro_var).grid(row=0, column=2, padx=5, pady=5)
+
+        fits_box = tk.Text(panel, height=12, width=60, font=("Monaco", 12), bg="#222222", fg="white", state="disabled")
+        fits_box.grid(row=1, column=0, columnspan=4, sticky="nsew", padx=5, pady=5)
+        panel.grid_rowconfigure(1, weight=1)
+        panel.grid_columnconfigure(3, weight=1)
+
+        def use_size(fit):
+            height_entry.delete(0, tk.END)
+            height_entry.insert(0, f"{fit.height:g}")
+            width_entry.delete(0, tk.END)
+            width_entry.insert(0, f"{fit.width:g}")
+            num_prints_entry.delete(0, tk.END)
+            num_prints_entry.insert(0, str(fit.num_prints))
+            schedule_live_quote()
+
+        def find_sizes(event=None):
+            try:
+                budget = budget_var.get()
+                aspect_height = float(original_height_entry.get())
+                aspect_width = float(original_width_entry.get())
+                num_prints_text = num_prints_entry.get().strip()
+                num_prints = int(num_prints_text) if num_prints_text else 1
+            except (ValueError, tk.TclError):
+                messagebox.showerror("⚠️ Invalid Input", "Enter a budget, the original height and width, and (optionally) the number of prints.", parent=panel)
+                return
+
+            try:
+                fits = reverse_quote.largest_fits(budget, aspect_height, aspect_width, num_prints, pro=pro_var.get())
+            except ValueError as e:
+                messagebox.showerror("⚠️ Invalid Input", str(e), parent=panel)
+                return
+
+            fits_box.configure(state="normal")
+            fits_box.delete("1.0", tk.END)
+            fits_box.insert(tk.END, f"{num_prints} print(s) at {aspect_height:g} x {aspect_width:g} aspect, $ {budget:.2f} budget\n\n")
+            for print_type, fit in fits.items():
+                if fit is None:
+                    fits_box.insert(tk.END, f"{print_type}\n    Nothing fits\n")
+                    continue
+                fits_box.insert(tk.END, f"{print_type}\n    {fit.height:g}\" x {fit.width:g}\"{'.' * 8} $ {fit.total:.2f}  ")
+                use_button = tk.Button(fits_box, text="Use", font=("Avenir Next", 10), command=lambda fit=fit: use_size(fit))
+                fits_box.window_create(tk.END, window=use_button)
+                fits_box.insert(tk.END, "\n")
+            fits_box.configure(state="disabled")
+
+        tk.Button(panel, text="Find Sizes", font=("Avenir Next", 12, "bold"), command=find_sizes).grid(row=0, column=3, padx=5, pady=5, sticky="w")
+        budget_entry.bind("<Return>", find_sizes)
+        budget_entry.focus()
+
     def calculate_results():
         ###### Not everything needs # of prints or print sizes, so these have to be conditional
         global current_title
@@ -2145,36 +2163,15 @@ def main_app():
             if not price_var_regular.get() and not price_var_pro.get():
                 messagebox.showerror("⚠️ Pricing Error", "You must select at least one price option.")
                 return  # Stop execution
-            results_box.configure(state="normal")
-            results_box.delete("1.0", tk.END)
-            results_box.configure(state="disabled")
-            results_items.clear()
-
-            frame_costs = # pricing data removed intentionally
-
-            gallery_stretching_fees = # pricing data removed intentinoally
-            basic_stretching_fees = # pricing data removed intentionally
-
-            bracer_bar_cost = # pricing data removed intentionally
-            upcharge_72 = # pricing data removed intentionally
-            
-            color_index = 0
 
                         # Determine capture size category and cost
             capture_size = ""
-            capture_price = 0.00
+            capture_price = ZERO
              
-            if capture_var.get():  # ✅ If "Capture" is checked
-                original_max_dim = max(original_height, original_width)
-                if original_max_dim < 48:
-                    capture_size = "Small"
-                    capture_price = # pricing data removed intentionally
-                elif 48 <= original_max_dim < 72:
-                    capture_size = "Medium"
-                    capture_price =# pricing data removed intentionally
-                else:
-                    capture_size = "Large"
-                    capture_price = # pricing data removed intentionally
+            # ✅ If "Capture" is checked (missing dims are reported by send_to_draft)
+            if capture_var.get() and original_height is not None and original_width is not None:
+                capture_size = addons.capture_size_for(original_height, original_width)
+                capture_price = addons.capture_price_for(original_height, original_width)
 
             # ✅ Always check for add-ons, even if print fields are filled
             addons_selected = (
@@ -2193,17 +2190,17 @@ def main_app():
             if addons_selected:
                     # 🧹 Remove stale add-ons
                 draft_data = {
-                    "canvas_cost": 0.00,
-                    "pro_canvas_cost": 0.00,
+                    "canvas_cost": ZERO,
+                    "pro_canvas_cost": ZERO,
                     "print_type": "Add-On Only Order",
                     "size": "",
-                    "total_cost": 0.00,
-                    "pro_total_cost": 0.00,
+                    "total_cost": ZERO,
+                    "pro_total_cost": ZERO,
                     "num_prints": 0,
-                    "frame_cost": 0.00,
-                    "stretching_fee": 0.00,
-                    "bracer_cost": 0.00,
-                    "upcharge": 0.00,
+                    "frame_cost": ZERO,
+                    "stretching_fee": ZERO,
+                    "bracer_cost": ZERO,
+                    "upcharge": ZERO,
                     "color": "#FFFFFF",
                     "capture_price": capture_price if capture_var.get() else None,
                     "capture_size": f"{capture_size} Capture" if capture_var.get() else None,
@@ -2227,154 +2224,18 @@ def main_app():
                 }
 
                 send_to_draft(draft_data)
-                update_draft_display()
                 #print(f"✅ Adding item linked to title: {current_title}")
 
 
                 
+            blocks = []
             if height is not None and width is not None and num_prints is not None: # actual volume discount quantities removed intentionally
-                for print_type, prices in bulk_pricing.items():
-                    if num_prints <= 0:
-                        price_per_sqft = prices[0]
-                        pro_price_per_sqft = prices[1]
-                        pro_discount = (price_per_sqft - pro_price_per_sqft)
-                        volume_discount = 0.00
-                    elif num_prints <= 0:
-                        price_per_sqft = prices[1]
-                        pro_price_per_sqft = prices[2]
-                        pro_discount = (price_per_sqft - pro_price_per_sqft)
-                        volume_discount = (prices[1] - prices[0])
-                    elif num_prints <= 0:
-                        price_per_sqft = prices[2]
-                        pro_price_per_sqft = prices[3]
-                        pro_discount = (price_per_sqft - pro_price_per_sqft)
-                        volume_discount = (prices[2] - prices[1])
-                    elif num_prints <= 0:
-                        price_per_sqft = prices[3]
-                        pro_price_per_sqft = prices[4]
-                        pro_discount = (price_per_sqft - pro_price_per_sqft)
-                        volume_discount = (prices[3] - prices[2])
-                    else:
-                        price_per_sqft = prices[4]
-                        pro_price_per_sqft = (prices[4] * (prices[4] / prices[3]))
-                        pro_discount = (price_per_sqft - pro_price_per_sqft)
-                        volume_discount = (prices[4] - prices[3])
-
-                    #print(f"After print_type, prices in bulk_pricing.items() loop: {pro_discount=}")
-                    #print(f"After print_type, prices in bulk_pricing.items() loop: {volume_discount=}")
-    
-                    gallery_wrap_adjustment = 3 if print_type.startswith("Canvas with T") else 0
-                    adjusted_height = height + gallery_wrap_adjustment
-                    adjusted_width = width + gallery_wrap_adjustment
-                    area_in_sqft = (adjusted_height * adjusted_width) / 144
-                    perimeter_in_feet = (2 * height + 2 * width) / 12
-    
-                    if print_type.startswith("Canvas with"):
-                        frame_cost = perimeter_in_feet * frame_costs.get(print_type, frame_costs["Default"])
-                        bracer_cost = 0
-                        if max(height, width) >= 40:
-                            bracer_cost = (min(height, width) / 12) * bracer_bar_cost
-                        if max(height, width) >= 60:
-                            bracer_cost *= 2
-                    else:
-                        frame_cost = 0
-                        bracer_cost = 0
-                        
-                    if print_type.startswith("Canvas with"):
-                        upcharge = upcharge_72 if max(height, width) >= 72 else 0
-                    else:
-                        upcharge = 0
-    
-                    # Determine the stretching fee dictionary based on the print type
-                    if print_type.startswith("Canvas with T"):
-                        stretching_fees = gallery_stretching_fees
-                    elif print_type == "Canvas with Basic Stretch":
-                        stretching_fees = basic_stretching_fees
-                    else:
-                        stretching_fees = {}
-    
-                    # Calculate the stretching fee
-                    stretching_fee = 0
-                    for category, (min_range, max_range, fee) in stretching_fees.items():
-                        if min_range <= height + width <= max_range:
-                            stretching_fee = fee
-                            break
-            
-                    canvas_cost = area_in_sqft * price_per_sqft
-                    pro_canvas_cost = area_in_sqft * pro_price_per_sqft
-                    volume_discount_amt = num_prints * area_in_sqft * volume_discount
-                    pro_discount_amt = num_prints * area_in_sqft * pro_discount
-                    total_cost = canvas_cost + frame_cost + bracer_cost + upcharge + stretching_fee
-                    pro_total_cost = pro_canvas_cost + frame_cost + bracer_cost + upcharge + stretching_fee
-
-                    #print(f"After volume_discount_amt = num_prints * area_in_sqft * volume_discount assignment: {volume_discount_amt=}")
-                    #print(f"After pro_discount_amt = num_prints * area_in_sqft * pro_discount assignment: {pro_discount_amt=}")
-    
-                    # Define a list of colors to cycle through
-                    colors = ["#ccff00", "#00ccff", "#ff00cc", "#ffcc00", "#cc00ff", "#00ffcc", "#ff0000"]
-                    
-                    # Cycle through the colors
-                    current_color = colors[color_index % len(colors)]
-
-                    # Skip rendering if all prices are 0 and no prints
-                    if (
-                        (canvas_cost == 0 and pro_canvas_cost == 0) and
-                        (frame_cost == 0 and stretching_fee == 0 and bracer_cost == 0 and upcharge == 0) and
-                        (total_cost == 0 and pro_total_cost == 0)
-                    ):
-                        continue  # Skip to the next print_type
-
-                    draft_data = {
-                            "canvas_cost": canvas_cost if price_var_regular.get() else None,
-                            "pro_canvas_cost": pro_canvas_cost if price_var_pro.get() else None,
-                            "volume_discount_amt": volume_discount_amt,
-                            "pro_discount_amt": pro_discount_amt if price_var_pro.get() else None,
-                            "print_type": print_type,
-                            "size": f"{height} x {width}",
-                            "total_cost": total_cost if price_var_regular.get() else None,
-                            "pro_total_cost": pro_total_cost if price_var_pro.get() else None,
-                            "num_prints": num_prints,
-                            "frame_cost": frame_cost,
-                            "stretching_fee": stretching_fee,
-                            "bracer_cost": bracer_cost,
-                            "upcharge": upcharge,
-                            "color": current_color,
-                            "capture_price": capture_price if capture_var.get() else None,
-                            "capture_size": f"{capture_size} Capture" if capture_var.get() else None,
-                            "specialty_capture": "✨ Specialty Capture" if specialty_capture_var.get() else None,
-                            "flashdrive_var": flashdrive_var,
-                            "computer_time_var": computer_time_var,
-                            "capture_var": capture_var,
-                            "specialty_capture_var": specialty_capture_var,
-                            "color_match_var": color_match_var,
-                            "complex_wrap_var": complex_wrap_var,
-                            "additional_rounds_var": additional_rounds_var,
-                            "monitor_match_var": monitor_match_var,
-                            "artist_first": artist_first_entry.get(),
-                            "artist_last": artist_last_entry.get(),
-                            "title": title_entry.get(),
-                            "linked_title": current_title,
-                            "original_height": original_height,
-                            "original_width": original_width,
-                            "custom_items": custom_items_by_title.get(current_title, []),
-                            "calculate_results": calculate_results
-                        }
-
-                    draft_data["artist_first"] = artist_first_entry.get()
-                    draft_data["artist_last"] = artist_last_entry.get()
-                    draft_data["title"] = title_entry.get()
-                    send_to_results(draft_data)
-
-                    #print(f"After send_to_results(draft_data): {volume_discount_amt=}")
-                    #print(f"After send_to_results(draft_data): {pro_discount_amt=}")
-                    
-                    color_index += 1
-
-                    ##print(f"ARTIST = {artist_first_entry.get()} {artist_last_entry.get()}")
-                    ##print(f"TITLE  = {title_entry.get()}")
-                    #print(f"Draft items: {[item['print_type'] for item in draft_items]}")
+                blocks = result_blocks(height, width, num_prints, original_height, original_width, capture_size, capture_price)
+            # 🧾 Whole pane in one insert
+            render_results(blocks)
 
         except ValueError:
+            render_results([])
             messagebox.showerror("⚠️ Invalid Input", "Height, Width, and Number of Prints cannot be blank.")
 
     def exit_program(event=None):
@@ -2423,6 +2284,7 @@ def main_app():
     # Row 1 - Pricing Checkboxes & early addons
     price_var_regular = tk.BooleanVar(value=True)
     price_var_pro = tk.BooleanVar(value=False)
+    live_quote_var = tk.BooleanVar(value=False)
     apply_tax_var = tk.BooleanVar(value=True)  # Value = T/F manages behavior on app-open
     apply_card = tk.BooleanVar(value=True)
     additional_rounds_var = tk.IntVar(value=0)  # Intvar for when it's always an int
@@ -2496,7 +2358,14 @@ def main_app():
     width_entry = tk.Entry(input_frame, font=("Avenir Next", 12))
     width_entry.grid(row=6, column=5, padx=5, pady=5)
     
-    tk.Button(input_frame, text="Calculate", font=("Avenir Next", 12, "bold"), command=calculate_results).grid(row=6, column=6, padx=10, pady=10)
+    calculate_frame = tk.Frame(input_frame)
+    calculate_frame.grid(row=6, column=6, padx=10, pady=10)
+    tk.Button(calculate_frame, text="Calculate", font=("Avenir Next", 12, "bold"), command=calculate_results).pack()
+    tk.Checkbutton(calculate_frame, text="⚡ Live", font=("Avenir Next", 11), variable=live_quote_var, command=schedule_live_quote).pack()
+    tk.Button(calculate_frame, text="💵 Budget Fit", font=("Avenir Next", 11), command=open_budget_panel).pack()
+
+    for entry in (num_prints_entry, height_entry, width_entry):
+        entry.bind("<KeyRelease>", schedule_live_quote)
     
     ttk.Separator(input_frame, orient="horizontal").grid(row=7, column=0, columnspan=7, sticky="ew", pady=(5, 5))
 
@@ -2542,6 +2411,7 @@ def main_app():
     
     results_box = tk.Text(results_frame, height=15, width=50, font=("Monaco", 12), bg="#222222", fg="white", state="disabled")
     results_box.grid(row=0, column=0, sticky="nsew")
+    configure_results_tags()
     
     scrollbar_y = ttk.Scrollbar(results_frame, orient="vertical", command=results_box.yview)
     scrollbar_y.grid(row=0, column=1, sticky="ns")
@@ -2639,9 +2509,47 @@ def main_app():
 
     app.bind_all("<MouseWheel>", scroll_mac(results_box))
 
+    # 🔁 Pick up pricing.json edits without a restart
+    PRICING_POLL_MS = 1000
+
+    def on_pricing_reload(compiled):
+        logging.info("Reloaded prices from %s", compiled.path)
+        schedule_live_quote()
+
+    pricing_watcher = pricing_config.ConfigWatcher(on_reload=on_pricing_reload)
+    shown_pricing_error = None
+
+    def poll_pricing_config():
+        nonlocal shown_pricing_error
+        pricing_watcher.poll()
+
+        # ⚠️ Tell the operator once per new problem that the old prices are still live
+        error = pricing_watcher.last_error
+        message = str(error) if error else None
+        if message and message != shown_pricing_error:
+            messagebox.showwarning(
+                "⚠️ Pricing Config",
+                f"Your pricing.json changes were not loaded:\n\n{message}\n\n"
+                "The previous prices are still in use until the file is fixed."
+            )
+        shown_pricing_error = message
+        app.after(PRICING_POLL_MS, poll_pricing_config)
+
+    try:
+        pricing_config.load()
+    except pricing_config.PricingConfigError as e:
+        messagebox.showerror("⚠️ Pricing Config", f"{e}\n\nUsing the built-in prices until the file is fixed.")
+    app.after(PRICING_POLL_MS, poll_pricing_config)
+
+    # 🖌️ From here on pane redraws are batched into one idle pass
+    redraws.register("results", calculate_results)
+    redraws.attach(app.after_idle)
+
     artist_first_entry.focus()
 
-    root.mainloop()
+    if run:
+        root.mainloop()
 
 # Run the main app
-main_app()
\ No newline at end of file
+if __name__ == "__main__":
+    main_app()
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Add-on (service) line rules shared by send_to_draft and headless tools.
+No Tk in here: callers pass plain values and get ServiceLine draft lines back.
+"""
+
+import math
+
+import item_catalog as catalog
+from line_item import ServiceLine
+from money import Money
+
+
+capture_prices = {"Small": 0.00, "Medium": 0.00, "Large": 0.00} # pricing data removed intentionally
+specialty_capture_price = 0.00 # pricing info intentinoally removed
+color_match_prices = {
+    "🎨 Basic Color Match": 0.00, # pricing info intentinoally removed
+    "🎨 Basic Color Match – 48\"+": 0.00, # pricing info intentinoally removed
+    "🎨 Basic Color Match – 72\"+": 0.00, # pricing info intentinoally removed
+}
+monitor_match_price = 0.00 # pricing info intentinoally removed
+complex_wrap_price = 0.00 # pricing info intentinoally removed
+additional_round_price = 0.00 # pricing info intentinoally removed
+flashdrive_price = 0.00 # pricing info intentinoally removed
+computer_time_price = 0.00 # pricing info intentinoally removed
+
+
+class MissingDimensionsError(ValueError):
+    """An add-on needs the original artwork's height and width."""
+
+    def __init__(self, addon_name):
+        self.addon_name = addon_name
+        super().__init__(f"Original height and width are required for {addon_name}.")
+
+
+def capture_size_for(original_height, original_width):
+    original_max_dim = max(original_height, original_width)
+    if original_max_dim < 48:
+        return "Small"
+    elif 48 <= original_max_dim < 72:
+        return "Medium"
+    return "Large"
+
+
+def capture_price_for(original_height, original_width):
+    return Money.from_dollars(capture_prices[capture_size_for(original_height, original_width)])
+
+
+def color_match_label_for(original_height, original_width):
+    max_dim = max(original_height, original_width)
+    if max_dim < 48:
+        return "🎨 Basic Color Match"
+    elif max_dim < 72:
+        return "🎨 Basic Color Match – 48\"+"
+    return "🎨 Basic Color Match – 72\"+"
+
+
+# color_match_prices is keyed by the label as shown (pricing.json uses the same keys)
+COLOR_MATCH_ENTRIES = {
+    entry.display: entry
+    for entry in (catalog.COLOR_MATCH, catalog.COLOR_MATCH_48, catalog.COLOR_MATCH_72)
+}
+
+
+def service_item(entry, num_prints, price, color, linked_title, detail=""):
+    """One add-on line for a catalog entry; detail is appended to its label."""
+    return ServiceLine(entry, num_prints, Money.from_dollars(price), color=color,
+                       linked_title=linked_title, detail=detail)
+
+
+def addon_items(
+    linked_title=None,
+    original_height=None,
+    original_width=None,
+    size_formatted="",
+    capture=False,
+    specialty_capture=False,
+    color_match=False,
+    monitor_match=False,
+    complex_wrap=False,
+    additional_rounds=0,
+    flashdrive=0,
+    computer_time=0.0,
+):
+    """
+    Builds the draft items for the selected add-ons, in send_to_draft order.
+    Raises MissingDimensionsError before building anything if a capture or
+    color match is requested without the original dimensions.
+    """
+    has_dims = original_height is not None and original_width is not None
+    if capture and not has_dims:
+        raise MissingDimensionsError("Capture")
+    if specialty_capture and not has_dims:
+        raise MissingDimensionsError("Specialty Capture")
+    if color_match and not has_dims:
+        raise MissingDimensionsError("Color Match")
+
+    items = []
+
+    if capture:
+        capture_size = capture_size_for(original_height, original_width)
+        items.append(service_item(
+            catalog.CAPTURE[capture_size], 1, capture_prices[capture_size], "#FFD700", linked_title,
+            detail=f" ({size_formatted})" if size_formatted else "",
+        ))
+
+    if specialty_capture:
+        items.append(service_item(catalog.SPECIALTY_CAPTURE, 1, specialty_capture_price, "#FFD700", linked_title))
+
+    if color_match:
+        label = color_match_label_for(original_height, original_width)
+        items.append(service_item(COLOR_MATCH_ENTRIES[label], 1, color_match_prices[label], "#FF69B4", linked_title))
+
+    if monitor_match:
+        items.append(service_item(catalog.MONITOR_MATCH, 1, monitor_match_price, "#ADD8E6", linked_title))
+
+    if complex_wrap:
+        items.append(service_item(catalog.COMPLEX_WRAP, 1, complex_wrap_price, "#FFB6C1", linked_title))  # light pink
+
+    if additional_rounds > 0:
+        items.append(service_item(catalog.ADDITIONAL_ROUNDS, additional_rounds,
+                                  additional_round_price, "#FF69B4", linked_title))
+
+    if flashdrive > 0:
+        items.append(service_item(catalog.FLASHDRIVE, flashdrive, flashdrive_price, "#D3D3D3", linked_title))  # light gray
+
+    if computer_time > 0:
+        rounded_hours = math.ceil(computer_time * 4) / 4.0
+        items.append(service_item(catalog.COMPUTER_TIME, rounded_hours, computer_time_price,
+                                  "#B0C4DE", linked_title))  # light steel blue
+
+    return items
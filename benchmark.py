@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+"""
+Microbenchmarks for the pricing and invoice hot paths.
+
+    python benchmark.py                    # run everything, compare, record
+    python benchmark.py --quick            # small orders only, fewer repeats
+    python benchmark.py --no-gui           # pricing engine only (no display needed)
+    python benchmark.py --threshold 0.5 --no-record
+
+The GUI paths (calculate_results, send_to_draft, update_draft_display,
+update_invoice_display) are timed in the real app window, built with
+main_app(run=False) and driven directly, including Tk's idle redraw.
+generate_invoice_docx is timed without the PDF step. Orders are synthetic:
+1 to 500 line items spread over 1 to 50 titles, mixing prints, add-ons and
+custom items the way the draft does.
+
+Without a display (Linux CI) the window opens on a virtual X server through
+pyvirtualdisplay, which needs Xvfb; `xvfb-run python benchmark.py` works too.
+
+Each run's median per case goes into bench_history.json. A case regresses
+when it is more than --threshold slower than the median of its last
+HISTORY_WINDOW good runs (and by at least MIN_REGRESSION_MS); any regression
+makes the exit status 1.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import addons
+import item_catalog
+import pricing
+import pricing_config
+from line_item import CustomLine, PrintLine
+from money import Money, ZERO
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BENCH_DIR, "SMS Pricing Calculator vs QB_019.py")
+DEFAULT_HISTORY_PATH = os.path.join(BENCH_DIR, "bench_history.json")
+
+# (line items, titles)
+ORDER_SHAPES = ((1, 1), (10, 1), (10, 10), (100, 10), (100, 50), (500, 10), (500, 50))
+QUICK_ORDER_SHAPES = ((1, 1), (10, 10), (100, 10))
+
+HISTORY_WINDOW = 5
+DEFAULT_THRESHOLD = 0.25   # 25% slower than the recent median
+MIN_REGRESSION_MS = 1.0    # ignore jitter on sub-millisecond cases
+
+PRINT_TYPES = ("Canvas with Traditional Stretch", "Canvas with Basic Stretch", "Photorag", "Enhanced Matte")
+PRINT_SIZES = ((8, 10), (16, 20), (24, 36), (40, 60), (48, 72))
+COLORS = ("#ccff00", "#00ccff", "#ff00cc", "#ffcc00", "#cc00ff", "#00ffcc", "#ff0000")
+
+
+# --- Synthetic orders ---
+
+def synthetic_items(n_items, n_titles):
+    """
+    Deterministic draft/invoice items in the shape send_to_draft and
+    add_custom_item_to_draft build: mostly prints, every 7th an add-on,
+    every 11th a custom item. Prices are made up; only the shape matters.
+    """
+    items = []
+    for i in range(n_items):
+        title = f"Title {i % n_titles + 1}"
+        if i % 7 == 6:
+            item = addons.service_item(item_catalog.FLASHDRIVE, 1 + i % 3, 10 + i % 5, "#D3D3D3", title)
+        elif i % 11 == 10:
+            item = CustomLine(
+                f"Custom item {i}", 1 + i % 4, Money(2500 + i), size="Custom description",
+                linked_title=title, custom_id=f"custom-{i}", artist_first="Bench", artist_last="Mark",
+            )
+        else:
+            height, width = PRINT_SIZES[i % len(PRINT_SIZES)]
+            canvas = Money(1000 + 37 * i)
+            frame = Money(450 + i) if i % 2 == 0 else ZERO
+            item = PrintLine(
+                PRINT_TYPES[i % len(PRINT_TYPES)], 1 + i % 5, canvas + frame, canvas - Money(100) + frame,
+                size=f"{height}\" x {width}\"",
+                color=COLORS[i % len(COLORS)],
+                linked_title=title,
+                canvas_cost=canvas,
+                pro_canvas_cost=canvas - Money(100),
+                frame_cost=frame,
+                stretching_fee=Money(1500) if i % 2 == 0 else ZERO,
+                volume_discount_amt=Money(50) if i % 3 == 0 else ZERO,
+                title=title, artist_first="Bench", artist_last="Mark",
+            )
+        items.append(item)
+    return items
+
+
+def synthetic_titles(n_titles):
+    return [f"Title {t + 1}" for t in range(n_titles)]
+
+
+def result_dict(title):
+    """A results-pane dict (what the ✔️ button passes to send_to_draft), no add-ons."""
+    return {
+        "print_type": PRINT_TYPES[0], "size": "24 x 36", "num_prints": 2,
+        "canvas_cost": Money(12000), "pro_canvas_cost": Money(11000),
+        "total_cost": Money(15500), "pro_total_cost": Money(14500),
+        "volume_discount_amt": ZERO, "pro_discount_amt": ZERO,
+        "frame_cost": Money(2000), "stretching_fee": Money(1500), "bracer_cost": ZERO, "upcharge": ZERO,
+        "color": COLORS[0], "capture_price": None, "capture_size": None, "specialty_capture": None,
+        "capture_var": None, "specialty_capture_var": None, "color_match_var": None,
+        "complex_wrap_var": None, "additional_rounds_var": None, "flashdrive_var": None,
+        "computer_time_var": None, "monitor_match_var": None,
+        "artist_first": "Bench", "artist_last": "Mark", "title": title, "linked_title": title,
+    }
+
+
+# --- Timing ---
+
+def measure(fn, setup=None, repeat=5):
+    """Median wall time of fn() in milliseconds; setup() runs untimed before each call."""
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def engine_cases(repeat):
+    """Pricing engine only; runs anywhere."""
+    sizes = [(h, w) for h, w in PRINT_SIZES] + [(24.5, 30.25), (13, 19)]
+
+    def quote_sizes():
+        for height, width in sizes:
+            pricing.quote_all(height, width, 3)
+
+    yield "pricing.quote_all[cold]", measure(quote_sizes, setup=pricing.clear_quote_cache, repeat=repeat)
+    yield "pricing.quote_all[warm]", measure(quote_sizes, repeat=repeat)
+
+
+# --- GUI ---
+
+def start_virtual_display():
+    """Starts an Xvfb display if there is no real one. Returns it (to stop later) or None."""
+    if sys.platform in ("darwin", "win32") or os.environ.get("DISPLAY"):
+        return None
+    try:
+        from pyvirtualdisplay import Display
+    except ImportError:
+        raise SystemExit("❌ No display. pip install pyvirtualdisplay (needs Xvfb), run under xvfb-run, or use --no-gui.")
+    try:
+        display = Display(visible=False, size=(1920, 1080))
+        display.start()
+    except FileNotFoundError:
+        raise SystemExit("❌ No display and no Xvfb. Install Xvfb, or use --no-gui.")
+    return display
+
+
+def load_app():
+    """Imports the app script as a module (main_app() only runs under __main__)."""
+    # The app refuses to import without a QuickBooks realm; nothing here calls QBO
+    os.environ.setdefault("REALM_ID", "benchmark")
+    spec = importlib.util.spec_from_file_location("sms_app", APP_PATH)
+    app = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(app)
+    app.main_app(run=False)
+    return app
+
+
+def find_button(widget, text):
+    for child in widget.winfo_children():
+        if getattr(child, "widgetName", "") == "button" and child.cget("text") == text:
+            return child
+        found = find_button(child, text)
+        if found is not None:
+            return found
+    return None
+
+
+def set_entry(entry, value):
+    entry.delete(0, "end")
+    entry.insert(0, value)
+
+
+def gui_cases(app, shapes, repeat):
+    root = app.root
+
+    def settle():
+        root.update_idletasks()
+
+    def load_draft(items, titles):
+        app.draft_items.reset(items)
+        app.draft_titles[:] = titles
+        app.collapsed_titles.clear()
+
+    # calculate_results: the Calculate button on a typical size, no artist/title
+    calculate = find_button(root, "Calculate")
+    for entry in (app.artist_first_entry, app.artist_last_entry, app.title_entry,
+                  app.original_height_entry, app.original_width_entry):
+        set_entry(entry, "")
+    set_entry(app.height_entry, "24")
+    set_entry(app.width_entry, "36")
+    set_entry(app.num_prints_entry, "3")
+    if not pricing.bulk_pricing:
+        print("⚠️ bulk_pricing is empty (no pricing.json?); calculate_results has nothing to render.")
+    yield "calculate_results", measure(lambda: (calculate.invoke(), settle()), repeat=repeat)
+
+    for n_items, n_titles in shapes:
+        shape = f"[{n_items}/{n_titles}]"
+        items = synthetic_items(n_items, n_titles)
+        titles = synthetic_titles(n_titles)
+
+        # full=True: same items every run, so an incremental redraw would do nothing
+        yield f"update_draft_display{shape}", measure(
+            lambda: (app.update_draft_display(full=True), settle()),
+            setup=lambda: load_draft(list(items), list(titles)),
+            repeat=repeat,
+        )
+
+        last_title = titles[-1]
+        set_entry(app.title_entry, last_title)
+        yield f"send_to_draft{shape}", measure(
+            lambda: (app.send_to_draft(result_dict(last_title)), settle()),
+            setup=lambda: load_draft(list(items), list(titles)),
+            repeat=repeat,
+        )
+        set_entry(app.title_entry, "")
+        load_draft([], [])
+        app.update_draft_display()
+
+        def load_invoice():
+            app.invoice_items.reset(items)
+
+        yield f"update_invoice_display{shape}", measure(
+            lambda: (app.update_invoice_display(apply_tax=True), settle()),
+            setup=load_invoice,
+            repeat=repeat,
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, "bench_invoice.docx")
+            load_invoice()
+            invoice_prices = app.update_invoice_display(apply_tax=True)
+            yield f"generate_invoice_docx{shape}", measure(
+                lambda: app.generate_invoice_docx(invoice_prices, output_path, to_pdf=False),
+                repeat=repeat,
+            )
+        app.invoice_items.clear()
+        app.update_invoice_display()
+
+
+# --- History ---
+
+def load_history(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"runs": []}
+
+
+def save_history(path, history):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def baseline_for(history, case):
+    """Median of the case's last HISTORY_WINDOW non-regressed runs, or None."""
+    values = [
+        run["results"][case] for run in history["runs"]
+        if case in run["results"] and case not in run.get("regressed", [])
+    ]
+    return statistics.median(values[-HISTORY_WINDOW:]) if values else None
+
+
+def find_regressions(history, results, threshold):
+    """[(case, baseline_ms, current_ms)] for cases slower than the threshold allows."""
+    regressions = []
+    for case, current in results.items():
+        baseline = baseline_for(history, case)
+        if baseline is None:
+            continue
+        if current > baseline * (1 + threshold) and current - baseline >= MIN_REGRESSION_MS:
+            regressions.append((case, baseline, current))
+    return regressions
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the pricing and invoice hot paths.")
+    parser.add_argument("--quick", action="store_true", help="small orders only, 3 repeats")
+    parser.add_argument("--no-gui", action="store_true", help="pricing engine only; no display needed")
+    parser.add_argument("--repeat", type=int, default=None, help="timed calls per case (default: 5, 3 with --quick)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH, help="JSON history file")
+    parser.add_argument("--no-record", action="store_true", help="compare only; don't append this run")
+    parser.add_argument("--config", default=None, help="pricing config file (default: $SMS_PRICING_CONFIG or pricing.json)")
+    args = parser.parse_args(argv)
+
+    repeat = args.repeat or (3 if args.quick else 5)
+    shapes = QUICK_ORDER_SHAPES if args.quick else ORDER_SHAPES
+
+    try:
+        pricing_config.load(args.config)
+    except pricing_config.PricingConfigError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    results = {}
+
+    def record(case, ms):
+        results[case] = round(ms, 3)
+        print(f"{case:<45} {ms:>10.2f} ms")
+
+    for case, ms in engine_cases(repeat):
+        record(case, ms)
+
+    if not args.no_gui:
+        display = start_virtual_display()
+        try:
+            app = load_app()
+            try:
+                for case, ms in gui_cases(app, shapes, repeat):
+                    record(case, ms)
+                stats = app.redraws.stats()
+                print(f"🖌️ Pane redraws: {stats['drawn']} drawn, {stats['avoided']} avoided by coalescing")
+            finally:
+                app.root.destroy()
+        finally:
+            if display is not None:
+                display.stop()
+
+    history = load_history(args.history)
+    regressions = find_regressions(history, results, args.threshold)
+    for case, baseline, current in regressions:
+        print(f"❌ {case}: {current:.2f} ms vs {baseline:.2f} ms baseline (+{(current / baseline - 1) * 100:.0f}%)")
+
+    if not args.no_record:
+        history["runs"].append({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "results": results,
+            "regressed": [case for case, _, _ in regressions],
+        })
+        save_history(args.history, history)
+
+    if regressions:
+        return 1
+    print(f"✅ No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
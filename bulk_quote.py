@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+"""
+Headless bulk quoting for wholesale order spreadsheets.
+
+Reads a CSV or JSONL of orders as a stream, prices them in chunks on a process
+pool with the same engine and add-on rules the GUI uses, and writes quote lines
+out as each chunk finishes, so memory stays flat on very large files.
+
+    python bulk_quote.py orders.csv -o quotes.csv
+    python bulk_quote.py orders.jsonl --format jsonl --workers 4 --pro
+
+Order columns (header names are case-insensitive, spaces or underscores):
+    artist, title, print_type, height, width, quantity,
+    original_height, original_width, capture, specialty_capture, color_match,
+    monitor_match, complex_wrap, additional_rounds, flashdrive, computer_time
+A blank print_type (or "all") quotes every print type in bulk_pricing.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import addons
+import price_grid
+import pricing_config
+from money import Money
+
+
+OUTPUT_COLUMNS = (
+    "row", "artist", "title", "print_type", "size", "quantity",
+    "unit_price", "pro_unit_price", "amount", "volume_discount_amt",
+    "pro_discount_amt", "error",
+)
+
+ADDON_FLAGS = ("capture", "specialty_capture", "color_match", "monitor_match", "complex_wrap")
+ADDON_COUNTS = ("additional_rounds", "flashdrive")
+
+# Key read_orders() puts on a line it couldn't read; quote_order() reports it for that row
+READ_ERROR = "__read_error__"
+
+
+class RowError(ValueError):
+    """An order field that can't be parsed; reported on that row's error line."""
+
+
+def normalize_key(key):
+    return (key or "").strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def read_orders(path, fmt=None):
+    """Yields one dict per order row, with normalized keys, without loading the whole file."""
+    fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+    stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8-sig")
+    try:
+        if fmt == "jsonl":
+            for line in stream:
+                if not line.strip():
+                    continue
+                try:
+                    order = json.loads(line)
+                except ValueError as e:
+                    yield {READ_ERROR: f"Not valid JSON: {e}"}
+                    continue
+                if not isinstance(order, dict):
+                    yield {READ_ERROR: f"Expected a JSON object, got {type(order).__name__}"}
+                    continue
+                yield {normalize_key(k): v for k, v in order.items()}
+        else:
+            for row in csv.DictReader(stream):
+                yield {normalize_key(k): v for k, v in row.items()}
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def parse_flag(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "y", "yes", "true", "x")
+    return bool(value)
+
+
+def parse_number(value, cast=float, name="value"):
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise RowError(f"{name}: expected a number, got {value!r}")
+    try:
+        return cast(value)
+    except ValueError:
+        raise RowError(f"{name}: expected a number, got {value!r}") from None
+
+
+def parse_order(order):
+    """The order's numbers and add-on selections, parsed; raises RowError on a bad field."""
+    fields = {
+        name: parse_number(order.get(name), name=name)
+        for name in ("height", "width", "original_height", "original_width", "computer_time")
+    }
+    fields["quantity"] = parse_number(order.get("quantity"), int, name="quantity")
+    for flag in ADDON_FLAGS:
+        fields[flag] = parse_flag(order.get(flag))
+    for count in ADDON_COUNTS:
+        fields[count] = parse_number(order.get(count), int, name=count) or 0
+    return fields
+
+
+def text_field(order, key):
+    return str(order.get(key) or "").strip()
+
+
+def format_size(height, width):
+    # Same "H" x W"" display send_to_draft uses
+    return f"{height}\" x {width}\""
+
+
+def quote_order(row_number, order, pro=False):
+    """
+    Prices one order row into output dicts: print lines first, then add-ons.
+    A row with bad input becomes a single error line instead of failing the batch.
+    """
+    base = {"row": row_number, "artist": text_field(order, "artist"), "title": text_field(order, "title")}
+    print_type = text_field(order, "print_type")
+
+    def error_line(message):
+        return [{**base, "print_type": print_type, "error": message}]
+
+    if READ_ERROR in order:
+        return error_line(order[READ_ERROR])
+    try:
+        fields = parse_order(order)
+    except RowError as e:
+        return error_line(str(e))
+
+    height, width, quantity = fields["height"], fields["width"], fields["quantity"]
+    lines = []
+    size_formatted = ""
+    if height is not None and width is not None and quantity is not None:
+        size_formatted = format_size(height, width)
+        if print_type and print_type.lower() != "all":
+            try:
+                quotes = [price_grid.grid_quote(print_type, height, width, quantity, pro=pro)]
+            except KeyError as e:
+                return error_line(f"Unknown print type {e}")
+        else:
+            quotes = [q for q in price_grid.quote_all(height, width, quantity, pro=pro) if not q.is_empty]
+        for q in quotes:
+            c = q.in_cents()
+            lines.append({
+                **base,
+                "print_type": q.print_type,
+                "size": size_formatted,
+                "quantity": quantity,
+                "unit_price": c["total_cost"],
+                "pro_unit_price": c["pro_total_cost"],
+                "amount": c["pro_total_cost" if pro else "total_cost"] * quantity,
+                "volume_discount_amt": c["volume_discount_amt"],
+                "pro_discount_amt": c["pro_discount_amt"],
+            })
+
+    try:
+        services = addons.addon_items(
+            linked_title=base["title"],
+            original_height=fields["original_height"],
+            original_width=fields["original_width"],
+            size_formatted=size_formatted,
+            computer_time=fields["computer_time"] or 0.0,
+            **{flag: fields[flag] for flag in ADDON_FLAGS},
+            **{count: fields[count] for count in ADDON_COUNTS},
+        )
+    except addons.MissingDimensionsError as e:
+        return error_line(str(e))
+
+    for item in services:
+        lines.append({
+            **base,
+            "print_type": item.print_type,
+            "size": "",
+            "quantity": item.num_prints,
+            "unit_price": item.regular_price,
+            "pro_unit_price": item.pro_price,
+            "amount": (item.pro_price if pro else item.regular_price) * item.num_prints,
+        })
+    return lines
+
+
+def quote_chunk(chunk, pro=False):
+    """Worker entry point: chunk is a list of (row_number, order) pairs."""
+    lines = []
+    for row_number, order in chunk:
+        lines.extend(quote_order(row_number, order, pro=pro))
+    return lines
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def quote_stream(orders, chunk_size=500, workers=None, pro=False, config=None):
+    """
+    Yields lists of output lines, one list per chunk, in input order.
+    At most 2 * workers chunks are in flight, so the input is never read ahead
+    further than that no matter how large the file is. Workers load the same
+    pricing config (path or None for the default) the caller priced with.
+    """
+    chunks = chunked(enumerate(orders, start=1), chunk_size)
+
+    if workers == 1:
+        for chunk in chunks:
+            yield quote_chunk(chunk, pro)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=pricing_config.load, initargs=(config,)) as pool:
+        max_in_flight = 2 * workers
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(quote_chunk, chunk, pro))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class QuoteWriter:
+    def __init__(self, stream, fmt="csv"):
+        self.stream = stream
+        self.fmt = fmt
+        if fmt == "csv":
+            self.writer = csv.DictWriter(stream, fieldnames=OUTPUT_COLUMNS, extrasaction="ignore")
+            self.writer.writeheader()
+
+    def write(self, lines):
+        # Money is whole cents; write dollars ("12.30" in CSV, 12.3 in JSON)
+        if self.fmt == "csv":
+            self.writer.writerows(
+                {k: str(v) if isinstance(v, Money) else v for k, v in line.items()} for line in lines
+            )
+        else:
+            for line in lines:
+                line = {k: v.dollars if isinstance(v, Money) else v for k, v in line.items()}
+                self.stream.write(json.dumps(line, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Price a CSV/JSONL file of orders without the GUI.")
+    parser.add_argument("input", help="orders file (.csv, .jsonl), or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="where to write quotes (default: stdout)")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"), help="override detection by extension")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="output format")
+    parser.add_argument("--chunk-size", type=int, default=500, help="orders per worker task")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count, 1 = in-process)")
+    parser.add_argument("--pro", action="store_true", help="use professional pricing for line amounts")
+    parser.add_argument("--config", default=None, help="pricing config file (default: $SMS_PRICING_CONFIG or pricing.json)")
+    args = parser.parse_args(argv)
+
+    try:
+        pricing_config.load(args.config)
+    except pricing_config.PricingConfigError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    errors = 0
+    try:
+        writer = QuoteWriter(out, args.format)
+        price_grid.load_grid()  # build/refresh once here, not in every worker
+        orders = read_orders(args.input, args.input_format)
+        for lines in quote_stream(orders, args.chunk_size, args.workers, args.pro, args.config):
+            errors += sum(1 for line in lines if line.get("error"))
+            writer.write(lines)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if errors:
+        print(f"⚠️ {errors} order row(s) could not be priced; see the error column.", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
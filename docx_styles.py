@@ -0,0 +1,39 @@
+"""
+Word document styling shared by the generated invoices and price sheets.
+"""
+
+from docx.enum.text import WD_TAB_ALIGNMENT, WD_TAB_LEADER
+from docx.shared import Inches, Pt, RGBColor
+
+
+BRAND_FONT = "Avenir Next"
+BRAND_COLOR = RGBColor(0x1C, 0x52, 0x3F)
+
+
+def add_aligned_line(paragraph, left_text, right_text, tab_pos=Inches(6.25), add_dots=True):
+    """Left text, then right text flush against a right tab stop (dot leader by default)."""
+    paragraph.paragraph_format.tab_stops.clear_all()
+    paragraph.paragraph_format.tab_stops.add_tab_stop(
+        tab_pos,
+        alignment=WD_TAB_ALIGNMENT.RIGHT,
+        leader=WD_TAB_LEADER.DOTS if add_dots else WD_TAB_LEADER.SPACES
+    )
+    r_left = paragraph.add_run(left_text)
+    paragraph.add_run("\t")
+    r_right = paragraph.add_run(right_text)
+    return r_left, r_right
+
+
+def brand_runs(runs_and_sizes):
+    """Applies the brand font and color to (run, point size) pairs."""
+    for run, size in runs_and_sizes:
+        run.font.name = BRAND_FONT
+        run.font.size = Pt(size)
+        run.font.color.rgb = BRAND_COLOR
+
+
+def add_header(doc, left_text, right_text):
+    """The invoice header line: big name on the left, date on the right."""
+    r_left, r_right = add_aligned_line(doc.add_paragraph(), left_text, right_text, add_dots=False)
+    brand_runs([(r_left, 28), (r_right, 18)])
+    return r_left, r_right
@@ -0,0 +1,141 @@
+"""
+Invoice totals, kept up to date as lines come and go.
+
+The invoice summary is a short chain on top of three sums over the lines:
+
+    subtotal        sum of regular_price x num_prints
+    volume savings  |sum of volume_discount_amt|
+    pro savings     |sum of pro_discount_amt|
+
+    discounted subtotal = subtotal - savings - flat discount - percent discount
+    card fee            = 3% of the discounted subtotal (if paying by card)
+    tax                 = 7% of discounted subtotal + card fee (if taxed)
+    total               = discounted subtotal + card fee + tax
+
+InvoiceTotals keeps the three sums as running totals (add()/remove() per line,
+wired to the invoice ItemStore), and only reruns the chain when a sum or one
+of the adjustments (discounts, tax, card fee) changed since the last
+summary(). Everything is Money, so adding and removing lines is exact; only
+the percent, card-fee and tax multiplies round.
+"""
+
+from money import Money, ZERO, percent_of
+
+
+TAX_RATE = 0.07
+CARD_FEE_RATE = 0.03
+
+
+def line_subtotal(item):
+    """What one line adds to the subtotal: unit price x quantity."""
+    return item.regular_price * item.num_prints
+
+
+class InvoiceTotals:
+    def __init__(self):
+        self.subtotal = ZERO
+        self.volume_discount = ZERO
+        self.pro_discount = ZERO
+        self.dollar_discount = ZERO
+        self.percent_discount = 0.0
+        self.apply_tax = False
+        self.apply_card = False
+        self._summary_key = None
+        self._summary = None
+
+    # --- Running sums ---
+
+    def add(self, item):
+        self.subtotal += line_subtotal(item)
+        self.volume_discount += item.volume_discount_amt
+        self.pro_discount += item.pro_discount_amt
+
+    def remove(self, item):
+        self.subtotal -= line_subtotal(item)
+        self.volume_discount -= item.volume_discount_amt
+        self.pro_discount -= item.pro_discount_amt
+
+    def clear(self):
+        self.subtotal = self.volume_discount = self.pro_discount = ZERO
+
+    # --- Adjustments ---
+
+    def set_adjustments(self, dollar_discount=ZERO, percent_discount=0.0, apply_tax=False, apply_card=False):
+        """Flat discount (dollars or Money), percent discount, and the tax/card-fee toggles."""
+        self.dollar_discount = Money.from_dollars(dollar_discount)
+        self.percent_discount = float(percent_discount or 0)
+        self.apply_tax = bool(apply_tax)
+        self.apply_card = bool(apply_card)
+
+    # --- Derived chain ---
+
+    def summary(self):
+        """
+        The invoice summary dict (the keys the invoice pane, the DOCX and QBO
+        read, plus summary_lines in invoice order). Cached until a sum or an
+        adjustment changes; don't mutate it.
+        """
+        key = (
+            self.subtotal, self.volume_discount, self.pro_discount,
+            self.dollar_discount, self.percent_discount, self.apply_tax, self.apply_card,
+        )
+        if key != self._summary_key:
+            self._summary = self._compute()
+            self._summary_key = key
+        return self._summary
+
+    def _compute(self):
+        final_subtotal = self.subtotal
+        volume_savings = abs(self.volume_discount)
+        pro_savings = abs(self.pro_discount)
+        dollar_discount = self.dollar_discount
+        percent_discount = self.percent_discount
+
+        # Percent discount is applied on the FULL Subtotal
+        percent_discount_amt = percent_of(final_subtotal, percent_discount)
+
+        # Discounted Subtotal subtracts ALL discount lines:
+        # volume, professional, flat, and custom percent.
+        discounted_subtotal = (
+            final_subtotal
+            - volume_savings
+            - pro_savings
+            - dollar_discount
+            - percent_discount_amt
+        )
+        if discounted_subtotal < 0:
+            discounted_subtotal = ZERO
+
+        # Card fee is computed BEFORE tax, and the tax base includes it
+        card_fee = discounted_subtotal * CARD_FEE_RATE if self.apply_card else ZERO
+        tax_rate = TAX_RATE if self.apply_tax else 0.00
+        final_tax = (discounted_subtotal + card_fee) * tax_rate if tax_rate > 0 else ZERO
+        final_total = discounted_subtotal + card_fee + final_tax
+
+        summary = {
+            "final_subtotal": final_subtotal,
+            "dollar_discount": dollar_discount,
+            "percent_discount": percent_discount,
+            "percent_discount_amt": percent_discount_amt,
+            "discounted_subtotal": discounted_subtotal,
+            "final_tax": final_tax,
+            "final_card_fee": card_fee,
+            "final_total": final_total,
+            "volume_savings": volume_savings,
+            "pro_savings": pro_savings,
+            "tax_rate": tax_rate,
+        }
+
+        # This is the order it'll show up in in the PDF and QBO
+        summary["summary_lines"] = [
+            ("Subtotal", final_subtotal),
+            ("Volume Discount", -volume_savings),
+            ("Professional Discount", -pro_savings),
+            ("Flat Discount", -dollar_discount),
+            (f"Custom Discount ({percent_discount:.2f}%)", -percent_discount_amt),
+            ("Discounted Subtotal", discounted_subtotal),
+            ("Card Fee (3%)", card_fee),
+            (f"Sales Tax ({int(tax_rate * 100)}%)", final_tax),
+            ("Total Due", final_total),
+        ]
+        return summary
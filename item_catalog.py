@@ -0,0 +1,130 @@
+"""Catalog entries for draft/invoice lines: kind, labels, QuickBooks name and DOCX rules."""
+
+import re
+from dataclasses import dataclass
+
+import pricing
+
+
+PRINT = "print"
+SERVICE = "service"
+CUSTOM = "custom"
+DISCOUNT = "discount"
+
+# Print types whose DOCX line is a single priced line (paper stocks, unstretched canvas)
+COLLAPSED_STOCKS = ("enhanced matte", "photorag", "watercolor", "unstretched canvas")
+
+_emoji = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # Emoticons
+    "\U0001F300-\U0001F5FF"  # Symbols & Pictographs
+    "\U0001F680-\U0001F6FF"  # Transport & Map
+    "\U0001F1E0-\U0001F1FF"  # Flags
+    "\U00002500-\U00002BEF"  # Box Drawing + More
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]+", flags=re.UNICODE
+)
+
+
+def strip_emoji(text):
+    return _emoji.sub(r'', text)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    id: str                # "flashdrive", "print:Photorag", "custom:Rush fee"
+    kind: str              # PRINT, SERVICE, CUSTOM or DISCOUNT
+    label: str             # plain name, no icon (DOCX text)
+    icon: str = ""         # shown before the label in the panes
+    qbo_name: str = ""     # QuickBooks item name; defaults to label
+    collapse: bool = False # DOCX: one priced line, no cost breakdown
+    material: str = ""     # DOCX breakdown label for a print ("Canvas"/"Paper")
+    sized: bool = False    # QuickBooks description leads with the size
+
+    def __post_init__(self):
+        if not self.qbo_name:
+            object.__setattr__(self, "qbo_name", self.label)
+
+    @property
+    def display(self):
+        """The label as the panes show it, icon first."""
+        return f"{self.icon} {self.label}" if self.icon else self.label
+
+
+# --- Add-ons ---
+
+CAPTURE = {
+    size: CatalogEntry(f"capture_{size.lower()}", SERVICE, f"{size} Capture", "📸")
+    for size in ("Small", "Medium", "Large")
+}
+SPECIALTY_CAPTURE = CatalogEntry("specialty_capture", SERVICE, "Specialty Capture", "✨")
+COLOR_MATCH = CatalogEntry("color_match", SERVICE, "Basic Color Match", "🎨")
+COLOR_MATCH_48 = CatalogEntry("color_match_48", SERVICE, "Basic Color Match – 48\"+", "🎨")
+COLOR_MATCH_72 = CatalogEntry("color_match_72", SERVICE, "Basic Color Match – 72\"+", "🎨")
+MONITOR_MATCH = CatalogEntry("monitor_match", SERVICE, "Monitor Match", "🖥️")
+COMPLEX_WRAP = CatalogEntry("complex_wrap", SERVICE, "Complex Image Wrap", "🐩")
+ADDITIONAL_ROUNDS = CatalogEntry("additional_rounds", SERVICE, "Additional Color Match Rounds", "💻")
+FLASHDRIVE = CatalogEntry("flashdrive", SERVICE, "Flashdrive", "💿")
+COMPUTER_TIME = CatalogEntry("computer_time", SERVICE, "Computer Time", "🕖")
+
+# --- Invoice adjustments (QuickBooks lines) ---
+
+VOLUME_DISCOUNT = CatalogEntry("volume_discount", DISCOUNT, "Volume Discount")
+PROFESSIONAL_DISCOUNT = CatalogEntry("professional_discount", DISCOUNT, "Professional Discount")
+FLAT_DISCOUNT = CatalogEntry("flat_discount", DISCOUNT, "Flat Discount")
+PERCENT_DISCOUNT = CatalogEntry("percent_discount", DISCOUNT, "Custom Discount", qbo_name="Custom % Discount")
+CARD_FEE = CatalogEntry("card_fee", SERVICE, "Card Fee (3%)", qbo_name="Card Fee")
+
+ENTRIES = {
+    entry.id: entry
+    for entry in (
+        *CAPTURE.values(), SPECIALTY_CAPTURE, COLOR_MATCH, COLOR_MATCH_48, COLOR_MATCH_72,
+        MONITOR_MATCH, COMPLEX_WRAP, ADDITIONAL_ROUNDS, FLASHDRIVE, COMPUTER_TIME,
+        VOLUME_DISCOUNT, PROFESSIONAL_DISCOUNT, FLAT_DISCOUNT, PERCENT_DISCOUNT, CARD_FEE,
+    )
+}
+
+
+# --- Print types and custom items ---
+
+_print_entries = {}
+_print_entries_version = None  # pricing.table_version the entries were built for
+
+
+def print_entry(print_type):
+    """The entry for a print type, built on first use and again after a pricing reload."""
+    global _print_entries_version
+    if _print_entries_version != pricing.table_version:
+        _print_entries.clear()
+        _print_entries_version = pricing.table_version
+
+    entry = _print_entries.get(print_type)
+    if entry is None:
+        name = print_type.lower()
+        qbo_name = strip_emoji(print_type).strip()
+        entry = _print_entries[print_type] = CatalogEntry(
+            f"print:{print_type}", PRINT, print_type,
+            qbo_name=qbo_name,
+            collapse=any(stock in name for stock in COLLAPSED_STOCKS),
+            material="Canvas" if "canvas" in name else "Paper",
+            sized=qbo_name in pricing.bulk_pricing,
+        )
+    return entry
+
+
+def custom_entry(name):
+    # Operator-typed, so the name may carry emoji of its own
+    return CatalogEntry(f"custom:{name}", CUSTOM, strip_emoji(name).strip() or name)
+
+
+def entry_by_id(entry_id):
+    """The entry for an id from CatalogEntry.id (for rebuilding saved lines)."""
+    if entry_id in ENTRIES:
+        return ENTRIES[entry_id]
+    prefix, _, name = entry_id.partition(":")
+    if prefix == "print":
+        return print_entry(name)
+    if prefix == "custom":
+        return custom_entry(name)
+    raise KeyError(entry_id)
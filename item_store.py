@@ -0,0 +1,120 @@
+"""Draft and invoice line items, indexed by title and by stable item ID."""
+
+from itertools import count
+
+
+_item_ids = count(1)
+
+
+def new_item_id():
+    return next(_item_ids)
+
+
+class ItemStore:
+    def __init__(self, default_title=None, on_add=None, on_remove=None):
+        # Lines without a linked_title are grouped under default_title
+        self.default_title = default_title
+        # Called with every item entering/leaving, pop_title() and clear() included
+        self.on_add = on_add
+        self.on_remove = on_remove
+        self._titles = {}
+        self._items = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def title_of(self, item):
+        return item.linked_title or self.default_title
+
+    # --- Reading ---
+
+    def get(self, item_id):
+        return self._items.get(item_id)
+
+    def last(self):
+        """The item added most recently, or None."""
+        return next(reversed(self._items.values()), None)
+
+    def titles(self):
+        return list(self._titles)
+
+    def items_for(self, title):
+        """The items under title, in add order (a live view)."""
+        block = self._titles.get(title)
+        return block.values() if block else ()
+
+    def by_title(self):
+        """{title: [items]} snapshot, titles in order of first appearance."""
+        return {title: list(block.values()) for title, block in self._titles.items()}
+
+    # --- Changing ---
+
+    def append(self, item):
+        if item.item_id is None:
+            item.item_id = new_item_id()
+        item_id = item.item_id
+        if item_id in self._items:
+            self.remove(self._items[item_id])
+        self._items[item_id] = item
+        self._titles.setdefault(self.title_of(item), {})[item_id] = item
+        if self.on_add:
+            self.on_add(item)
+
+    def extend(self, items):
+        for item in list(items):
+            self.append(item)
+
+    def remove(self, item):
+        return self.discard(item.item_id)
+
+    def discard(self, item_id):
+        """Removes and returns the item with item_id, or None if it isn't here."""
+        item = self._items.pop(item_id, None)
+        if item is None:
+            return None
+        title = self.title_of(item)
+        block = self._titles[title]
+        del block[item_id]
+        if not block:
+            del self._titles[title]
+        if self.on_remove:
+            self.on_remove(item)
+        return item
+
+    def move(self, item_id, other):
+        """Moves one line to another store; returns it, or None if it isn't here."""
+        item = self.discard(item_id)
+        if item is not None:
+            other.append(item)
+        return item
+
+    def pop_title(self, title):
+        """Removes and returns every item under title."""
+        items = list(self._titles.pop(title, {}).values())
+        for item in items:
+            del self._items[item.item_id]
+            if self.on_remove:
+                self.on_remove(item)
+        return items
+
+    def rename_title(self, old_title, new_title):
+        """Moves old_title's items under new_title, updating their linked_title."""
+        block = self._titles.pop(old_title, {})
+        for item in block.values():
+            item.linked_title = new_title
+        if block:
+            self._titles.setdefault(self.title_of(next(iter(block.values()))), {}).update(block)
+
+    def clear(self):
+        if self.on_remove:
+            for item in self._items.values():
+                self.on_remove(item)
+        self._titles.clear()
+        self._items.clear()
+
+    def reset(self, items=()):
+        self.clear()
+        self.extend(items)
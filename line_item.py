@@ -0,0 +1,143 @@
+"""Draft and invoice lines: one __slots__ class per kind of line."""
+
+from item_catalog import PRINT, SERVICE, CUSTOM, DISCOUNT, custom_entry, entry_by_id, print_entry
+from money import Money, ZERO
+
+
+class LineItem:
+    __slots__ = (
+        "item_id", "entry", "linked_title", "print_type", "size", "num_prints",
+        "regular_price", "pro_price", "color",
+    )
+
+    kind = None
+    detail = ""  # what follows the label, e.g. a capture's artwork size
+
+    # Only PrintLine stores these
+    canvas_cost = pro_canvas_cost = ZERO
+    frame_cost = stretching_fee = bracer_cost = upcharge = ZERO
+    volume_discount_amt = pro_discount_amt = ZERO
+    title = None
+
+    # Only lines entered with an artist (prints, custom items) store these
+    artist_first = artist_last = ""
+    custom_id = None
+
+    def __init__(self, entry, num_prints, regular_price, pro_price=None,
+                 size="", color="#FFFFFF", linked_title=None, item_id=None):
+        self.item_id = item_id
+        self.entry = entry
+        self.linked_title = linked_title
+        self.print_type = entry.display + self.detail  # as the panes show it
+        self.size = size
+        self.num_prints = num_prints
+        self.regular_price = Money.from_dollars(regular_price)
+        self.pro_price = self.regular_price if pro_price is None else Money.from_dollars(pro_price)
+        self.color = color
+
+    @classmethod
+    def fields(cls):
+        """Every slot a line of this class stores, base class first."""
+        return tuple(name for klass in reversed(cls.__mro__) for name in getattr(klass, "__slots__", ()))
+
+    @property
+    def label(self):
+        """print_type without the icon (DOCX text)."""
+        return self.entry.label + self.detail
+
+    @property
+    def qbo_name(self):
+        return self.entry.qbo_name
+
+    def to_dict(self):
+        data = {"kind": self.kind}
+        for name in self.fields():
+            data[name] = getattr(self, name)
+        data["entry"] = self.entry.id
+        return data
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.print_type!r}, x{self.num_prints}, {self.linked_title!r})"
+
+
+class PrintLine(LineItem):
+    __slots__ = (
+        "canvas_cost", "pro_canvas_cost", "frame_cost", "stretching_fee", "bracer_cost",
+        "upcharge", "volume_discount_amt", "pro_discount_amt", "title", "artist_first", "artist_last",
+    )
+
+    kind = PRINT
+
+    def __init__(self, print_type, num_prints, regular_price, pro_price=None, size="", color="#FFFFFF",
+                 linked_title=None, item_id=None, canvas_cost=ZERO, pro_canvas_cost=ZERO,
+                 frame_cost=ZERO, stretching_fee=ZERO, bracer_cost=ZERO, upcharge=ZERO,
+                 volume_discount_amt=ZERO, pro_discount_amt=ZERO, title=None, artist_first="", artist_last=""):
+        super().__init__(print_entry(print_type), num_prints, regular_price, pro_price, size, color, linked_title, item_id)
+        self.canvas_cost = canvas_cost or ZERO
+        self.pro_canvas_cost = pro_canvas_cost or ZERO
+        self.frame_cost = frame_cost or ZERO
+        self.stretching_fee = stretching_fee or ZERO
+        self.bracer_cost = bracer_cost or ZERO
+        self.upcharge = upcharge or ZERO
+        self.volume_discount_amt = volume_discount_amt or ZERO
+        self.pro_discount_amt = pro_discount_amt or ZERO
+        self.title = title
+        self.artist_first = artist_first
+        self.artist_last = artist_last
+
+
+class ServiceLine(LineItem):
+    __slots__ = ("detail",)
+
+    kind = SERVICE
+
+    def __init__(self, entry, num_prints, regular_price, pro_price=None, color="#FFFFFF",
+                 linked_title=None, item_id=None, detail=""):
+        self.detail = detail
+        super().__init__(entry, num_prints, regular_price, pro_price, "", color, linked_title, item_id)
+
+    @property
+    def qbo_name(self):
+        # QuickBooks has an item per capture size, e.g. 'Small Capture (16" x 20")'
+        return self.entry.qbo_name + self.detail
+
+
+class CustomLine(LineItem):
+    __slots__ = ("custom_id", "artist_first", "artist_last")
+
+    kind = CUSTOM
+
+    def __init__(self, print_type, num_prints, regular_price, pro_price=None, size="", color="#E9967A",
+                 linked_title=None, item_id=None, custom_id=None, artist_first="", artist_last=""):
+        super().__init__(custom_entry(print_type), num_prints, regular_price, pro_price, size, color,
+                         linked_title, item_id)
+        self.print_type = print_type  # as typed, icons and all
+        self.custom_id = custom_id
+        self.artist_first = artist_first
+        self.artist_last = artist_last
+
+
+class DiscountLine(LineItem):
+    __slots__ = ("detail",)
+
+    kind = DISCOUNT
+
+    def __init__(self, entry, amount, linked_title=None, item_id=None, detail=""):
+        """amount is the savings (positive); the line is priced at -amount."""
+        self.detail = detail
+        amount = Money.from_dollars(amount)
+        super().__init__(entry, 1, -amount, linked_title=linked_title, item_id=item_id)
+
+
+LINE_CLASSES = {cls.kind: cls for cls in (PrintLine, ServiceLine, CustomLine, DiscountLine)}
+
+
+def line_from_dict(data):
+    """Rebuilds a line from to_dict() output."""
+    data = dict(data)
+    cls = LINE_CLASSES[data.pop("kind")]
+    line = cls.__new__(cls)
+    data["entry"] = entry_by_id(data["entry"])
+    for name in cls.fields():
+        setattr(line, name, data[name])
+    return line
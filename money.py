@@ -0,0 +1,101 @@
+"""Fixed-point money in whole cents: Money, an int subclass formatted as dollars."""
+
+import math
+
+import numpy as np
+
+
+# Guards against binary float noise like 1.005 * 100 == 100.49999999999999
+_EPSILON = 1e-7
+
+
+def _round_half_away(value):
+    if value >= 0:
+        return int(math.floor(value + 0.5 + _EPSILON))
+    return -int(math.floor(-value + 0.5 + _EPSILON))
+
+
+class Money(int):
+    __slots__ = ()
+
+    def __new__(cls, cents=0):
+        return super().__new__(cls, cents)
+
+    @classmethod
+    def from_dollars(cls, amount):
+        """Rounds a dollar amount (float, int or None) to whole cents."""
+        if isinstance(amount, Money):
+            return amount
+        if amount is None:
+            return ZERO
+        return cls(_round_half_away(float(amount) * 100))
+
+    @property
+    def dollars(self):
+        return int(self) / 100
+
+    def _check(self, other):
+        if isinstance(other, float):
+            raise TypeError("Can't add float dollars to Money; convert with Money.from_dollars() first")
+        return isinstance(other, int)
+
+    def __add__(self, other):
+        if not self._check(other):
+            return NotImplemented
+        return Money(int(self) + int(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if not self._check(other):
+            return NotImplemented
+        return Money(int(self) - int(other))
+
+    def __rsub__(self, other):
+        if not self._check(other):
+            return NotImplemented
+        return Money(int(other) - int(self))
+
+    def __mul__(self, other):
+        """Integer quantities are exact; fractional ones round once to the cent."""
+        if isinstance(other, Money):
+            raise TypeError("Can't multiply Money by Money")
+        if isinstance(other, int):
+            return Money(int(self) * other)
+        if isinstance(other, float):
+            return Money(_round_half_away(int(self) * other))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Money(-int(self))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Money(abs(int(self)))
+
+    def __format__(self, spec):
+        return format(self.dollars, spec or ".2f")
+
+    def __str__(self):
+        return f"{self.dollars:.2f}"
+
+    def __repr__(self):
+        return f"Money('{self}')"
+
+
+ZERO = Money(0)
+
+
+def to_cents_array(amounts):
+    """Vectorized Money.from_dollars(): float dollars -> int64 cents."""
+    scaled = np.abs(np.asarray(amounts, dtype=float)) * 100
+    return (np.sign(amounts) * np.floor(scaled + 0.5 + _EPSILON)).astype(np.int64)
+
+
+def percent_of(amount, percent):
+    """percent% of a Money amount, rounded once."""
+    return amount * (percent / 100)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+"""
+Precomputed price grid for standard whole-inch sizes.
+
+`python price_grid.py` (or build_grid()) prices every print type, quantity tier
+and whole-inch size in the configured range with one quote_batch() pass per
+tier and saves the result as a .npy file plus a small JSON header. At runtime
+the file is memory-mapped, so a standard-size quote is an array index; odd
+sizes fall back to the live engine. The header records the pricing tables'
+fingerprint, and load_grid() rebuilds the grid when the tables have changed.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+import numpy as np
+
+import pricing
+import pricing_config
+
+
+GRID_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_GRID_PATH = os.path.join(GRID_DIR, "price_grid.npy")
+
+MIN_SIZE = 8
+MAX_SIZE = 96
+
+# Last axis of the grid array
+GRID_FIELDS = (
+    "area_in_sqft", "canvas_cost", "pro_canvas_cost", "frame_cost", "stretching_fee",
+    "bracer_cost", "upcharge", "total_cost", "pro_total_cost",
+    "unit_volume_discount", "unit_pro_discount",  # per print; lookup() scales by quantity
+)
+_FIELD = {name: i for i, name in enumerate(GRID_FIELDS)}
+
+
+def header_path(grid_path):
+    return os.path.splitext(grid_path)[0] + ".json"
+
+
+def tier_quantities(table):
+    """One quantity that lands in each tier of a TierTable (in tier order)."""
+    limits = table.limits
+    if not limits:
+        return [1]
+    return list(limits) + [limits[-1] + 1]
+
+
+def build_grid(path=None, min_size=MIN_SIZE, max_size=MAX_SIZE):
+    """
+    Prices the full grid and writes it atomically to path (+ JSON header).
+    Array shape is (print types, tiers, heights, widths, GRID_FIELDS).
+    """
+    path = path or DEFAULT_GRID_PATH
+    print_types = list(pricing.bulk_pricing)
+    sizes = np.arange(min_size, max_size + 1, dtype=float)
+    heights, widths = np.meshgrid(sizes, sizes, indexing="ij")
+    tables = {pt: pricing.tier_table(pt) for pt in print_types}
+    tier_count = max((len(t.rates) for t in tables.values()), default=0)
+
+    grid = np.zeros((len(print_types), tier_count, len(sizes), len(sizes), len(GRID_FIELDS)))
+    for t, print_type in enumerate(print_types):
+        table = tables[print_type]
+        for tier, quantity in enumerate(tier_quantities(table)):
+            columns = pricing.quote_batch(heights, widths, quantity, print_types=[print_type])[print_type]
+            columns["unit_volume_discount"] = columns["area_in_sqft"] * table.volume_discounts[tier]
+            columns["unit_pro_discount"] = columns["area_in_sqft"] * table.pro_discounts[tier]
+            for name, f in _FIELD.items():
+                grid[t, tier, :, :, f] = columns[name]
+
+    header = {
+        "fingerprint": pricing.tables_fingerprint(),
+        "print_types": print_types,
+        "tier_count": tier_count,
+        "min_size": min_size,
+        "max_size": max_size,
+        "fields": list(GRID_FIELDS),
+    }
+
+    # Unique temp names so concurrent builders never clobber each other;
+    # the array is swapped in before the header that vouches for it.
+    tmp_suffix = f".{os.getpid()}.tmp"
+    with open(path + tmp_suffix, "wb") as f:
+        np.save(f, grid)
+    with open(header_path(path) + tmp_suffix, "w") as f:
+        json.dump(header, f, indent=2)
+    os.replace(path + tmp_suffix, path)
+    os.replace(header_path(path) + tmp_suffix, header_path(path))
+    return header
+
+
+class PriceGrid:
+    """A memory-mapped grid built by build_grid()."""
+
+    def __init__(self, path=None):
+        path = path or DEFAULT_GRID_PATH
+        with open(header_path(path)) as f:
+            header = json.load(f)
+        self.path = path
+        if header.get("fields") != list(GRID_FIELDS):
+            raise ValueError(f"{path} was built with different fields")
+        self.fingerprint = header["fingerprint"]
+        self.min_size = header["min_size"]
+        self.max_size = header["max_size"]
+        self.type_index = {pt: i for i, pt in enumerate(header["print_types"])}
+        # np.load can't memory-map an empty array, which is what blank tables give
+        self.values = np.load(path, mmap_mode="r" if self.type_index else None)
+        self.table_version = pricing.table_version
+
+    def covers(self, height, width):
+        return (
+            float(height).is_integer() and float(width).is_integer() and
+            self.min_size <= height <= self.max_size and
+            self.min_size <= width <= self.max_size
+        )
+
+    def lookup(self, print_type, height, width, num_prints, pro=False):
+        """Quote from the grid, or None if this size/type isn't in it."""
+        t = self.type_index.get(print_type)
+        if t is None or not self.covers(height, width):
+            return None
+        tier = pricing.tier_table(print_type).tier(num_prints)
+        row = self.values[t, tier, int(height) - self.min_size, int(width) - self.min_size]
+        return pricing.Quote(
+            print_type=print_type,
+            height=height,
+            width=width,
+            num_prints=num_prints,
+            area_in_sqft=float(row[_FIELD["area_in_sqft"]]),
+            canvas_cost=float(row[_FIELD["canvas_cost"]]),
+            pro_canvas_cost=float(row[_FIELD["pro_canvas_cost"]]),
+            frame_cost=float(row[_FIELD["frame_cost"]]),
+            stretching_fee=float(row[_FIELD["stretching_fee"]]),
+            bracer_cost=float(row[_FIELD["bracer_cost"]]),
+            upcharge=float(row[_FIELD["upcharge"]]),
+            volume_discount_amt=num_prints * float(row[_FIELD["unit_volume_discount"]]),
+            pro_discount_amt=num_prints * float(row[_FIELD["unit_pro_discount"]]),
+            total_cost=float(row[_FIELD["total_cost"]]),
+            pro_total_cost=float(row[_FIELD["pro_total_cost"]]),
+            pro=pro,
+        )
+
+
+_grid = None
+_failed_version = None  # table_version a build last failed for; don't retry every quote
+
+def load_grid(path=None):
+    """
+    Returns the current PriceGrid, (re)building the file first if it is
+    missing or was built from different pricing tables. Returns None if the
+    grid can't be built or read, in which case callers use the live engine.
+    """
+    global _grid, _failed_version
+    path = path or DEFAULT_GRID_PATH
+    if _grid is not None and _grid.path == path and _grid.table_version == pricing.table_version:
+        return _grid
+    if _failed_version == pricing.table_version:
+        return None
+
+    fingerprint = pricing.tables_fingerprint()
+    try:
+        grid = PriceGrid(path)
+        if grid.fingerprint != fingerprint:
+            grid = None
+    except (OSError, ValueError, KeyError):
+        grid = None
+
+    if grid is None:
+        try:
+            build_grid(path)
+            grid = PriceGrid(path)
+        except (OSError, ValueError) as e:
+            logging.warning("Price grid unavailable, using live pricing: %s", e)
+            _failed_version = pricing.table_version
+            return None
+
+    _grid = grid
+    return grid
+
+
+def grid_quote(print_type, height, width, num_prints, pro=False):
+    """Grid lookup for standard sizes, live (cached) engine for everything else."""
+    grid = load_grid()
+    q = grid.lookup(print_type, height, width, num_prints, pro=pro) if grid else None
+    return q if q is not None else pricing.cached_quote(print_type, height, width, num_prints, pro=pro)
+
+
+def quote_all(height, width, num_prints, pro=False):
+    """pricing.quote_all(), served from the grid where possible."""
+    return [grid_quote(print_type, height, width, num_prints, pro=pro) for print_type in pricing.bulk_pricing]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the precomputed standard-size price grid.")
+    parser.add_argument("-o", "--output", default=None, help=f"grid file (default: {DEFAULT_GRID_PATH})")
+    parser.add_argument("--min-size", type=int, default=MIN_SIZE, help="smallest whole-inch side")
+    parser.add_argument("--max-size", type=int, default=MAX_SIZE, help="largest whole-inch side")
+    parser.add_argument("--config", default=None, help="pricing config file (default: $SMS_PRICING_CONFIG or pricing.json)")
+    args = parser.parse_args(argv)
+
+    try:
+        pricing_config.load(args.config)
+    except pricing_config.PricingConfigError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    header = build_grid(args.output, args.min_size, args.max_size)
+    print(
+        f"✅ Built {args.output or DEFAULT_GRID_PATH}: {len(header['print_types'])} print types × "
+        f"{header['tier_count']} tiers × sizes {args.min_size}-{args.max_size}\""
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+"""
+Published price sheets: every print type over a grid of sizes x quantities.
+
+    python price_sheet.py -o sheets/
+    python price_sheet.py --sizes 8x10,16x20,24x36 --quantities 1,10,50 --pro
+    python price_sheet.py --size-range 8 60 2 --pdf
+
+Writes price_sheet.csv (one row per print type, size and quantity) and, per
+print type, a DOCX table (plus a PDF with --pdf) styled like the generated
+invoices. By default there is one column per volume tier. Each print type is
+priced with a single vectorized quote_batch_cents() call over its whole grid,
+so the cost is in writing the documents, not in pricing.
+"""
+
+import argparse
+import csv
+import os
+import re
+import sys
+from copy import deepcopy
+from datetime import datetime
+
+import numpy as np
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+
+import pricing
+import pricing_config
+from docx_styles import add_header, brand_runs
+from money import Money
+
+
+SHEET_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TEMPLATE = os.path.join(SHEET_DIR, "SMS Invoice Draft.docx")
+
+# (height, width) in inches
+STANDARD_SIZES = (
+    (8, 10), (11, 14), (12, 12), (12, 16), (16, 20), (18, 24), (20, 20), (20, 30),
+    (24, 30), (24, 36), (30, 30), (30, 40), (36, 48), (40, 60), (48, 72),
+)
+
+CSV_COLUMNS = ("print_type", "height", "width", "quantity", "tier", "unit_price", "pro_unit_price")
+
+
+def parse_sizes(text):
+    """"8x10,16x20" -> [(8.0, 10.0), (16.0, 20.0)]"""
+    sizes = []
+    for part in text.split(","):
+        match = re.fullmatch(r"\s*([\d.]+)\s*[xX×]\s*([\d.]+)\s*", part)
+        if not match:
+            raise ValueError(f"Bad size {part.strip()!r}; use HEIGHTxWIDTH, e.g. 16x20")
+        sizes.append((float(match.group(1)), float(match.group(2))))
+    return sizes
+
+
+def size_range(min_size, max_size, step=1):
+    """Every height <= width pair of sides from min_size to max_size."""
+    sides = np.arange(min_size, max_size + step / 2, step)
+    return [(float(h), float(w)) for i, h in enumerate(sides) for w in sides[i:]]
+
+
+def tier_columns(print_type, quantities=None):
+    """
+    [(label, quantity)] sheet columns. Defaults to one column per volume tier,
+    priced at the tier's smallest quantity and labelled with its range.
+    """
+    if quantities:
+        return [(str(q), q) for q in quantities]
+    columns = []
+    previous = 0
+    for limit in pricing.tier_table(print_type).limits:
+        if limit > previous:
+            columns.append((f"{previous + 1}–{limit}" if limit > previous + 1 else str(limit), previous + 1))
+        previous = max(previous, limit)
+    columns.append((f"{previous + 1}+", previous + 1))
+    return columns
+
+
+class Sheet:
+    """One print type's prices: unit/pro_unit are int64 cents, shape (sizes, columns)."""
+
+    def __init__(self, print_type, sizes, columns, unit, pro_unit):
+        self.print_type = print_type
+        self.sizes = sizes
+        self.columns = columns
+        self.unit = unit
+        self.pro_unit = pro_unit
+
+
+def build_sheet(print_type, sizes, quantities=None):
+    columns = tier_columns(print_type, quantities)
+    heights = np.array([h for h, _ in sizes], dtype=float)[:, None]
+    widths = np.array([w for _, w in sizes], dtype=float)[:, None]
+    counts = np.array([q for _, q in columns], dtype=np.int64)[None, :]
+    priced = pricing.quote_batch_cents(heights, widths, counts, print_types=[print_type])[print_type]
+    return Sheet(print_type, sizes, columns, priced["total_cost"], priced["pro_total_cost"])
+
+
+def build_sheets(sizes, quantities=None, print_types=None):
+    return [build_sheet(pt, sizes, quantities) for pt in (print_types or pricing.bulk_pricing)]
+
+
+def format_size(height, width):
+    return f"{height:g}\" x {width:g}\""
+
+
+def write_csv(path, sheets):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for sheet in sheets:
+            for i, (height, width) in enumerate(sheet.sizes):
+                for j, (label, quantity) in enumerate(sheet.columns):
+                    writer.writerow((
+                        sheet.print_type, f"{height:g}", f"{width:g}", quantity, label,
+                        Money(int(sheet.unit[i, j])), Money(int(sheet.pro_unit[i, j])),
+                    ))
+
+
+def add_price_table(doc, sheet, cents, heading):
+    doc.add_paragraph(heading, style="Heading 2")
+
+    # Cell text rendered up front, so the document loop only places strings
+    rows = [[format_size(h, w)] + [f"$ {Money(int(c)):.2f}" for c in row]
+            for (h, w), row in zip(sheet.sizes, cents)]
+
+    table = doc.add_table(rows=2, cols=len(sheet.columns) + 1)
+    if "Table Grid" in [style.name for style in doc.styles]:
+        table.style = "Table Grid"
+
+    header_cells = table.rows[0].cells
+    header_cells[0].text = "Size \\ Qty"
+    for cell, (label, _) in zip(header_cells[1:], sheet.columns):
+        cell.text = label
+    for cell in header_cells:
+        brand_runs([(run, 11) for run in cell.paragraphs[0].runs])
+
+    # Format one prototype row through python-docx, then clone its XML for
+    # every size; going through the cell API for each of thousands of cells
+    # is what makes big sheets slow.
+    prototype = table.rows[1]
+    for cell in prototype.cells:
+        cell.text = "-"
+    for cell in prototype.cells[1:]:
+        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    prototype_tr = prototype._tr
+    for values in rows:
+        tr = deepcopy(prototype_tr)
+        for text_element, value in zip(tr.iter(qn("w:t")), values):
+            text_element.text = value
+        table._tbl.append(tr)
+    table._tbl.remove(prototype_tr)
+
+
+def write_docx(path, sheet, pro=False, template=None):
+    """One print type's sheet: regular prices, and professional with pro=True."""
+    doc = Document(template) if template else Document()
+    doc.add_paragraph("")
+    add_header(doc, sheet.print_type, datetime.now().strftime("%Y %B, %d"))
+    doc.add_paragraph("Price per print, by size and number of prints.")
+
+    add_price_table(doc, sheet, sheet.unit, "Regular")
+    if pro:
+        add_price_table(doc, sheet, sheet.pro_unit, "Professional")
+    doc.save(path)
+
+
+def slug(print_type):
+    return re.sub(r"[^A-Za-z0-9]+", "_", print_type).strip("_") or "print"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate price sheets for every print type.")
+    parser.add_argument("-o", "--output-dir", default="price_sheets", help="where to write the sheets")
+    sizes = parser.add_mutually_exclusive_group()
+    sizes.add_argument("--sizes", type=parse_sizes, help="comma-separated HEIGHTxWIDTH list (default: standard sizes)")
+    sizes.add_argument("--size-range", type=float, nargs=3, metavar=("MIN", "MAX", "STEP"),
+                       help="every height <= width pair of sides in this range")
+    parser.add_argument("--quantities", type=lambda s: [int(q) for q in s.split(",")],
+                        help="comma-separated quantities (default: one column per volume tier)")
+    parser.add_argument("--pro", action="store_true", help="add a professional-price table")
+    parser.add_argument("--pdf", action="store_true", help="also convert each DOCX to PDF (needs Word)")
+    parser.add_argument("--no-docx", action="store_true", help="write the CSV only")
+    parser.add_argument("--template", default=None, help=f"DOCX to build on (default: {os.path.basename(DEFAULT_TEMPLATE)} if present)")
+    parser.add_argument("--config", default=None, help="pricing config file (default: $SMS_PRICING_CONFIG or pricing.json)")
+    args = parser.parse_args(argv)
+
+    try:
+        pricing_config.load(args.config)
+    except pricing_config.PricingConfigError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    if args.sizes:
+        size_list = args.sizes
+    elif args.size_range:
+        size_list = size_range(*args.size_range)
+    else:
+        size_list = [(float(h), float(w)) for h, w in STANDARD_SIZES]
+    template = args.template or (DEFAULT_TEMPLATE if os.path.exists(DEFAULT_TEMPLATE) else None)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    sheets = build_sheets(size_list, args.quantities)
+    csv_path = os.path.join(args.output_dir, "price_sheet.csv")
+    write_csv(csv_path, sheets)
+    print(f"✅ {csv_path}: {sum(s.unit.size for s in sheets)} prices")
+
+    if not args.no_docx:
+        for sheet in sheets:
+            docx_path = os.path.join(args.output_dir, f"price_sheet_{slug(sheet.print_type)}.docx")
+            write_docx(docx_path, sheet, args.pro, template)
+            if args.pdf:
+                from docx2pdf import convert
+                convert(docx_path, os.path.splitext(docx_path)[0] + ".pdf")
+            print(f"✅ {docx_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
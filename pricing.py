@@ -0,0 +1,465 @@
+"""
+Tk-free pricing engine for the SMS Pricing Calculator.
+
+All of the per-print-type math that used to live inside calculate_results()
+is here, so quotes can be produced from scripts, batch jobs and the GUI alike.
+"""
+
+import hashlib
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from money import Money, to_cents_array
+
+
+# Bulk pricing data: {print_type: (tier0, tier1, tier2, tier3, tier4) price per sqft}
+bulk_pricing = {} # pricing data removed intentionally
+
+frame_costs = {"Default": 0.00} # pricing data removed intentionally
+
+# {category: (min_united_inches, max_united_inches, fee)}
+gallery_stretching_fees = {} # pricing data removed intentionally
+basic_stretching_fees = {} # pricing data removed intentionally
+
+bracer_bar_cost = 0.00 # pricing data removed intentionally
+upcharge_72 = 0.00 # pricing data removed intentionally
+
+# Upper quantity bound of every tier but the last; anything larger is the last tier
+volume_tier_limits = (0, 0, 0, 0) # actual volume discount quantities removed intentionally
+
+# Optional per-print-type tier limits, overriding volume_tier_limits
+volume_tier_limits_by_type = {}
+
+
+# Money columns rounded to cents by Quote.in_cents() / quote_batch_cents();
+# the totals are then the sum of the rounded parts, not a rounded float sum.
+MONEY_FIELDS = (
+    "canvas_cost", "pro_canvas_cost", "frame_cost", "stretching_fee",
+    "bracer_cost", "upcharge", "volume_discount_amt", "pro_discount_amt",
+)
+
+
+@dataclass(frozen=True)
+class Quote:
+    """Itemized price for one print type at one size and quantity."""
+    print_type: str
+    height: float
+    width: float
+    num_prints: int
+    area_in_sqft: float
+    canvas_cost: float
+    pro_canvas_cost: float
+    frame_cost: float
+    stretching_fee: float
+    bracer_cost: float
+    upcharge: float
+    volume_discount_amt: float
+    pro_discount_amt: float
+    total_cost: float
+    pro_total_cost: float
+    pro: bool = False
+
+    @property
+    def total(self):
+        """Per-print total at the requested (regular or pro) rate."""
+        return self.pro_total_cost if self.pro else self.total_cost
+
+    def in_cents(self):
+        """
+        Money fields as whole cents, each rounded once. total_cost and
+        pro_total_cost are sums of the rounded parts, so a line's breakdown
+        always adds up to its total.
+        """
+        c = {name: Money.from_dollars(getattr(self, name)) for name in MONEY_FIELDS}
+        extras = c["frame_cost"] + c["bracer_cost"] + c["upcharge"] + c["stretching_fee"]
+        c["total_cost"] = c["canvas_cost"] + extras
+        c["pro_total_cost"] = c["pro_canvas_cost"] + extras
+        return c
+
+    @property
+    def is_empty(self):
+        """True when every cost is zero, i.e. nothing worth showing."""
+        return (
+            self.canvas_cost == 0 and self.pro_canvas_cost == 0 and
+            self.frame_cost == 0 and self.stretching_fee == 0 and
+            self.bracer_cost == 0 and self.upcharge == 0 and
+            self.total_cost == 0 and self.pro_total_cost == 0
+        )
+
+
+@dataclass(frozen=True)
+class TierTable:
+    """
+    Quantity tiers for one print type. limits are sorted upper bounds (inclusive)
+    of every tier but the last, so tier = bisect_left(limits, num_prints).
+    """
+    limits: tuple
+    rates: tuple
+    pro_rates: tuple
+    volume_discounts: tuple
+    pro_discounts: tuple
+
+    def tier(self, num_prints):
+        return bisect_left(self.limits, num_prints)
+
+    def lookup(self, num_prints):
+        """
+        Returns (price_per_sqft, pro_price_per_sqft, volume_discount, pro_discount)
+        for the tier num_prints falls into.
+        """
+        i = bisect_left(self.limits, num_prints)
+        return self.rates[i], self.pro_rates[i], self.volume_discounts[i], self.pro_discounts[i]
+
+    def lookup_batch(self, quantities):
+        """Vectorized lookup(); returns the same four values as arrays."""
+        i = np.searchsorted(np.asarray(self.limits), quantities, side="left")
+        return (
+            np.asarray(self.rates, dtype=float)[i],
+            np.asarray(self.pro_rates, dtype=float)[i],
+            np.asarray(self.volume_discounts, dtype=float)[i],
+            np.asarray(self.pro_discounts, dtype=float)[i],
+        )
+
+
+def build_tier_table(prices, limits):
+    """
+    Compiles one bulk_pricing row into a TierTable.
+    Each tier's pro rate is the next tier's rate; the last tier's pro rate is
+    extrapolated as prices[-1] * (prices[-1] / prices[-2]).
+    """
+    prices = tuple(prices)
+    limits = tuple(limits)
+    if len(limits) != len(prices) - 1:
+        raise ValueError(f"{len(prices)} tier prices need {len(prices) - 1} tier limits, got {len(limits)}")
+    if any(a > b for a, b in zip(limits, limits[1:])):
+        raise ValueError(f"Tier limits must be sorted: {limits}")
+
+    rates = prices
+    pro_rates = prices[1:] + ((prices[-1] * (prices[-1] / prices[-2])),)
+    volume_discounts = (0.00,) + tuple((prices[i] - prices[i - 1]) for i in range(1, len(prices)))
+    pro_discounts = tuple((rate - pro_rate) for rate, pro_rate in zip(rates, pro_rates))
+    return TierTable(limits, rates, pro_rates, volume_discounts, pro_discounts)
+
+
+_tier_tables = {}
+
+def tier_table(print_type):
+    """
+    Compiled TierTable for print_type, rebuilt only when its bulk_pricing row
+    or tier limits have been replaced.
+    """
+    prices = bulk_pricing[print_type]
+    limits = volume_tier_limits_by_type.get(print_type, volume_tier_limits)
+    cached = _tier_tables.get(print_type)
+    if cached is not None and cached[0] is prices and cached[1] is limits:
+        return cached[2]
+    table = build_tier_table(prices, limits)
+    _tier_tables[print_type] = (prices, limits, table)
+    return table
+
+
+# Stretching-fee ranges are in whole united inches, so (0, 24) followed by
+# (25, 36) is contiguous; anything wider than this between ranges is a gap.
+STRETCH_RANGE_STEP = 1
+
+
+class StretchFeeIndex:
+    """
+    Sorted, validated interval index over one stretching-fee table.
+    lookup() is a binary search over the range starts instead of a dict scan.
+    """
+
+    def __init__(self, stretching_fees, name="stretching_fees"):
+        ranges = sorted(stretching_fees.values(), key=lambda r: (r[0], r[1]))
+        for (min_a, max_a, _), (min_b, max_b, _) in zip(ranges, ranges[1:]):
+            if min_b <= max_a:
+                raise ValueError(f"{name}: ranges {min_a}-{max_a} and {min_b}-{max_b} overlap")
+            if min_b - max_a > STRETCH_RANGE_STEP:
+                raise ValueError(f"{name}: gap between {max_a} and {min_b} united inches")
+        for min_range, max_range, _ in ranges:
+            if min_range > max_range:
+                raise ValueError(f"{name}: range {min_range}-{max_range} is backwards")
+
+        self.starts = tuple(r[0] for r in ranges)
+        self.ends = tuple(r[1] for r in ranges)
+        self.fees = tuple(r[2] for r in ranges)
+        self._starts = np.asarray(self.starts, dtype=float)
+        self._ends = np.asarray(self.ends, dtype=float)
+        self._fees = np.asarray(self.fees, dtype=float)
+
+    def lookup(self, united_inches):
+        """Fee for height + width, or 0 if no range covers it."""
+        i = bisect_right(self.starts, united_inches) - 1
+        if i >= 0 and united_inches <= self.ends[i]:
+            return self.fees[i]
+        return 0
+
+    def lookup_batch(self, united_inches):
+        """Vectorized lookup() over an array of united inches."""
+        united_inches = np.asarray(united_inches, dtype=float)
+        if not self.starts:
+            return np.zeros(united_inches.shape)
+        i = np.searchsorted(self._starts, united_inches, side="right") - 1
+        safe = np.clip(i, 0, None)
+        covered = (i >= 0) & (united_inches <= self._ends[safe])
+        return np.where(covered, self._fees[safe], 0.0)
+
+
+# Bumped every time the tables are compiled; part of every quote-cache key
+table_version = 0
+
+_no_stretching = StretchFeeIndex({})
+gallery_stretch_index = _no_stretching
+basic_stretch_index = _no_stretching
+
+
+def compile_tables():
+    """
+    Compiles the module-level pricing tables into lookup structures.
+    Runs at import; call it again after editing the tables in place.
+    Bumps table_version, which invalidates every cached quote.
+    """
+    global gallery_stretch_index, basic_stretch_index, table_version
+    gallery_stretch_index = StretchFeeIndex(gallery_stretching_fees, "gallery_stretching_fees")
+    basic_stretch_index = StretchFeeIndex(basic_stretching_fees, "basic_stretching_fees")
+    _tier_tables.clear()
+    table_version += 1
+    _cached_quote.cache_clear()
+
+
+# Module globals a pricing config (see pricing_config.py) can replace
+TABLE_NAMES = (
+    "bulk_pricing", "frame_costs", "gallery_stretching_fees", "basic_stretching_fees",
+    "bracer_bar_cost", "upcharge_72", "volume_tier_limits", "volume_tier_limits_by_type",
+)
+
+
+def install_tables(tables, gallery_index, basic_index, tier_tables):
+    """
+    Swaps in tables that were already validated and compiled elsewhere
+    (tables maps every name in TABLE_NAMES to its new value). Nothing here can
+    fail, and there is no I/O or compiling in between, so a quote made on the
+    same thread sees either all of the old tables or all of the new ones.
+    """
+    global bulk_pricing, frame_costs, gallery_stretching_fees, basic_stretching_fees
+    global bracer_bar_cost, upcharge_72, volume_tier_limits, volume_tier_limits_by_type
+    global gallery_stretch_index, basic_stretch_index, _tier_tables, table_version
+    bulk_pricing = tables["bulk_pricing"]
+    frame_costs = tables["frame_costs"]
+    gallery_stretching_fees = tables["gallery_stretching_fees"]
+    basic_stretching_fees = tables["basic_stretching_fees"]
+    bracer_bar_cost = tables["bracer_bar_cost"]
+    upcharge_72 = tables["upcharge_72"]
+    volume_tier_limits = tables["volume_tier_limits"]
+    volume_tier_limits_by_type = tables["volume_tier_limits_by_type"]
+    gallery_stretch_index = gallery_index
+    basic_stretch_index = basic_index
+    _tier_tables = tier_tables
+    table_version += 1
+    _cached_quote.cache_clear()
+
+
+def tables_fingerprint():
+    """
+    Content hash of every pricing table. Unlike table_version it survives a
+    restart, so files derived from the tables (e.g. the price grid) can tell
+    whether they are stale.
+    """
+    tables = (
+        sorted(bulk_pricing.items()),
+        sorted(frame_costs.items()),
+        sorted(gallery_stretching_fees.items()),
+        sorted(basic_stretching_fees.items()),
+        bracer_bar_cost,
+        upcharge_72,
+        tuple(volume_tier_limits),
+        sorted((k, tuple(v)) for k, v in volume_tier_limits_by_type.items()),
+    )
+    return hashlib.sha256(repr(tables).encode("utf-8")).hexdigest()
+
+
+def stretch_index_for(print_type):
+    """Returns the stretching-fee index that applies to print_type."""
+    if print_type.startswith("Canvas with T"):
+        return gallery_stretch_index
+    elif print_type == "Canvas with Basic Stretch":
+        return basic_stretch_index
+    return _no_stretching
+
+
+def stretching_fee_for(print_type, height, width):
+    return stretch_index_for(print_type).lookup(height + width)
+
+
+def quote(print_type, height, width, num_prints, pro=False):
+    """
+    Prices a single print type.
+    Raises KeyError if print_type is not in bulk_pricing.
+    """
+    price_per_sqft, pro_price_per_sqft, volume_discount, pro_discount = tier_table(print_type).lookup(num_prints)
+
+    gallery_wrap_adjustment = 3 if print_type.startswith("Canvas with T") else 0
+    adjusted_height = height + gallery_wrap_adjustment
+    adjusted_width = width + gallery_wrap_adjustment
+    area_in_sqft = (adjusted_height * adjusted_width) / 144
+    perimeter_in_feet = (2 * height + 2 * width) / 12
+
+    if print_type.startswith("Canvas with"):
+        frame_cost = perimeter_in_feet * frame_costs.get(print_type, frame_costs["Default"])
+        bracer_cost = 0
+        if max(height, width) >= 40:
+            bracer_cost = (min(height, width) / 12) * bracer_bar_cost
+        if max(height, width) >= 60:
+            bracer_cost *= 2
+        upcharge = upcharge_72 if max(height, width) >= 72 else 0
+    else:
+        frame_cost = 0
+        bracer_cost = 0
+        upcharge = 0
+
+    stretching_fee = stretching_fee_for(print_type, height, width)
+
+    canvas_cost = area_in_sqft * price_per_sqft
+    pro_canvas_cost = area_in_sqft * pro_price_per_sqft
+    # Per-print amount first, then quantity: price_grid stores the per-print part
+    volume_discount_amt = num_prints * (area_in_sqft * volume_discount)
+    pro_discount_amt = num_prints * (area_in_sqft * pro_discount)
+    total_cost = canvas_cost + frame_cost + bracer_cost + upcharge + stretching_fee
+    pro_total_cost = pro_canvas_cost + frame_cost + bracer_cost + upcharge + stretching_fee
+
+    return Quote(
+        print_type=print_type,
+        height=height,
+        width=width,
+        num_prints=num_prints,
+        area_in_sqft=area_in_sqft,
+        canvas_cost=canvas_cost,
+        pro_canvas_cost=pro_canvas_cost,
+        frame_cost=frame_cost,
+        stretching_fee=stretching_fee,
+        bracer_cost=bracer_cost,
+        upcharge=upcharge,
+        volume_discount_amt=volume_discount_amt,
+        pro_discount_amt=pro_discount_amt,
+        total_cost=total_cost,
+        pro_total_cost=pro_total_cost,
+        pro=pro,
+    )
+
+
+QUOTE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=QUOTE_CACHE_SIZE)
+def _cached_quote(print_type, height, width, num_prints, pro, version):
+    return quote(print_type, height, width, num_prints, pro=pro)
+
+
+def cached_quote(print_type, height, width, num_prints, pro=False):
+    """
+    quote() behind a bounded LRU cache. Inputs are normalized (so 24 and 24.0
+    share an entry) and the key includes table_version, so entries from before
+    the last compile_tables() are never served.
+    """
+    return _cached_quote(print_type, float(height), float(width), int(num_prints), bool(pro), table_version)
+
+
+def quote_cache_info():
+    """Hit/miss/size counters for the quote cache (a functools CacheInfo)."""
+    return _cached_quote.cache_info()
+
+
+def clear_quote_cache():
+    _cached_quote.cache_clear()
+
+
+def quote_all(height, width, num_prints, pro=False):
+    """Quotes every print type in bulk_pricing, in table order, through the quote cache."""
+    return [cached_quote(print_type, height, width, num_prints, pro=pro) for print_type in bulk_pricing]
+
+
+# Columns returned per print type by quote_batch()
+BATCH_COLUMNS = (
+    "height", "width", "num_prints", "area_in_sqft",
+    "canvas_cost", "pro_canvas_cost", "frame_cost", "stretching_fee",
+    "bracer_cost", "upcharge", "volume_discount_amt", "pro_discount_amt",
+    "total_cost", "pro_total_cost",
+)
+
+
+def quote_batch(heights, widths, quantities, print_types=None):
+    """
+    Prices every print type for many size/quantity combinations in one pass.
+
+    heights, widths and quantities are broadcast against each other. Returns
+    {print_type: {column: ndarray}} with the columns in BATCH_COLUMNS, each
+    matching what quote() gives for the same inputs.
+    """
+    heights, widths, quantities = np.broadcast_arrays(
+        np.asarray(heights, dtype=float),
+        np.asarray(widths, dtype=float),
+        np.asarray(quantities, dtype=np.int64),
+    )
+
+    longest = np.maximum(heights, widths)
+    shortest = np.minimum(heights, widths)
+    perimeter_in_feet = (2 * heights + 2 * widths) / 12
+    zeros = np.zeros(heights.shape)
+
+    results = {}
+    for print_type in (bulk_pricing if print_types is None else print_types):
+        price_per_sqft, pro_price_per_sqft, volume_discount, pro_discount = \
+            tier_table(print_type).lookup_batch(quantities)
+
+        gallery_wrap_adjustment = 3 if print_type.startswith("Canvas with T") else 0
+        area_in_sqft = ((heights + gallery_wrap_adjustment) * (widths + gallery_wrap_adjustment)) / 144
+
+        if print_type.startswith("Canvas with"):
+            frame_cost = perimeter_in_feet * frame_costs.get(print_type, frame_costs["Default"])
+            bracer_cost = np.where(longest >= 40, (shortest / 12) * bracer_bar_cost, 0.0)
+            bracer_cost = np.where(longest >= 60, bracer_cost * 2, bracer_cost)
+            upcharge = np.where(longest >= 72, float(upcharge_72), 0.0)
+        else:
+            frame_cost = bracer_cost = upcharge = zeros
+
+        stretching_fee = stretch_index_for(print_type).lookup_batch(heights + widths)
+
+        canvas_cost = area_in_sqft * price_per_sqft
+        pro_canvas_cost = area_in_sqft * pro_price_per_sqft
+        results[print_type] = {
+            "height": heights,
+            "width": widths,
+            "num_prints": quantities,
+            "area_in_sqft": area_in_sqft,
+            "canvas_cost": canvas_cost,
+            "pro_canvas_cost": pro_canvas_cost,
+            "frame_cost": frame_cost,
+            "stretching_fee": stretching_fee,
+            "bracer_cost": bracer_cost,
+            "upcharge": upcharge,
+            "volume_discount_amt": quantities * (area_in_sqft * volume_discount),
+            "pro_discount_amt": quantities * (area_in_sqft * pro_discount),
+            "total_cost": canvas_cost + frame_cost + bracer_cost + upcharge + stretching_fee,
+            "pro_total_cost": pro_canvas_cost + frame_cost + bracer_cost + upcharge + stretching_fee,
+        }
+    return results
+
+
+def quote_batch_cents(heights, widths, quantities, print_types=None):
+    """
+    quote_batch() with every money column as int64 cents, rounded the same
+    way as Quote.in_cents() (totals are sums of the rounded parts).
+    """
+    results = quote_batch(heights, widths, quantities, print_types)
+    for columns in results.values():
+        for name in MONEY_FIELDS:
+            columns[name] = to_cents_array(columns[name])
+        extras = columns["frame_cost"] + columns["bracer_cost"] + columns["upcharge"] + columns["stretching_fee"]
+        columns["total_cost"] = columns["canvas_cost"] + extras
+        columns["pro_total_cost"] = columns["pro_canvas_cost"] + extras
+    return results
+
+
+compile_tables()
@@ -0,0 +1,247 @@
+"""
+Prices loaded from an external JSON file instead of source literals.
+
+    {
+      "bulk_pricing": {"Canvas with Basic Stretch": [tier0, tier1, tier2, tier3, tier4]},
+      "volume_tier_limits": [limit0, limit1, limit2, limit3],
+      "frame_costs": {"Default": price_per_foot},
+      "gallery_stretching_fees": {"Small": [min_united_inches, max_united_inches, fee]},
+      "bracer_bar_cost": price_per_foot,
+      "addons": {"capture_prices": {"Small": price, "Medium": price, "Large": price}}
+    }
+
+Any table left out keeps the built-in value from pricing.py / addons.py (see
+pricing.example.json for every key). A file is validated and compiled into
+lookup tables once, in full, before anything is swapped in; a bad edit is
+reported and the previous prices stay live. ConfigWatcher polls the file so
+the GUI picks up edits without a restart. Every swap bumps
+pricing.table_version, which invalidates the quote cache and the price grid.
+"""
+
+import json
+import logging
+import os
+
+import addons
+import pricing
+
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CONFIG_PATH = os.path.join(CONFIG_DIR, "pricing.json")
+
+ADDON_NAMES = (
+    "capture_prices", "specialty_capture_price", "color_match_prices", "monitor_match_price",
+    "complex_wrap_price", "additional_round_price", "flashdrive_price", "computer_time_price",
+)
+
+# Built-in values, so a table removed from the file goes back to its default
+# rather than keeping whatever the previous file said
+_DEFAULT_TABLES = {name: getattr(pricing, name) for name in pricing.TABLE_NAMES}
+_DEFAULT_ADDONS = {name: getattr(addons, name) for name in ADDON_NAMES}
+
+
+class PricingConfigError(ValueError):
+    """The pricing config file can't be read or doesn't validate."""
+
+
+def config_path(path=None):
+    """path, else $SMS_PRICING_CONFIG, else pricing.json next to this module."""
+    return path or os.getenv("SMS_PRICING_CONFIG") or DEFAULT_CONFIG_PATH
+
+
+def _price(value, where):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise PricingConfigError(f"{where}: expected a price, got {value!r}")
+    if value < 0:
+        raise PricingConfigError(f"{where}: price can't be negative ({value})")
+    return float(value)
+
+
+def _prices(value, where):
+    if not isinstance(value, dict):
+        raise PricingConfigError(f"{where}: expected an object of prices")
+    return {str(k): _price(v, f"{where}.{k}") for k, v in value.items()}
+
+
+def _limits(value, where):
+    if not isinstance(value, list) or not all(isinstance(v, int) and not isinstance(v, bool) for v in value):
+        raise PricingConfigError(f"{where}: expected a list of whole quantities")
+    return tuple(value)
+
+
+def _stretching_fees(value, where):
+    if not isinstance(value, dict):
+        raise PricingConfigError(f"{where}: expected an object of [min, max, fee] ranges")
+    fees = {}
+    for category, row in value.items():
+        if not isinstance(row, list) or len(row) != 3:
+            raise PricingConfigError(f"{where}.{category}: expected [min_united_inches, max_united_inches, fee]")
+        fees[category] = (
+            _price(row[0], f"{where}.{category}[0]"),
+            _price(row[1], f"{where}.{category}[1]"),
+            _price(row[2], f"{where}.{category}[2]"),
+        )
+    return fees
+
+
+class CompiledPricing:
+    """A validated config, compiled and ready for apply_config()."""
+
+    def __init__(self, path, tables, addon_prices, gallery_index, basic_index, tier_tables):
+        self.path = path
+        self.tables = tables
+        self.addon_prices = addon_prices
+        self.gallery_index = gallery_index
+        self.basic_index = basic_index
+        self.tier_tables = tier_tables
+
+
+def compile_config(raw, path="pricing config"):
+    """
+    Validates a parsed config and compiles it into tier tables and stretching
+    fee indexes. Raises PricingConfigError; touches no live state.
+    """
+    if not isinstance(raw, dict):
+        raise PricingConfigError(f"{path}: top level must be an object")
+    unknown = set(raw) - set(pricing.TABLE_NAMES) - {"addons"}
+    if unknown:
+        raise PricingConfigError(f"{path}: unknown key(s) {', '.join(sorted(unknown))}")
+    raw_addons = raw.get("addons", {})
+    if not isinstance(raw_addons, dict):
+        raise PricingConfigError(f"{path}: addons must be an object")
+    unknown = set(raw_addons) - set(ADDON_NAMES)
+    if unknown:
+        raise PricingConfigError(f"{path}: unknown add-on(s) {', '.join(sorted(unknown))}")
+
+    tables = dict(_DEFAULT_TABLES)
+    if "bulk_pricing" in raw:
+        if not isinstance(raw["bulk_pricing"], dict):
+            raise PricingConfigError(f"{path}: bulk_pricing must be an object of price lists")
+        tables["bulk_pricing"] = {}
+        for print_type, row in raw["bulk_pricing"].items():
+            if not isinstance(row, list) or len(row) < 2:
+                raise PricingConfigError(f"{path}: bulk_pricing.{print_type} needs at least two tier prices")
+            tables["bulk_pricing"][print_type] = tuple(
+                _price(v, f"bulk_pricing.{print_type}[{i}]") for i, v in enumerate(row)
+            )
+    if "frame_costs" in raw:
+        tables["frame_costs"] = _prices(raw["frame_costs"], "frame_costs")
+        if "Default" not in tables["frame_costs"]:
+            raise PricingConfigError(f"{path}: frame_costs must include \"Default\"")
+    for name in ("gallery_stretching_fees", "basic_stretching_fees"):
+        if name in raw:
+            tables[name] = _stretching_fees(raw[name], name)
+    for name in ("bracer_bar_cost", "upcharge_72"):
+        if name in raw:
+            tables[name] = _price(raw[name], name)
+    if "volume_tier_limits" in raw:
+        tables["volume_tier_limits"] = _limits(raw["volume_tier_limits"], "volume_tier_limits")
+    if "volume_tier_limits_by_type" in raw:
+        by_type = raw["volume_tier_limits_by_type"]
+        if not isinstance(by_type, dict):
+            raise PricingConfigError(f"{path}: volume_tier_limits_by_type must be an object")
+        tables["volume_tier_limits_by_type"] = {
+            k: _limits(v, f"volume_tier_limits_by_type.{k}") for k, v in by_type.items()
+        }
+
+    addon_prices = dict(_DEFAULT_ADDONS)
+    for name, value in raw_addons.items():
+        if name in ("capture_prices", "color_match_prices"):
+            prices = _prices(value, f"addons.{name}")
+            missing = set(_DEFAULT_ADDONS[name]) - set(prices)
+            if missing:
+                raise PricingConfigError(f"{path}: addons.{name} is missing {', '.join(sorted(missing))}")
+            addon_prices[name] = prices
+        else:
+            addon_prices[name] = _price(value, f"addons.{name}")
+
+    try:
+        gallery_index = pricing.StretchFeeIndex(tables["gallery_stretching_fees"], "gallery_stretching_fees")
+        basic_index = pricing.StretchFeeIndex(tables["basic_stretching_fees"], "basic_stretching_fees")
+        tier_tables = {}
+        for print_type, prices in tables["bulk_pricing"].items():
+            limits = tables["volume_tier_limits_by_type"].get(print_type, tables["volume_tier_limits"])
+            try:
+                tier_tables[print_type] = (prices, limits, pricing.build_tier_table(prices, limits))
+            except ZeroDivisionError:
+                raise ValueError(f"bulk_pricing.{print_type}: second-to-last tier price can't be 0")
+    except ValueError as e:
+        raise PricingConfigError(f"{path}: {e}") from e
+
+    return CompiledPricing(path, tables, addon_prices, gallery_index, basic_index, tier_tables)
+
+
+def read_config(path=None):
+    """Reads, validates and compiles a config file. Raises PricingConfigError."""
+    path = config_path(path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, ValueError) as e:
+        raise PricingConfigError(f"{path}: {e}") from e
+    return compile_config(raw, path)
+
+
+def apply_config(compiled):
+    """Makes a compiled config the live pricing (bumps pricing.table_version)."""
+    for name, value in compiled.addon_prices.items():
+        setattr(addons, name, value)
+    pricing.install_tables(compiled.tables, compiled.gallery_index, compiled.basic_index, compiled.tier_tables)
+
+
+def load(path=None):
+    """
+    Startup entry point: applies the config file if there is one.
+    A missing default file is fine (built-in tables stay); a missing file that
+    was asked for explicitly, or an invalid one, raises PricingConfigError.
+    """
+    resolved = config_path(path)
+    if not os.path.exists(resolved) and resolved == DEFAULT_CONFIG_PATH:
+        return None
+    compiled = read_config(resolved)
+    apply_config(compiled)
+    return compiled
+
+
+class ConfigWatcher:
+    """
+    Polls the config file's mtime/size. Call poll() periodically from the
+    thread that quotes (the GUI does it from Tk's event loop); it never blocks
+    on anything but reading the file, and swaps only fully compiled tables.
+    A rejected edit is logged and kept in last_error until a good one loads.
+    """
+
+    def __init__(self, path=None, on_reload=None):
+        self.path = config_path(path)
+        self.on_reload = on_reload
+        self.last_error = None
+        self._stamp = self._stat()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def poll(self):
+        """Reloads if the file changed. Returns True if new prices went live."""
+        stamp = self._stat()
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        if stamp is None:
+            return False  # deleted (or mid-save); keep the current prices
+
+        try:
+            compiled = read_config(self.path)
+        except PricingConfigError as e:
+            self.last_error = e
+            logging.warning("Pricing config not reloaded, keeping current prices: %s", e)
+            return False
+
+        apply_config(compiled)
+        self.last_error = None
+        if self.on_reload:
+            self.on_reload(compiled)
+        return True
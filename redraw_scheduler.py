@@ -0,0 +1,70 @@
+"""Coalesced pane redraws: request() marks a pane dirty, one idle pass redraws each once."""
+
+
+class RedrawScheduler:
+    def __init__(self, order=()):
+        self._order = list(order)  # drawing order; a pane can dirty panes after it
+        self._panes = {}           # name -> redraw function
+        self._dirty = set()
+        self._call_idle = None
+        self._scheduled = False    # a flush is queued or running
+        self.requested = 0         # requests made
+        self.drawn = 0             # redraws actually run
+        self.avoided = 0           # requests folded into a redraw already pending
+
+    def register(self, name, redraw):
+        self._panes[name] = redraw
+        if name not in self._order:
+            self._order.append(name)
+
+    def attach(self, call_idle):
+        """call_idle(fn) runs fn once the event loop is idle, e.g. Tk's after_idle."""
+        self._call_idle = call_idle
+
+    def request(self, *names):
+        """Marks panes dirty; until attach() is called they are redrawn right away."""
+        for name in names:
+            if name not in self._panes:
+                raise KeyError(f"Unknown pane {name!r}")
+            self.requested += 1
+            if name in self._dirty:
+                self.avoided += 1
+            else:
+                self._dirty.add(name)
+        if not self._scheduled:
+            self._schedule()
+
+    def pending(self, name):
+        return name in self._dirty
+
+    def now(self, name):
+        """Redraws name immediately (dropping any pending request) and returns its result."""
+        self._dirty.discard(name)
+        self.drawn += 1
+        return self._panes[name]()
+
+    def flush(self):
+        """Redraws each dirty pane once, in order."""
+        # Requests made while drawing join this pass instead of queueing another
+        self._scheduled = True
+        try:
+            for name in self._order:
+                if name in self._dirty:
+                    self._dirty.discard(name)
+                    self.drawn += 1
+                    self._panes[name]()
+        finally:
+            self._scheduled = False
+            # Only left over if a pane dirtied one drawn earlier in the pass
+            if self._dirty:
+                self._schedule()
+
+    def _schedule(self):
+        if self._call_idle is None:
+            self.flush()
+        else:
+            self._scheduled = True
+            self._call_idle(self.flush)
+
+    def stats(self):
+        return {"requested": self.requested, "drawn": self.drawn, "avoided": self.avoided}
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""
+Reverse quoting: the largest print of each medium that fits a budget.
+
+    python reverse_quote.py 500 --aspect 16 20 --quantity 2 --pro
+
+The aspect ratio comes from the original artwork (original_height x
+original_width). Sizes are searched by long side in SIZE_STEP increments, with
+both sides snapped down to the step, so every answer is a size the shop can
+actually cut. Each medium takes a binary search over the same quote() the
+Calculate form uses (frame, bracer, 72" upcharge and stretching-fee steps
+included), and the budget is compared against the rounded-to-cents total for
+the whole quantity, exactly as it would be invoiced.
+"""
+
+import argparse
+import math
+import sys
+from dataclasses import dataclass
+
+import pricing
+import pricing_config
+from money import Money
+
+
+# Whole inches: stretching-fee ranges are whole united inches, so fractional
+# sizes can land between two ranges and price lower than a smaller print
+SIZE_STEP = 1       # inches
+MAX_LONG_SIDE = 96  # inches; matches the price grid's largest standard size
+
+
+@dataclass(frozen=True)
+class Fit:
+    print_type: str
+    height: float
+    width: float
+    num_prints: int
+    quote: pricing.Quote
+    total: Money  # whole order: per-print total x num_prints
+
+
+def size_for(steps, aspect_height, aspect_width, step=SIZE_STEP):
+    """(height, width) whose long side is steps * step, keeping the aspect ratio."""
+    long_side = steps * step
+    scale = long_side / max(aspect_height, aspect_width)
+    # Snap down to the step; the epsilon keeps 11.999999 from flooring to 11
+    height = math.floor(aspect_height * scale / step + 1e-9) * step
+    width = math.floor(aspect_width * scale / step + 1e-9) * step
+    return height, width
+
+
+def order_total(q, num_prints, pro=False):
+    c = q.in_cents()
+    return c["pro_total_cost" if pro else "total_cost"] * num_prints
+
+
+def largest_fit(print_type, budget, aspect_height, aspect_width, num_prints=1, pro=False,
+                step=SIZE_STEP, max_long_side=MAX_LONG_SIDE):
+    """
+    Largest size of print_type whose total for num_prints is within budget,
+    or None if even the smallest step doesn't fit.
+
+    Binary search relies on price never dropping as a print grows, which holds
+    as long as every fee step (bracer, upcharge, stretching ranges) only goes
+    up; the answer returned always fits the budget either way.
+    """
+    if aspect_height <= 0 or aspect_width <= 0:
+        raise ValueError("Aspect ratio needs a positive height and width.")
+    budget = Money.from_dollars(budget)
+
+    def fit_at(steps):
+        height, width = size_for(steps, aspect_height, aspect_width, step)
+        if height <= 0 or width <= 0:
+            return None
+        q = pricing.quote(print_type, height, width, num_prints, pro=pro)
+        total = order_total(q, num_prints, pro)
+        return Fit(print_type, height, width, num_prints, q, total) if total <= budget else None
+
+    # Smallest long side at which the short side is at least one step
+    lo = math.ceil(max(aspect_height, aspect_width) / min(aspect_height, aspect_width) - 1e-9)
+    hi = int(max_long_side / step)
+    if lo > hi:
+        return None
+
+    best = fit_at(lo)
+    if best is None:
+        return None
+    top = fit_at(hi)
+    if top is not None:
+        return top
+
+    # Invariant: lo fits, hi doesn't
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        fit = fit_at(mid)
+        if fit is not None:
+            lo, best = mid, fit
+        else:
+            hi = mid
+    return best
+
+
+def largest_fits(budget, aspect_height, aspect_width, num_prints=1, pro=False,
+                 step=SIZE_STEP, max_long_side=MAX_LONG_SIDE):
+    """{print_type: Fit or None} for every print type in bulk_pricing, in table order."""
+    return {
+        print_type: largest_fit(print_type, budget, aspect_height, aspect_width, num_prints, pro,
+                                step, max_long_side)
+        for print_type in pricing.bulk_pricing
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Largest print per medium that fits a budget.")
+    parser.add_argument("budget", type=float, help="budget in dollars for the whole quantity")
+    parser.add_argument("--aspect", type=float, nargs=2, metavar=("HEIGHT", "WIDTH"), default=(1, 1),
+                        help="original artwork height and width (default: square)")
+    parser.add_argument("--quantity", type=int, default=1, help="number of prints")
+    parser.add_argument("--pro", action="store_true", help="use professional pricing")
+    parser.add_argument("--step", type=float, default=SIZE_STEP, help="size increment in inches")
+    parser.add_argument("--config", default=None, help="pricing config file (default: $SMS_PRICING_CONFIG or pricing.json)")
+    args = parser.parse_args(argv)
+
+    try:
+        pricing_config.load(args.config)
+        fits = largest_fits(args.budget, *args.aspect, num_prints=args.quantity, pro=args.pro, step=args.step)
+    except (pricing_config.PricingConfigError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    for print_type, fit in fits.items():
+        if fit is None:
+            print(f"{print_type}: nothing fits")
+        else:
+            print(f"{print_type}: {fit.height:g}\" x {fit.width:g}\" — $ {fit.total:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())